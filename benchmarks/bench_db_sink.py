@@ -0,0 +1,83 @@
+"""Throughput benchmark for the bulk database output sink.
+
+Writes batches of Stocktwits-shaped messages through ``DatabaseSink`` and
+reports rows per second. A second pass rewrites every row so the upsert path
+(``ON CONFLICT ... DO UPDATE``) is measured too. Exits non-zero if either pass
+is slower than ``--min-rows-per-sec``.
+
+Runs against a temporary SQLite file by default; pass ``--url`` to target a
+local PostgreSQL instead (requires psycopg or psycopg2).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_db_sink.py --rows 50000 --batch-size 1000
+    PYTHONPATH=src python benchmarks/bench_db_sink.py --url postgresql://localhost/bench
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from app.output.db_sink import DatabaseSink
+from app.records import Article, SentimentMessage
+
+
+def build_messages(count: int, revision: int = 0) -> list[SentimentMessage]:
+    """Return ``count`` distinct messages; ``revision`` changes their content."""
+    return [
+        SentimentMessage(
+            symbol=f"SYM{i % 500}",
+            source="Stocktwits",
+            platform="stocktwits",
+            article=Article(
+                timestamp=f"2025-08-14T13:{i % 60:02d}:{i % 59:02d}Z",
+                url=f"https://stocktwits.com/message/{i}",
+                username=f"trader{i}",
+                content=f"$SYM{i % 500} looking strong into earnings #{i} r{revision}",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def run_pass(sink: DatabaseSink, messages: list[SentimentMessage], batch_size: int) -> float:
+    """Write every message in batches and return rows per second."""
+    start = time.perf_counter()
+    for offset in range(0, len(messages), batch_size):
+        sink.write_batch(messages[offset : offset + batch_size])
+    return len(messages) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    """Run the benchmark and print rows per second for inserts and upserts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="Rows per pass")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per write")
+    parser.add_argument("--url", default="", help="Database URL (default: temp SQLite)")
+    parser.add_argument(
+        "--min-rows-per-sec", type=float, default=10000.0, help="Fail below this rate"
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATABASE_TABLE", "bench_sentiment_messages")
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        sink = DatabaseSink(url=url)
+        try:
+            inserted = run_pass(sink, build_messages(args.rows), args.batch_size)
+            upserted = run_pass(sink, build_messages(args.rows, revision=1), args.batch_size)
+        finally:
+            sink.close()
+
+    print(f"Database: {url.split(':', 1)[0]}  rows: {args.rows}  batch: {args.batch_size}")
+    print(f"insert  {inserted:10.0f} rows/s")
+    print(f"upsert  {upserted:10.0f} rows/s")
+    if min(inserted, upserted) < args.min_rows_per_sec:
+        print(f"FAIL: below {args.min_rows_per_sec:.0f} rows/s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Benchmark suite for the per-item hot paths, with saved baselines.
+
+Times, against saved fixtures in ``benchmarks/fixtures``:
+
+- ``parse.<source>``: each poller's fetch function with the HTTP call
+  replaced by the fixture (HTML parsing, feedparser handling, JSON decoding).
+- ``build.<source>``: the poller's ``build_payload`` over the parsed items.
+- ``validate.schema`` / ``validate.batch``: ``validate_message_schema`` on
+  wire dicts and ``validate_batch`` on records.
+- ``serialize.<source>``: the configured serializer over a built batch.
+- ``publish.memory``: ``publish_to_queue`` into the in-memory broker.
+
+One operation is a whole fixture batch. Sources whose dependencies (bs4,
+feedparser) are missing are skipped. ``run --output`` stores the results as
+JSON; ``compare`` exits non-zero when any median is slower than the baseline
+by more than ``--threshold``. Baselines are machine-specific, so compare
+results from the same host.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_hot_paths.py run --output baseline.json
+    PYTHONPATH=src python benchmarks/bench_hot_paths.py run --output current.json
+    python benchmarks/bench_hot_paths.py compare baseline.json current.json --threshold 0.15
+    python benchmarks/bench_hot_paths.py fixtures   # regenerate fixtures
+"""
+
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, "fixtures")
+SYMBOL = "AAPL"
+
+# source -> (fixture file, poller module, fetch function, patched HTTP helper)
+SOURCES: dict[str, tuple[str, str, str, str]] = {
+    "finviz": ("finviz.html", "app.pollers.poller_finviz", "fetch_finviz_news", "http_get"),
+    "yahoo": ("yahoo.html", "app.pollers.poller_yahoo_finance", "fetch_yahoo_news", "http_get"),
+    "stocktwits": (
+        "stocktwits.json",
+        "app.pollers.poller_stocktwits",
+        "fetch_stocktwits_messages",
+        "http_get",
+    ),
+    "newsapi": ("newsapi.json", "app.pollers.poller_newsapi", "fetch_newsapi_articles", "http_get"),
+    "benzinga": ("benzinga.json", "app.pollers.poller_benzinga", "fetch_benzinga_news", "http_get"),
+    "google_news": (
+        "google_news.xml",
+        "app.pollers.poller_google_news",
+        "fetch_google_news",
+        "http_get_parsed",
+    ),
+    "seeking_alpha": (
+        "seeking_alpha.xml",
+        "app.pollers.poller_seeking_alpha",
+        "fetch_seeking_alpha_feed",
+        "http_get_parsed",
+    ),
+}
+
+# Fixture sizes, roughly what each upstream returns per symbol.
+FIXTURE_ITEMS = {
+    "finviz": 100,
+    "yahoo": 40,
+    "stocktwits": 30,
+    "newsapi": 10,
+    "benzinga": 10,
+    "google_news": 100,
+    "seeking_alpha": 30,
+}
+
+
+def write_fixtures() -> None:
+    """Regenerate the fixtures from the synthetic upstream's renderers."""
+    sys.path.insert(0, BENCH_DIR)
+    import fake_upstream
+
+    renderers = {host: route[1] for host, route in fake_upstream.ROUTES.items()}
+    hosts = {
+        "finviz": "finviz.com",
+        "yahoo": "finance.yahoo.com",
+        "stocktwits": "api.stocktwits.com",
+        "newsapi": "newsapi.org",
+        "benzinga": "api.benzinga.com",
+        "google_news": "news.google.com",
+        "seeking_alpha": "seekingalpha.com",
+    }
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    for source, (filename, *_) in SOURCES.items():
+        stream = fake_upstream.ItemStream(fake_upstream.UpstreamConfig(items=FIXTURE_ITEMS[source]))
+        _, body = renderers[hosts[source]](stream.next_window(hosts[source], SYMBOL))
+        with open(os.path.join(FIXTURE_DIR, filename), "wb") as f:
+            f.write(body)
+        print(f"Wrote {filename} ({len(body)} bytes)")
+
+
+def _fixture_response(filename: str) -> Any:
+    """Return a 200 response whose body is the fixture."""
+    from app.utils.response_cache import CachedResponse
+
+    with open(os.path.join(FIXTURE_DIR, filename), "rb") as f:
+        body = f.read()
+    return CachedResponse(200, {}, f"https://fixture/{filename}", body, 0.0)
+
+
+def build_cases(pattern: str) -> dict[str, tuple[Callable[[], Any], int]]:
+    """Return benchmark name -> (operation, items per operation)."""
+    from app.message_queue.queue_sender import publish_to_queue
+    from app.message_queue.serializers import get_serializer
+    from app.records import to_wire
+    from app.utils.batch_validation import validate_batch
+    from app.utils.validate_data import validate_message_schema
+
+    cases: dict[str, tuple[Callable[[], Any], int]] = {}
+    batches: list[Any] = []
+    serializer = get_serializer()
+
+    for source, (filename, module_name, fetch_name, helper) in SOURCES.items():
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"Skipping {source}: {e}")
+            continue
+
+        response = _fixture_response(filename)
+        if helper == "http_get":
+            module.http_get = lambda *args, _response=response, **kwargs: _response
+        else:
+            module.http_get_parsed = (
+                lambda url, parse, *args, _response=response, **kwargs: parse(_response)
+            )
+        fetch = getattr(module, fetch_name)
+        build = module.build_payload
+
+        items = fetch(SYMBOL)
+        if not items:
+            print(f"Skipping {source}: fixture parsed to no items")
+            continue
+        batch = [build(SYMBOL, item) for item in items]
+        batches.extend(batch)
+
+        cases[f"parse.{source}"] = (lambda fetch=fetch: fetch(SYMBOL), len(items))
+        cases[f"build.{source}"] = (
+            lambda build=build, items=items: [build(SYMBOL, item) for item in items],
+            len(items),
+        )
+        cases[f"serialize.{source}"] = (
+            lambda batch=batch: [serializer.encode(message) for message in batch],
+            len(batch),
+        )
+
+    wire = [to_wire(message) for message in batches]
+    cases["validate.schema"] = (
+        lambda: [validate_message_schema(message) for message in wire],
+        len(wire),
+    )
+    cases["validate.batch"] = (lambda: validate_batch(batches), len(batches))
+    cases["publish.memory"] = (lambda: publish_to_queue(batches), len(batches))
+
+    return {name: case for name, case in cases.items() if pattern in name}
+
+
+def measure(operation: Callable[[], Any], rounds: int) -> dict[str, float]:
+    """Time an operation; each round runs it enough times to take ~0.2s."""
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    samples = [t / number * 1e6 for t in timer.repeat(repeat=rounds, number=number)]
+    return {
+        "median_us": statistics.median(samples),
+        "min_us": min(samples),
+        "mean_us": statistics.fmean(samples),
+        "rounds": rounds,
+        "number": number,
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the suite, print a table and optionally save the results."""
+    os.environ["QUEUE_TYPE"] = "memory"
+    cases = build_cases(args.filter)
+
+    header = f"{'benchmark':<26} {'items':>6} {'median us':>12} {'us/item':>10} {'min us':>12}"
+    print(header)
+    print("-" * len(header))
+    results: dict[str, dict[str, float]] = {}
+    for name, (operation, items) in cases.items():
+        stats = measure(operation, args.rounds)
+        stats["items"] = items
+        results[name] = stats
+        print(
+            f"{name:<26} {items:>6} {stats['median_us']:>12.1f} "
+            f"{stats['median_us'] / items:>10.2f} {stats['min_us']:>12.1f}"
+        )
+
+    if args.output:
+        document = {
+            "created": datetime.datetime.now(datetime.UTC).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        print(f"Saved {len(results)} results to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare two result files and fail on regressions beyond the threshold."""
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)["results"]
+
+    header = f"{'benchmark':<26} {'baseline us':>12} {'current us':>12} {'change':>8}"
+    print(header)
+    print("-" * len(header))
+    regressions = []
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in current or name not in baseline:
+            where = "current" if name not in current else "baseline"
+            print(f"{name:<26} missing from {where}")
+            continue
+        before, after = baseline[name]["median_us"], current[name]["median_us"]
+        change = after / before - 1
+        flag = ""
+        if change > args.threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<26} {before:>12.1f} {after:>12.1f} {change:>+8.1%}{flag}")
+
+    if regressions:
+        print(f"FAIL: {len(regressions)} benchmark(s) slower by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    """Dispatch to the run, compare or fixtures command."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the suite")
+    run_parser.add_argument("--output", default="", help="Write results to this JSON file")
+    run_parser.add_argument("--rounds", type=int, default=7, help="Timed rounds per benchmark")
+    run_parser.add_argument("--filter", default="", help="Only run names containing this")
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline", help="Baseline results JSON")
+    compare_parser.add_argument("current", help="Current results JSON")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.15, help="Allowed slowdown (0.15 = 15%%)"
+    )
+
+    commands.add_parser("fixtures", help="Regenerate the saved fixtures")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        return run(args)
+    if args.command == "compare":
+        return compare(args)
+    write_fixtures()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""Cold-start import-time benchmark for the poller entry point.
+
+Runs ``python -X importtime`` in a fresh interpreter that imports ``app.main``
+and loads one selected poller runner (without starting it), then reports the
+total import time, the slowest top-level imports and any heavy dependencies
+that were loaded even though the selected poller does not need them.
+
+Exits non-zero if the cumulative import time exceeds ``--threshold-ms`` or a
+forbidden module was imported, so it can guard against regressions in CI.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_import_time.py --poller stocktwits --threshold-ms 800
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# Heavy dependencies and the pollers that legitimately need them.
+HEAVY_MODULES: dict[str, set[str]] = {
+    "boto3": set(),
+    "pika": set(),
+    "googleapiclient": {"youtube"},
+    "youtube_transcript_api": {"youtube"},
+    "bs4": {"finviz", "yahoo"},
+    "feedparser": {"google_news", "seeking_alpha"},
+}
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(poller: str) -> list[tuple[int, int, int, str]]:
+    """Import app.main and load ``poller``'s runner in a fresh interpreter.
+
+    Args:
+        poller (str): Key in ``app.main.POLLERS``.
+
+    Returns:
+        list[tuple[int, int, int, str]]: (self us, cumulative us, depth,
+        module) for every module imported.
+
+    Raises:
+        RuntimeError: If the child interpreter fails.
+
+    """
+    code = f"import app.main; app.main.load_runner({poller!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stderr}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+    return entries
+
+
+def main() -> int:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--poller", default="stocktwits", help="Poller runner to load")
+    parser.add_argument("--runs", type=int, default=5, help="Runs to take the best of")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    parser.add_argument(
+        "--threshold-ms",
+        type=float,
+        default=None,
+        help="Fail if the best total import time exceeds this many milliseconds",
+    )
+    args = parser.parse_args()
+
+    runs = [measure(args.poller) for _ in range(args.runs)]
+    totals = [sum(c for _, c, depth, _ in entries if depth == 0) for entries in runs]
+    best = min(range(len(runs)), key=totals.__getitem__)
+    entries = runs[best]
+    total_ms = totals[best] / 1000
+
+    print(f"Poller: {args.poller}")
+    print(f"Total import time: {total_ms:.1f} ms (best of {args.runs})")
+    print(f"Modules imported: {len(entries)}")
+    print("Slowest top-level imports:")
+    top_level = sorted((e for e in entries if e[2] == 0), key=lambda e: e[1], reverse=True)
+    for _, cumulative_us, _, module in top_level[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    imported = {module.split(".")[0] for *_, module in entries}
+    unexpected = sorted(
+        name
+        for name, allowed in HEAVY_MODULES.items()
+        if name in imported and args.poller not in allowed
+    )
+
+    failed = False
+    if unexpected:
+        print(f"FAIL: heavy modules imported: {', '.join(unexpected)}")
+        failed = True
+    if args.threshold_ms is not None and total_ms > args.threshold_ms:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds {args.threshold_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
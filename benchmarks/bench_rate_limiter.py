@@ -0,0 +1,97 @@
+"""Contention benchmark for the token bucket RateLimiter.
+
+Starts many threads that call ``acquire()`` in a tight loop and reports the
+achieved throughput against the configured rate, plus how evenly the tokens
+were spread across threads.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_rate_limiter.py --threads 64 --rate 50 --duration 5
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+
+from app.utils.rate_limit import RateLimiter
+
+
+def run(threads: int, rate: int, window: float, duration: float, tokens: int) -> dict[str, float]:
+    """Run the contention benchmark.
+
+    Args:
+        threads (int): Number of concurrent worker threads.
+        rate (int): Bucket capacity (max_requests).
+        window (float): Time window in seconds for ``rate``.
+        duration (float): How long to run, in seconds.
+        tokens (int): Tokens taken per acquire call.
+
+    Returns:
+        dict[str, float]: Throughput and fairness statistics.
+
+    """
+    limiter = RateLimiter(max_requests=rate, time_window=window)
+    # Drain the initial burst so the measurement reflects the steady-state rate.
+    while limiter.try_acquire(1) == 0.0:
+        pass
+
+    counts = [0] * threads
+    stop_at = time.monotonic() + duration
+    start = threading.Barrier(threads + 1)
+
+    def worker(idx: int) -> None:
+        start.wait()
+        while time.monotonic() < stop_at:
+            limiter.acquire(tokens, context="bench")
+            counts[idx] += tokens
+
+    pool = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(threads)]
+    for t in pool:
+        t.start()
+    started = time.monotonic()
+    start.wait()
+    for t in pool:
+        t.join()
+    elapsed = time.monotonic() - started
+
+    total = sum(counts)
+    return {
+        "configured_rate": rate / window,
+        "achieved_rate": total / elapsed,
+        "elapsed": elapsed,
+        "tokens": float(total),
+        "per_thread_stdev": statistics.pstdev(counts),
+        "per_thread_min": float(min(counts)),
+        "per_thread_max": float(max(counts)),
+    }
+
+
+def main() -> int:
+    """Parse arguments, run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--rate", type=int, default=50)
+    parser.add_argument("--window", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--tokens", type=int, default=1)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Fail if achieved throughput deviates from the configured rate by more than this.",
+    )
+    args = parser.parse_args()
+
+    result = run(args.threads, args.rate, args.window, args.duration, args.tokens)
+    for key, value in result.items():
+        print(f"{key:>18}: {value:.2f}")
+
+    expected = result["configured_rate"] * result["elapsed"]
+    deviation = abs(result["tokens"] - expected) / expected
+    print(f"{'deviation':>18}: {deviation:.2%}")
+    return 0 if deviation <= args.tolerance else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
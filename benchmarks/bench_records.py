@@ -0,0 +1,111 @@
+"""Allocation benchmark for poller payload records.
+
+Builds a cycle's worth of Stocktwits-shaped payloads twice, once as the
+original nested dicts and once as slotted ``SentimentMessage`` records, and
+reports the memory held by each batch (via tracemalloc) plus the build time
+and the time to produce the wire dicts at publish.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_records.py --messages 30 --symbols 500
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from app.records import Article, SentimentMessage
+
+
+def raw_messages(symbols: int, per_symbol: int) -> list[tuple[str, dict[str, Any]]]:
+    """Return (symbol, raw API message) pairs shaped like Stocktwits responses."""
+    return [
+        (
+            f"SYM{s}",
+            {
+                "created_at": f"2025-08-14T13:{m % 60:02d}:00Z",
+                "user": {"username": f"trader{m}"},
+                "body": f"$SYM{s} looking strong into earnings, adding on the dip #{m}",
+            },
+        )
+        for s in range(symbols)
+        for m in range(per_symbol)
+    ]
+
+
+def build_dict(symbol: str, msg: dict[str, Any]) -> dict[str, Any]:
+    """Build a payload the way the pollers did before records."""
+    return {
+        "symbol": symbol,
+        "timestamp": msg.get("created_at", ""),
+        "source": "Stocktwits",
+        "data": {
+            "username": msg.get("user", {}).get("username", ""),
+            "content": msg.get("body", ""),
+            "platform": "stocktwits",
+        },
+    }
+
+
+def build_record(symbol: str, msg: dict[str, Any]) -> SentimentMessage:
+    """Build a payload as a slotted record."""
+    article = Article(
+        timestamp=msg.get("created_at", ""),
+        username=msg.get("user", {}).get("username", ""),
+        content=msg.get("body", ""),
+    )
+    return SentimentMessage(
+        symbol=symbol, source="Stocktwits", platform="stocktwits", article=article
+    )
+
+
+def measure(
+    raw: list[tuple[str, dict[str, Any]]], build: Callable[[str, dict[str, Any]], Any]
+) -> tuple[int, int, float]:
+    """Build a batch and return (bytes held, allocation peak, build seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    batch = [build(symbol, msg) for symbol, msg in raw]
+    elapsed = time.perf_counter() - start
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del batch
+    return held, peak, elapsed
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=500, help="Symbols per cycle")
+    parser.add_argument("--messages", type=int, default=30, help="Messages per symbol")
+    args = parser.parse_args()
+
+    raw = raw_messages(args.symbols, args.messages)
+    count = len(raw)
+    print(f"Messages per cycle: {count}")
+
+    results = {}
+    for name, build in (("dict", build_dict), ("record", build_record)):
+        held, peak, elapsed = measure(raw, build)
+        results[name] = held
+        print(
+            f"{name:<7} held {held / 1024:9.1f} KiB ({held / count:6.1f} B/msg)  "
+            f"peak {peak / 1024:9.1f} KiB  build {elapsed * 1000:7.1f} ms"
+        )
+
+    records = [build_record(symbol, msg) for symbol, msg in raw]
+    start = time.perf_counter()
+    for record in records:
+        record.to_wire()
+    wire_ms = (time.perf_counter() - start) * 1000
+    print(f"to_wire for the whole batch: {wire_ms:.1f} ms")
+    print(f"Memory held by records vs dicts: {results['record'] / results['dict']:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Microbenchmark for queue message serialization.
+
+Encodes representative Finviz, NewsAPI and YouTube payloads with stdlib json
+and every available serializer configuration, reporting encode time, decode
+time and wire size. Options whose packages (orjson, msgpack, zstandard) are
+not installed are skipped.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_serializers.py --iterations 20000
+"""
+
+import argparse
+import functools
+import json
+import sys
+import timeit
+from typing import Any
+
+from app.message_queue import serializers
+from app.message_queue.serializers import MessageSerializer, decode_message
+
+SENTENCE = (
+    "Shares moved higher after the company reported quarterly revenue ahead of "
+    "estimates and raised its full-year guidance on strong services demand. "
+)
+
+PAYLOADS: dict[str, dict[str, Any]] = {
+    "finviz": {
+        "symbol": "AAPL",
+        "timestamp": "2025-08-14T13:30:00+00:00",
+        "source": "Finviz",
+        "data": {
+            "headline": "Apple beats estimates as services revenue hits a record",
+            "url": "https://finviz.com/news/123456/apple-beats-estimates",
+            "platform": "finviz",
+        },
+    },
+    "newsapi": {
+        "symbol": "MSFT",
+        "timestamp": "2025-08-14T13:30:00Z",
+        "source": "NewsAPI",
+        "data": {
+            "headline": "Microsoft cloud growth accelerates in fiscal fourth quarter",
+            "summary": SENTENCE * 3,
+            "url": "https://example.com/markets/microsoft-cloud-growth",
+            "source": "Example News",
+            "author": "Jane Doe",
+            "published_at": "2025-08-14T13:30:00Z",
+            "platform": "newsapi",
+        },
+    },
+    "youtube": {
+        "symbol": "NVDA",
+        "timestamp": "2025-08-14T13:30:00Z",
+        "source": "YouTube",
+        "data": {
+            "headline": "NVIDIA earnings deep dive: data center demand explained",
+            "url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "transcript": SENTENCE * 150,
+            "platform": "youtube",
+        },
+    },
+}
+
+
+def _configurations() -> dict[str, MessageSerializer]:
+    """Return the serializer configurations available in this environment."""
+    configs: dict[str, MessageSerializer] = {}
+    options = [
+        ("json", "json", "none"),
+        ("json+zstd", "json", "zstd"),
+        ("msgpack", "msgpack", "none"),
+        ("msgpack+zstd", "msgpack", "zstd"),
+    ]
+    for name, message_format, compression in options:
+        try:
+            configs[name] = MessageSerializer(message_format, compression)
+        except RuntimeError as e:
+            print(f"Skipping {name}: {e}")
+    return configs
+
+
+def main() -> int:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000, help="Encodes per measurement")
+    args = parser.parse_args()
+    n = args.iterations
+
+    configs = _configurations()
+    json_backend = "orjson" if serializers.orjson is not None else "stdlib json"
+    print(f"JSON backend: {json_backend}")
+    header = f"{'payload':<8} {'serializer':<13} {'encode us':>10} {'decode us':>10} {'bytes':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for payload_name, payload in PAYLOADS.items():
+        baseline = timeit.timeit(lambda payload=payload: json.dumps(payload).encode(), number=n)
+        size = len(json.dumps(payload).encode())
+        print(
+            f"{payload_name:<8} {'stdlib json':<13} {baseline / n * 1e6:>10.2f} "
+            f"{'':>10} {size:>8}"
+        )
+
+        for name, serializer in configs.items():
+            encoded = serializer.encode(payload)
+            encode = timeit.timeit(functools.partial(serializer.encode, payload), number=n)
+            decode_encoded = functools.partial(
+                decode_message, encoded.body, encoded.content_type, encoded.content_encoding
+            )
+            decode = timeit.timeit(decode_encoded, number=n)
+            if decode_encoded() != payload:
+                raise RuntimeError(f"{name} did not round-trip the {payload_name} payload")
+            print(
+                f"{payload_name:<8} {name:<13} {encode / n * 1e6:>10.2f} "
+                f"{decode / n * 1e6:>10.2f} {len(encoded.body):>8}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
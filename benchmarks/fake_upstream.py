@@ -0,0 +1,466 @@
+"""Synthetic upstream that emulates every HTTP source the pollers call.
+
+Serves deterministic, realistic-looking responses for NewsAPI and Benzinga
+(JSON), Stocktwits (JSON), Finviz and Yahoo Finance (HTML) and Google News
+and Seeking Alpha (RSS). Point the pollers at it with
+``HTTP_UPSTREAM_OVERRIDE=http://127.0.0.1:<port>``; the HTTP client then
+requests ``/<original host><path>``, which is how responses are routed here.
+
+Each symbol has a stream of items. Every request for a symbol moves the
+window forward by ``--churn`` (share of ``--items`` that are new per request),
+so the dedup index sees a steady rate of new items. Latency follows the
+chosen distribution around ``--latency-ms``, and ``--rate-429`` /
+``--rate-5xx`` shares of requests fail (429s carry ``Retry-After: 1``).
+
+Usage:
+    python benchmarks/fake_upstream.py --port 8900 --items 20 --churn 0.25
+    python benchmarks/fake_upstream.py --latency lognormal --latency-ms 80 --rate-5xx 0.02
+"""
+
+import argparse
+import datetime
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+WORDS = [
+    "earnings", "guidance", "upgrade", "downgrade", "beats", "misses", "revenue",
+    "outlook", "rally", "slump", "buyback", "dividend", "merger", "lawsuit",
+    "launch", "recall", "margin", "demand", "supply", "forecast",
+]
+
+# Fixed reference time so generated timestamps are reproducible.
+EPOCH = datetime.datetime(2025, 8, 14, 13, 30, tzinfo=datetime.UTC)
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Behaviour of the synthetic upstream."""
+
+    items: int = 20
+    churn: float = 0.25
+    latency: str = "fixed"
+    latency_ms: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class Item:
+    """One synthetic news item or post."""
+
+    index: int
+    symbol: str
+    title: str
+    body: str
+    published: datetime.datetime
+
+
+class ItemStream:
+    """Per-symbol item windows that advance on every request."""
+
+    def __init__(self, config: UpstreamConfig) -> None:
+        """Initialize the stream.
+
+        Args:
+            config (UpstreamConfig): Items per response, churn and seed.
+
+        """
+        self._config = config
+        self._lock = threading.Lock()
+        self._requests: dict[tuple[str, str], int] = {}
+
+    def next_window(self, route: str, symbol: str) -> list[Item]:
+        """Return the current items for a symbol on a route, newest first."""
+        with self._lock:
+            count = self._requests.get((route, symbol), 0)
+            self._requests[(route, symbol)] = count + 1
+        start = int(count * self._config.churn * self._config.items)
+        return [
+            self._item(symbol, index)
+            for index in range(start + self._config.items - 1, start - 1, -1)
+        ]
+
+    def _item(self, symbol: str, index: int) -> Item:
+        """Build item ``index`` of a symbol's stream deterministically."""
+        rng = random.Random(f"{self._config.seed}:{symbol}:{index}")
+        words = rng.sample(WORDS, 6)
+        return Item(
+            index=index,
+            symbol=symbol,
+            title=f"{symbol} {' '.join(words[:4])} #{index}",
+            body=f"${symbol} {' '.join(words)} as traders weigh the {words[0]} news.",
+            published=EPOCH + datetime.timedelta(minutes=index),
+        )
+
+
+def _iso(dt: datetime.datetime) -> str:
+    """Format a timestamp as ISO 8601 UTC with a trailing Z."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def render_newsapi(items: list[Item]) -> tuple[str, bytes]:
+    """Render a NewsAPI /v2/everything JSON response.
+
+    Args:
+        items (list[Item]): Items to include, newest first.
+
+    Returns:
+        tuple[str, bytes]: Content type and body.
+
+    """
+    articles = [
+        {
+            "source": {"id": None, "name": "Synthetic Wire"},
+            "author": "Newsroom",
+            "title": item.title,
+            "description": item.body,
+            "url": f"https://news.example.com/{item.symbol}/{item.index}",
+            "publishedAt": _iso(item.published),
+            "content": item.body,
+        }
+        for item in items
+    ]
+    body = {"status": "ok", "totalResults": len(articles), "articles": articles}
+    return "application/json", json.dumps(body).encode()
+
+
+def render_benzinga(items: list[Item]) -> tuple[str, bytes]:
+    """Render a Benzinga news API JSON response.
+
+    Args:
+        items (list[Item]): Items to include, newest first.
+
+    Returns:
+        tuple[str, bytes]: Content type and body.
+
+    """
+    news = [
+        {
+            "id": item.index,
+            "created": format_datetime(item.published),
+            "title": item.title,
+            "summary": item.body,
+            "url": f"https://www.benzinga.com/news/{item.symbol}/{item.index}",
+            "sentiment": ("positive", "neutral", "negative")[item.index % 3],
+            "stocks": [{"name": item.symbol}],
+        }
+        for item in items
+    ]
+    return "application/json", json.dumps(news).encode()
+
+
+def render_stocktwits(items: list[Item]) -> tuple[str, bytes]:
+    """Render a Stocktwits symbol stream JSON response.
+
+    Args:
+        items (list[Item]): Items to include, newest first.
+
+    Returns:
+        tuple[str, bytes]: Content type and body.
+
+    """
+    messages = [
+        {
+            "id": item.index,
+            "body": item.body,
+            "created_at": _iso(item.published),
+            "user": {"id": item.index % 997, "username": f"trader{item.index % 997}"},
+            "symbols": [{"symbol": item.symbol}],
+        }
+        for item in items
+    ]
+    body = {"response": {"status": 200}, "messages": messages}
+    return "application/json", json.dumps(body).encode()
+
+
+def render_finviz(items: list[Item]) -> tuple[str, bytes]:
+    """Render a Finviz quote page with its news table.
+
+    Args:
+        items (list[Item]): Items to include, newest first.
+
+    Returns:
+        tuple[str, bytes]: Content type and body.
+
+    """
+    rows = "".join(
+        f'<tr><td width="130" align="right">'
+        f"{item.published.strftime('%b-%d-%y %I:%M%p')}</td>"
+        f'<td align="left"><a href="https://news.example.com/{item.symbol}/{item.index}" '
+        f'class="tab-link-news">{escape(item.title)}</a></td></tr>'
+        for item in items
+    )
+    html = (
+        "<html><head><title>Finviz</title></head><body>"
+        '<table class="snapshot-table2"><tr><td>P/E</td><td>21.4</td></tr></table>'
+        f'<table class="fullview-news-outer">{rows}</table></body></html>'
+    )
+    return "text/html; charset=utf-8", html.encode()
+
+
+def render_yahoo(items: list[Item]) -> tuple[str, bytes]:
+    """Render a Yahoo Finance page with headline links.
+
+    Args:
+        items (list[Item]): Items to include, newest first.
+
+    Returns:
+        tuple[str, bytes]: Content type and body.
+
+    """
+    links = "".join(
+        f'<li><h3><a href="/news/{item.symbol.lower()}-{item.index}.html">'
+        f"{escape(item.title)}</a></h3><p>{escape(item.body)}</p></li>"
+        for item in items
+    )
+    html = (
+        "<html><head><title>Yahoo Finance</title></head><body>"
+        '<nav><a href="/quote/">Quotes</a></nav>'
+        f"<ul>{links}</ul></body></html>"
+    )
+    return "text/html; charset=utf-8", html.encode()
+
+
+def _render_rss(title: str, items: list[Item], link: Callable[[Item], str]) -> bytes:
+    """Render an RSS 2.0 channel whose item links come from ``link``."""
+    entries = "".join(
+        f"<item><title>{escape(item.title)}</title><link>{link(item)}</link>"
+        f"<description>{escape(item.body)}</description>"
+        f"<pubDate>{item.published.strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate></item>"
+        for item in items
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{escape(title)}</title>{entries}</channel></rss>"
+    ).encode()
+
+
+def render_google_news(items: list[Item]) -> tuple[str, bytes]:
+    """Render a Google News RSS search feed.
+
+    Args:
+        items (list[Item]): Items to include, newest first.
+
+    Returns:
+        tuple[str, bytes]: Content type and body.
+
+    """
+    body = _render_rss(
+        "Google News", items, lambda item: f"https://news.example.com/g/{item.index}"
+    )
+    return "application/rss+xml; charset=utf-8", body
+
+
+def render_seeking_alpha(items: list[Item]) -> tuple[str, bytes]:
+    """Render a Seeking Alpha symbol RSS feed.
+
+    Args:
+        items (list[Item]): Items to include, newest first.
+
+    Returns:
+        tuple[str, bytes]: Content type and body.
+
+    """
+    body = _render_rss(
+        "Seeking Alpha",
+        items,
+        lambda item: f"https://seekingalpha.com/news/{item.index}-{item.symbol.lower()}",
+    )
+    return "application/rss+xml; charset=utf-8", body
+
+
+def _first_word(value: str) -> str:
+    """Return the first word of a query value ('AAPL+stock' -> 'AAPL')."""
+    return value.replace("+", " ").split()[0] if value.strip() else ""
+
+
+def _path_symbol(path: str, suffix: str) -> str:
+    """Return the last path segment without ``suffix``."""
+    name = path.rsplit("/", 1)[-1]
+    return name.removesuffix(suffix)
+
+
+# host -> (symbol extractor from (path, query), renderer)
+ROUTES: dict[
+    str,
+    tuple[
+        Callable[[str, dict[str, str]], str],
+        Callable[[list[Item]], tuple[str, bytes]],
+    ],
+] = {
+    "newsapi.org": (lambda path, q: _first_word(q.get("q", "")), render_newsapi),
+    "api.benzinga.com": (lambda path, q: q.get("symbols", "").split(",")[0], render_benzinga),
+    "api.stocktwits.com": (lambda path, q: _path_symbol(path, ".json"), render_stocktwits),
+    "finviz.com": (lambda path, q: q.get("t", ""), render_finviz),
+    "finance.yahoo.com": (lambda path, q: q.get("p", "") or _path_symbol(path, ""), render_yahoo),
+    "news.google.com": (lambda path, q: _first_word(q.get("q", "")), render_google_news),
+    "seekingalpha.com": (lambda path, q: _path_symbol(path, ".xml"), render_seeking_alpha),
+}
+
+
+class FakeUpstream:
+    """Threaded HTTP server serving the synthetic sources."""
+
+    def __init__(self, config: UpstreamConfig, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Bind the server; call ``start`` or ``serve_forever`` to serve.
+
+        Args:
+            config (UpstreamConfig): Response shape, latency and error rates.
+            host (str): Address to bind.
+            port (int): Port to bind; 0 picks a free port.
+
+        """
+        self.config = config
+        self.stream = ItemStream(config)
+        self._random = random.Random(config.seed)
+        self._random_lock = threading.Lock()
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL to use as HTTP_UPSTREAM_OVERRIDE."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeUpstream":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-upstream", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _draw(self) -> tuple[float, float]:
+        """Return (latency seconds, uniform draw for error injection)."""
+        mean = self.config.latency_ms / 1000
+        with self._random_lock:
+            self.requests += 1
+            if mean <= 0 or self.config.latency == "fixed":
+                latency = mean
+            elif self.config.latency == "exponential":
+                latency = self._random.expovariate(1 / mean)
+            else:
+                # Lognormal with the requested mean and a long right tail.
+                sigma = 0.8
+                latency = self._random.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+            return latency, self._random.random()
+
+    def respond(self, raw_path: str) -> tuple[int, dict[str, str], bytes]:
+        """Build the (status, headers, body) for a request path."""
+        parts = urlsplit(raw_path)
+        host, _, path = parts.path.lstrip("/").partition("/")
+        route = ROUTES.get(host)
+
+        latency, draw = self._draw()
+        if latency:
+            time.sleep(latency)
+
+        if route is None:
+            return 404, {"Content-Type": "text/plain"}, f"unknown upstream {host}".encode()
+        if draw < self.config.rate_429:
+            return 429, {"Content-Type": "text/plain", "Retry-After": "1"}, b"rate limited"
+        if draw < self.config.rate_429 + self.config.rate_5xx:
+            return 503, {"Content-Type": "text/plain"}, b"upstream unavailable"
+
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        symbol = route[0]("/" + path, query).upper()
+        content_type, body = route[1](self.stream.next_window(host, symbol))
+        return 200, {"Content-Type": content_type}, body
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                status, headers, body = upstream.respond(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+def add_upstream_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that shape the synthetic upstream."""
+    parser.add_argument("--items", type=int, default=20, help="Items per response")
+    parser.add_argument(
+        "--churn", type=float, default=0.25, help="Share of items that are new per request"
+    )
+    parser.add_argument(
+        "--latency",
+        choices=("fixed", "exponential", "lognormal"),
+        default="fixed",
+        help="Latency distribution",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean latency per request")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of 429 responses")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="Share of 503 responses")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for content and errors")
+
+
+def config_from_args(args: argparse.Namespace) -> UpstreamConfig:
+    """Build an UpstreamConfig from parsed arguments."""
+    return UpstreamConfig(
+        items=args.items,
+        churn=args.churn,
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        seed=args.seed,
+    )
+
+
+def main() -> int:
+    """Serve the synthetic upstream until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    parser.add_argument("--port", type=int, default=8900, help="Port to bind")
+    add_upstream_arguments(parser)
+    args = parser.parse_args()
+
+    upstream = FakeUpstream(config_from_args(args), host=args.host, port=args.port)
+    print(f"Serving synthetic upstream on {upstream.url}")
+    print(f"  export HTTP_UPSTREAM_OVERRIDE={upstream.url}")
+    try:
+        upstream.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        upstream.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
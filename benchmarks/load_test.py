@@ -0,0 +1,146 @@
+"""End-to-end load test: a real poller against the synthetic upstream.
+
+Starts :mod:`fake_upstream` in-process (or uses ``--upstream``), points the
+HTTP client at it with HTTP_UPSTREAM_OVERRIDE, publishes to the in-memory
+broker (QUEUE_TYPE=memory) and runs the selected ``run_*_poller`` loop
+unchanged for ``--duration`` seconds with no polling interval. The queue sink
+flushes every QUEUE_FLUSH_INTERVAL (0.05s here) and is drained before
+counting, so the total covers everything the poller produced during the run.
+Reports published items per second, publish latency percentiles per batch,
+CPU time and peak RSS. Rate limits are disabled unless ``--keep-rate-limits``
+is given, so the numbers reflect the pipeline rather than configured quotas.
+
+CPU and RSS cover the whole process, including the in-process upstream; use
+``--upstream`` with a separately started ``fake_upstream.py`` to exclude it.
+
+Usage:
+    PYTHONPATH=src python benchmarks/load_test.py --poller stocktwits --symbols 200
+    PYTHONPATH=src python benchmarks/load_test.py --poller finviz --latency lognormal \
+        --latency-ms 50 --rate-5xx 0.02 --concurrency 16 --duration 30
+"""
+
+import argparse
+import os
+import resource
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_upstream import FakeUpstream, add_upstream_arguments, config_from_args
+
+POLLERS = (
+    "newsapi",
+    "finviz",
+    "stocktwits",
+    "yahoo",
+    "google_news",
+    "seeking_alpha",
+    "benzinga",
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ``values`` (0 if empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def configure_environment(args: argparse.Namespace, upstream_url: str) -> None:
+    """Set the config the poller reads; must run before importing ``app``."""
+    symbols = ",".join(f"SYM{i:04d}" for i in range(args.symbols))
+    os.environ.update(
+        {
+            "POLLER_TYPE": args.poller,
+            "SYMBOLS": symbols,
+            "POLLING_INTERVAL": "0",
+            "QUEUE_TYPE": "memory",
+            "OUTPUT_MODE": "queue",
+            "OUTPUT_MODES": "queue",
+            "QUEUE_FLUSH_INTERVAL": "0.05",
+            "HTTP_UPSTREAM_OVERRIDE": upstream_url,
+            "HTTP_CASSETTE_MODE": "",
+            "SOURCE_CONCURRENCY": str(args.concurrency),
+            "NEWSAPI_KEY": os.environ.get("NEWSAPI_KEY", "load-test"),
+            "BENZINGA_API_KEY": os.environ.get("BENZINGA_API_KEY", "load-test"),
+        }
+    )
+
+
+def main() -> int:
+    """Run the load test and print throughput, latency and resource usage."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--poller", choices=POLLERS, default="stocktwits", help="Poller to run")
+    parser.add_argument("--symbols", type=int, default=100, help="Number of symbols")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent fetches")
+    parser.add_argument("--upstream", default="", help="Use a running fake_upstream at this URL")
+    parser.add_argument(
+        "--keep-rate-limits", action="store_true", help="Apply the configured rate limits"
+    )
+    add_upstream_arguments(parser)
+    args = parser.parse_args()
+
+    upstream = None
+    upstream_url = args.upstream
+    if not upstream_url:
+        upstream = FakeUpstream(config_from_args(args)).start()
+        upstream_url = upstream.url
+    configure_environment(args, upstream_url)
+
+    # Imported only now so every module sees the environment set above.
+    from app.main import load_runner
+    from app.message_queue.memory_broker import get_memory_broker
+    from app.output import queue_sink
+    from app.output.dispatcher import get_output_dispatcher
+    from app.utils import rate_limit_registry
+
+    if not args.keep_rate_limits:
+        rate_limit_registry._registry = rate_limit_registry.RateLimitRegistry(
+            host_limits={}, credential_limits={}, ip_limit=lambda: (0, 60.0)
+        )
+
+    latencies: list[float] = []
+    publish = queue_sink.publish_to_queue
+
+    def timed_publish(batch: list) -> None:
+        start = time.perf_counter()
+        publish(batch)
+        latencies.append(time.perf_counter() - start)
+
+    queue_sink.publish_to_queue = timed_publish
+
+    broker = get_memory_broker()
+    usage_start = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+    threading.Thread(target=load_runner(args.poller), name="poller", daemon=True).start()
+    time.sleep(args.duration)
+    get_output_dispatcher().flush(timeout=10)
+    published = broker.published
+    elapsed = time.perf_counter() - start
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    cpu = (usage.ru_utime - usage_start.ru_utime) + (usage.ru_stime - usage_start.ru_stime)
+    print(f"Poller: {args.poller}  symbols: {args.symbols}  concurrency: {args.concurrency}")
+    print(f"Upstream: {upstream_url}  requests: {upstream.requests if upstream else 'n/a'}")
+    print(f"published      {published:10d} items in {elapsed:.1f}s")
+    print(f"throughput     {published / elapsed:10.1f} items/s")
+    print(f"publish p50    {percentile(latencies, 50) * 1000:10.2f} ms/batch")
+    print(f"publish p95    {percentile(latencies, 95) * 1000:10.2f} ms/batch")
+    print(f"publish p99    {percentile(latencies, 99) * 1000:10.2f} ms/batch")
+    print(f"cpu            {cpu:10.2f} s ({cpu / elapsed * 100:.0f}% of one core)")
+    print(f"peak rss       {usage.ru_maxrss / 1024:10.1f} MiB")
+
+    if upstream is not None:
+        upstream.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    code = main()
+    sys.stdout.flush()
+    # The poller loop never returns; exit without waiting for its threads.
+    os._exit(code)
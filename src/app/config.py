@@ -4,7 +4,6 @@ Delegates to shared config for common settings and defines any custom logic need
 by this repository (e.g., symbol lists, indicator types).
 """
 
-import os
 from app.config_shared import (
     get_polling_interval,
     get_batch_size,
@@ -15,9 +14,15 @@ from app.config_shared import (
     get_sqs_region,
     get_config_value,
 )
+from app.utils.symbol_source import get_symbol_universe
 
 
 def get_symbols() -> list[str]:
-    """Returns a list of symbols to track for this repository."""
-    symbols = os.getenv("SYMBOLS", "AAPL,MSFT,GOOG")
-    return [s.strip() for s in symbols.split(",") if s.strip()]
+    """Returns the symbols this replica should track.
+
+    Symbols come from SYMBOLS_FILE or the SYMBOLS config value and are
+    reloaded without a restart when the source changes. When SHARD_COUNT > 1
+    the full list is split across replicas with rendezvous hashing and only
+    the symbols owned by this shard are returned.
+    """
+    return get_symbol_universe().symbols()
@@ -2,14 +2,37 @@
 
 Provides typed, cached getter functions to retrieve configuration values
 from Vault, environment variables, or defaults — in that order.
+
+The cached values are dropped whenever the background Vault refresh changes
+the secret, so later getter calls see the new values. Components that read a
+value once at startup (pool sizes, sink settings) keep it until restart.
 """
 
+import os
 from functools import lru_cache
 from typing import List, Tuple
 
 from app.utils.config_utils import get_config_bool
+from app.utils.sharding import ordinal_from_hostname
 from app.utils.types import OutputMode
-from app.utils.vault_client import get_config_value_cached
+from app.utils.vault_client import get_config_value_cached, get_vault_snapshot
+
+
+def get_config_value(key: str, default: str | None = None) -> str:
+    """Retrieve an arbitrary configuration value from Vault or environment.
+
+    Args:
+        key (str): The config key to look up.
+        default (Optional[str]): Fallback if not found.
+
+    Returns:
+        str: The resolved config value.
+
+    Raises:
+        ValueError: If no value is found and no default is provided.
+
+    """
+    return get_config_value_cached(key, default)
 
 
 @lru_cache
@@ -298,6 +321,78 @@ def get_retry_delay() -> int:
     return int(get_config_value_cached("RETRY_DELAY", "5"))
 
 
+@lru_cache
+def get_retry_max_attempts(source: str) -> int:
+    """Retrieve the total attempts (first try included) for a source's requests.
+
+    Looks up '<SOURCE>_RETRY_MAX_ATTEMPTS' (e.g. NEWSAPI_RETRY_MAX_ATTEMPTS)
+    first, then the process-wide RETRY_MAX_ATTEMPTS.
+
+    Args:
+        source (str): Source name (e.g. 'newsapi').
+
+    Returns:
+        int: Maximum attempts per request.
+
+    Defaults to 3 if not set.
+
+    """
+    default = get_config_value_cached("RETRY_MAX_ATTEMPTS", "3")
+    return max(1, int(get_config_value_cached(f"{source.upper()}_RETRY_MAX_ATTEMPTS", default)))
+
+
+@lru_cache
+def get_retry_base_delay() -> float:
+    """Retrieve the backoff before the first retry, doubled on each retry.
+
+    Returns:
+        float: Base delay in seconds (full jitter is applied on top).
+
+    Defaults to 0.5 if not set.
+
+    """
+    return float(get_config_value_cached("RETRY_BASE_DELAY", "0.5"))
+
+
+@lru_cache
+def get_retry_max_delay() -> float:
+    """Retrieve the cap on retry backoff.
+
+    Returns:
+        float: Maximum delay in seconds.
+
+    Defaults to 10 if not set.
+
+    """
+    return float(get_config_value_cached("RETRY_MAX_DELAY", "10"))
+
+
+@lru_cache
+def get_retry_budget_ratio() -> float:
+    """Retrieve the share of requests that may be retried.
+
+    Returns:
+        float: Retries allowed per request over a 10-second window.
+
+    Defaults to 0.1 if not set.
+
+    """
+    return float(get_config_value_cached("RETRY_BUDGET_RATIO", "0.1"))
+
+
+@lru_cache
+def get_retry_budget_min_retries() -> int:
+    """Retrieve the retries always allowed per 10-second window.
+
+    Returns:
+        int: Retry floor that applies regardless of request volume.
+
+    Defaults to 10 if not set.
+
+    """
+    return int(get_config_value_cached("RETRY_BUDGET_MIN_RETRIES", "10"))
+
+
 @lru_cache
 def get_symbols() -> list[str]:
     """Retrieve a list of stock symbols to process.
@@ -1224,6 +1319,19 @@ def get_metrics_port() -> int:
         raise ValueError(f"Invalid METRICS_PORT value: '{port_str}' must be an integer.")
 
 
+@lru_cache
+def get_metrics_cache_seconds() -> float:
+    """Retrieve how long a rendered /metrics response is reused between scrapes.
+
+    Returns:
+        float: Cache lifetime in seconds; 0 renders on every scrape.
+
+    Defaults to 1.0 if not set.
+
+    """
+    return float(get_config_value_cached("METRICS_CACHE_SECONDS", "1.0"))
+
+
 @lru_cache
 def get_service_name() -> str:
     """Retrieve the human-readable name of this service.
@@ -1598,6 +1706,84 @@ def get_s3_output_prefix() -> str:
     return get_config_value_cached("S3_OUTPUT_KEY_PREFIX", "output/")
 
 
+@lru_cache
+def get_s3_output_endpoint_url() -> str:
+    """Retrieve a custom S3 endpoint for the archive sink (e.g. MinIO).
+
+    Returns:
+        str: Endpoint URL, or an empty string for AWS S3.
+
+    Defaults to empty string if not set.
+
+    """
+    return get_config_value_cached("S3_OUTPUT_ENDPOINT_URL", "")
+
+
+@lru_cache
+def get_s3_output_format() -> str:
+    """Retrieve the file format written by the S3 archive sink.
+
+    Returns:
+        str: 'ndjson' or 'parquet'.
+
+    Defaults to 'ndjson' if not set.
+
+    """
+    return get_config_value_cached("S3_OUTPUT_FORMAT", "ndjson").lower()
+
+
+@lru_cache
+def get_s3_output_compression() -> str:
+    """Retrieve the compression applied to NDJSON archive files.
+
+    Returns:
+        str: 'zstd' or 'gzip'.
+
+    Defaults to 'zstd' if not set.
+
+    """
+    return get_config_value_cached("S3_OUTPUT_COMPRESSION", "zstd").lower()
+
+
+@lru_cache
+def get_s3_roll_bytes() -> int:
+    """Retrieve the uncompressed size at which an archive file is rolled.
+
+    Returns:
+        int: Size threshold in bytes.
+
+    Defaults to 67108864 (64 MiB) if not set.
+
+    """
+    return int(get_config_value_cached("S3_ROLL_BYTES", str(64 * 1024 * 1024)))
+
+
+@lru_cache
+def get_s3_roll_seconds() -> float:
+    """Retrieve the maximum time an archive file stays open.
+
+    Returns:
+        float: Age in seconds after which a file is rolled.
+
+    Defaults to 300 if not set.
+
+    """
+    return float(get_config_value_cached("S3_ROLL_SECONDS", "300"))
+
+
+@lru_cache
+def get_s3_part_bytes() -> int:
+    """Retrieve the multipart upload part size for archive files.
+
+    Returns:
+        int: Part size in bytes (at least 5 MiB).
+
+    Defaults to 8388608 (8 MiB) if not set.
+
+    """
+    return int(get_config_value_cached("S3_PART_BYTES", str(8 * 1024 * 1024)))
+
+
 @lru_cache
 def get_database_connection_url() -> str:
     """Retrieve the database connection URL for output.
@@ -1637,6 +1823,45 @@ def get_database_insert_sql() -> str:
     return get_config_value_cached("DATABASE_INSERT_SQL", "")
 
 
+@lru_cache
+def get_database_table() -> str:
+    """Retrieve the table written by the database output sink.
+
+    Returns:
+        str: Table name (optionally schema-qualified).
+
+    Defaults to 'sentiment_messages' if not set.
+
+    """
+    return get_config_value_cached("DATABASE_TABLE", "sentiment_messages")
+
+
+@lru_cache
+def get_database_write_method() -> str:
+    """Retrieve how the database sink writes PostgreSQL batches.
+
+    Returns:
+        str: 'copy' (COPY into a staging table, then upsert) or 'executemany'.
+
+    Defaults to 'copy' if not set.
+
+    """
+    return get_config_value_cached("DATABASE_WRITE_METHOD", "copy").lower()
+
+
+@lru_cache
+def get_database_pool_size() -> int:
+    """Retrieve the number of pooled database connections kept open.
+
+    Returns:
+        int: Pool size.
+
+    Defaults to 4 if not set.
+
+    """
+    return int(get_config_value_cached("DATABASE_POOL_SIZE", "4"))
+
+
 @lru_cache
 def get_output_modes() -> list[str]:
     """Retrieve a list of enabled output modes.
@@ -1663,3 +1888,696 @@ def get_rest_output_url() -> str:
 
     """
     return get_config_value_cached("REST_OUTPUT_URL")
+
+
+@lru_cache
+def get_rest_output_max_in_flight() -> int:
+    """Retrieve the maximum concurrent requests sent by the REST output.
+
+    Returns:
+        int: Maximum in-flight POST requests.
+
+    Defaults to 4 if not set.
+
+    """
+    return int(get_config_value_cached("REST_OUTPUT_MAX_IN_FLIGHT", "4"))
+
+
+@lru_cache
+def get_rest_output_max_retries() -> int:
+    """Retrieve how many times the REST output retries a failed batch.
+
+    Returns:
+        int: Retries after the first attempt.
+
+    Defaults to 3 if not set.
+
+    """
+    return int(get_config_value_cached("REST_OUTPUT_MAX_RETRIES", "3"))
+
+
+@lru_cache
+def get_rest_output_backoff_seconds() -> float:
+    """Retrieve the base backoff delay for REST output retries.
+
+    Returns:
+        float: Base delay in seconds, doubled on each retry.
+
+    Defaults to 0.5 if not set.
+
+    """
+    return float(get_config_value_cached("REST_OUTPUT_BACKOFF_SECONDS", "0.5"))
+
+
+@lru_cache
+def get_rest_output_backoff_max_seconds() -> float:
+    """Retrieve the maximum backoff delay for REST output retries.
+
+    Returns:
+        float: Delay cap in seconds.
+
+    Defaults to 30 if not set.
+
+    """
+    return float(get_config_value_cached("REST_OUTPUT_BACKOFF_MAX_SECONDS", "30"))
+
+
+@lru_cache
+def get_circuit_failure_threshold() -> int:
+    """Retrieve the consecutive failures that open a circuit breaker.
+
+    Returns:
+        int: Failure threshold.
+
+    Defaults to 5 if not set.
+
+    """
+    return int(get_config_value_cached("CIRCUIT_FAILURE_THRESHOLD", "5"))
+
+
+@lru_cache
+def get_circuit_reset_seconds() -> float:
+    """Retrieve how long an open circuit waits before probing again.
+
+    Returns:
+        float: Seconds spent open before a half-open probe.
+
+    Defaults to 30 if not set.
+
+    """
+    return float(get_config_value_cached("CIRCUIT_RESET_SECONDS", "30"))
+
+
+# --- Rate Limiting Configuration ---
+
+
+@lru_cache
+def get_rate_limit_backend() -> str:
+    """Retrieve the rate limiter backend.
+
+    Returns:
+        str: 'local' for an in-process bucket, 'redis' for a cluster-wide bucket.
+
+    Defaults to 'local' if not set.
+
+    """
+    return get_config_value_cached("RATE_LIMIT_BACKEND", "local").lower()
+
+
+@lru_cache
+def get_redis_url() -> str:
+    """Retrieve the Redis connection URL used for distributed rate limiting.
+
+    Returns:
+        str: Redis URL (e.g., 'redis://redis:6379/0').
+
+    Defaults to 'redis://localhost:6379/0' if not set.
+
+    """
+    return get_config_value_cached("REDIS_URL", "redis://localhost:6379/0")
+
+
+@lru_cache
+def get_rate_limit_prefetch() -> int:
+    """Retrieve how many tokens a replica leases from the shared bucket at once.
+
+    Returns:
+        int: Tokens fetched per lease.
+
+    Defaults to 5 if not set.
+
+    """
+    return int(get_config_value_cached("RATE_LIMIT_PREFETCH", "5"))
+
+
+@lru_cache
+def get_rate_limit_member_ttl() -> int:
+    """Retrieve how long a replica counts towards the fair share after its last lease.
+
+    Returns:
+        int: Member heartbeat TTL in seconds.
+
+    Defaults to 30 if not set.
+
+    """
+    return int(get_config_value_cached("RATE_LIMIT_MEMBER_TTL", "30"))
+
+
+@lru_cache
+def get_ip_fill_rate_limit() -> int:
+    """Retrieve the outbound request limit shared by every upstream host.
+
+    Returns:
+        int: Requests per minute for this process (0 = unlimited).
+
+    Defaults to 300 if not set.
+
+    """
+    return int(get_config_value_cached("IP_FILL_RATE_LIMIT", "300"))
+
+
+@lru_cache
+def get_finviz_fill_rate_limit() -> int:
+    """Retrieve the fill rate limit for Finviz.
+
+    Returns:
+        int: Requests per minute.
+
+    Defaults to 30 if not set.
+
+    """
+    return int(get_config_value_cached("FINVIZ_FILL_RATE_LIMIT", "30"))
+
+
+@lru_cache
+def get_stocktwits_fill_rate_limit() -> int:
+    """Retrieve the fill rate limit for Stocktwits.
+
+    Returns:
+        int: Requests per minute.
+
+    Defaults to 60 if not set.
+
+    """
+    return int(get_config_value_cached("STOCKTWITS_FILL_RATE_LIMIT", "60"))
+
+
+@lru_cache
+def get_google_news_fill_rate_limit() -> int:
+    """Retrieve the fill rate limit for Google News RSS.
+
+    Returns:
+        int: Requests per minute.
+
+    Defaults to 60 if not set.
+
+    """
+    return int(get_config_value_cached("GOOGLE_NEWS_FILL_RATE_LIMIT", "60"))
+
+
+@lru_cache
+def get_youtube_fill_rate_limit() -> int:
+    """Retrieve the fill rate limit for the YouTube Data and transcript APIs.
+
+    Returns:
+        int: Requests per minute.
+
+    Defaults to 60 if not set.
+
+    """
+    return int(get_config_value_cached("YOUTUBE_FILL_RATE_LIMIT", "60"))
+
+
+@lru_cache
+def get_newsapi_fill_rate_limit() -> tuple[int, int]:
+    """Retrieve the per-key NewsAPI request limit.
+
+    Returns:
+        Tuple[int, int]: (max requests, window in seconds).
+
+    Defaults to (60, 60) if not set.
+
+    """
+    return (
+        int(get_config_value_cached("NEWSAPI_RATE_LIMIT", "60")),
+        int(get_config_value_cached("NEWSAPI_WINDOW_SECONDS", "60")),
+    )
+
+
+# --- HTTP Client Configuration ---
+
+
+@lru_cache
+def get_http_pool_size() -> int:
+    """Retrieve the number of pooled keep-alive connections per upstream host.
+
+    Returns:
+        int: Connection pool size.
+
+    Defaults to 10 if not set.
+
+    """
+    return int(get_config_value_cached("HTTP_POOL_SIZE", "10"))
+
+
+@lru_cache
+def get_single_flight_enabled() -> bool:
+    """Retrieve whether identical concurrent HTTP requests are coalesced.
+
+    Returns:
+        bool: True if SINGLE_FLIGHT_ENABLED is 'true'.
+
+    Defaults to 'true' if not set.
+
+    """
+    return get_config_value_cached("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
+
+@lru_cache
+def get_http_cache_ttl(source: str) -> float:
+    """Retrieve how long a source's HTTP responses are served from cache.
+
+    Looks up '<SOURCE>_CACHE_TTL' (e.g. YAHOO_CACHE_TTL) first, then the
+    process-wide HTTP_CACHE_TTL. 0 disables caching for the source.
+
+    Args:
+        source (str): Source name (e.g. 'yahoo').
+
+    Returns:
+        float: Freshness in seconds.
+
+    Defaults to 0 if not set.
+
+    """
+    default = get_config_value_cached("HTTP_CACHE_TTL", "0")
+    return float(get_config_value_cached(f"{source.upper()}_CACHE_TTL", default))
+
+
+@lru_cache
+def get_http_cache_stale_seconds() -> float:
+    """Retrieve how long an expired response may be served while it is refreshed.
+
+    Returns:
+        float: Stale-while-revalidate window in seconds.
+
+    Defaults to 30 if not set.
+
+    """
+    return float(get_config_value_cached("HTTP_CACHE_STALE_SECONDS", "30"))
+
+
+@lru_cache
+def get_http_cache_max_bytes() -> int:
+    """Retrieve the memory cap for the HTTP response cache.
+
+    Returns:
+        int: Maximum cached bytes.
+
+    Defaults to 67108864 (64 MiB) if not set.
+
+    """
+    return int(get_config_value_cached("HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+@lru_cache
+def get_http_cache_dir() -> str:
+    """Retrieve the directory backing the HTTP response cache on disk.
+
+    Returns:
+        str: Directory path, or an empty string to keep the cache in memory only.
+
+    Defaults to an empty string if not set.
+
+    """
+    return get_config_value_cached("HTTP_CACHE_DIR", "")
+
+
+@lru_cache
+def get_http_cassette_mode() -> str:
+    """Retrieve the HTTP cassette mode.
+
+    Returns:
+        str: 'record', 'replay', or an empty string for live traffic.
+
+    Defaults to an empty string if not set.
+
+    """
+    return get_config_value_cached("HTTP_CASSETTE_MODE", "").lower()
+
+
+@lru_cache
+def get_http_cassette_path() -> str:
+    """Retrieve the cassette file used in record and replay modes.
+
+    Returns:
+        str: Path to the gzip-compressed NDJSON cassette.
+
+    Defaults to 'cassette.ndjson.gz' if not set.
+
+    """
+    return get_config_value_cached("HTTP_CASSETTE_PATH", "cassette.ndjson.gz")
+
+
+@lru_cache
+def get_http_cassette_latency_ms() -> float:
+    """Retrieve the simulated latency added to each replayed response.
+
+    Returns:
+        float: Latency in milliseconds.
+
+    Defaults to 0 if not set.
+
+    """
+    return float(get_config_value_cached("HTTP_CASSETTE_LATENCY_MS", "0"))
+
+
+@lru_cache
+def get_http_cassette_error_rate() -> float:
+    """Retrieve the share of replayed calls that fail with an injected error.
+
+    Returns:
+        float: Rate between 0 and 1.
+
+    Defaults to 0 if not set.
+
+    """
+    return float(get_config_value_cached("HTTP_CASSETTE_ERROR_RATE", "0"))
+
+
+@lru_cache
+def get_http_cassette_seed() -> str:
+    """Retrieve the random seed for replay error injection.
+
+    Returns:
+        str: Integer seed, or an empty string for a random seed.
+
+    Defaults to an empty string if not set.
+
+    """
+    return get_config_value_cached("HTTP_CASSETTE_SEED", "")
+
+
+@lru_cache
+def get_http_upstream_override() -> str:
+    """Retrieve the base URL that replaces every upstream host (load testing).
+
+    Returns:
+        str: Base URL such as 'http://127.0.0.1:8900', or an empty string.
+
+    Defaults to an empty string if not set.
+
+    """
+    return get_config_value_cached("HTTP_UPSTREAM_OVERRIDE", "")
+
+
+@lru_cache
+def get_memory_broker_max_messages() -> int:
+    """Retrieve how many messages the in-memory broker (QUEUE_TYPE=memory) keeps.
+
+    Returns:
+        int: Retained message count.
+
+    Defaults to 100000 if not set.
+
+    """
+    return int(get_config_value_cached("MEMORY_BROKER_MAX_MESSAGES", "100000"))
+
+
+@lru_cache
+def get_stage_timing_enabled() -> bool:
+    """Retrieve whether per-stage cycle timings are recorded.
+
+    Returns:
+        bool: True if STAGE_TIMING_ENABLED is enabled, else False.
+
+    Defaults to True if not set.
+
+    """
+    return get_config_bool("STAGE_TIMING_ENABLED", True)
+
+
+# --- Sharding Configuration ---
+
+
+@lru_cache
+def get_shard_count() -> int:
+    """Retrieve the number of replicas the symbol universe is split across.
+
+    Returns:
+        int: Total shard count (1 = no sharding).
+
+    Defaults to 1 if not set.
+
+    """
+    return int(get_config_value_cached("SHARD_COUNT", "1"))
+
+
+@lru_cache
+def get_shard_index() -> int:
+    """Retrieve this replica's shard index.
+
+    Falls back to the StatefulSet ordinal at the end of HOSTNAME
+    (e.g. 'sentiment-poller-2' -> 2) when SHARD_INDEX is not set and
+    SHARD_COUNT is greater than 1.
+
+    Returns:
+        int: Shard index in the range [0, SHARD_COUNT).
+
+    Defaults to 0 if neither is set or sharding is off.
+
+    """
+    index = get_config_value_cached("SHARD_INDEX", "")
+    if index:
+        return int(index)
+    if get_shard_count() <= 1:
+        return 0
+    ordinal = ordinal_from_hostname(os.getenv("HOSTNAME", ""))
+    return ordinal if ordinal is not None else 0
+
+
+# --- Scheduler Configuration ---
+
+
+@lru_cache
+def get_source_concurrency(source: str) -> int:
+    """Retrieve how many symbols a source may fetch concurrently.
+
+    Looks up '<SOURCE>_CONCURRENCY' (e.g. FINVIZ_CONCURRENCY) first, then the
+    process-wide SOURCE_CONCURRENCY.
+
+    Args:
+        source (str): Source name (e.g. 'finviz').
+
+    Returns:
+        int: Maximum concurrent fetches for the source.
+
+    Defaults to 1 if not set.
+
+    """
+    default = get_config_value_cached("SOURCE_CONCURRENCY", "1")
+    return max(1, int(get_config_value_cached(f"{source.upper()}_CONCURRENCY", default)))
+
+
+@lru_cache
+def get_dedup_enabled() -> bool:
+    """Retrieve whether already-published items are dropped before publishing.
+
+    Returns:
+        bool: True if DEDUP_ENABLED is enabled, else False.
+
+    Defaults to True if not set.
+
+    """
+    return get_config_bool("DEDUP_ENABLED", True)
+
+
+@lru_cache
+def get_dedup_max_entries() -> int:
+    """Retrieve the maximum number of item keys kept in the dedup index.
+
+    Returns:
+        int: Index capacity; the oldest keys are evicted first.
+
+    Defaults to 100000 if not set.
+
+    """
+    return int(get_config_value_cached("DEDUP_MAX_ENTRIES", "100000"))
+
+
+# --- Symbol Universe Configuration ---
+
+
+@lru_cache
+def get_symbols_file() -> str:
+    """Retrieve the path of a file holding the symbol universe.
+
+    Returns:
+        str: Path to a watched symbol list (e.g. a mounted ConfigMap), or an
+        empty string to read the SYMBOLS config value instead.
+
+    Defaults to '' if not set.
+
+    """
+    return get_config_value_cached("SYMBOLS_FILE", "")
+
+
+@lru_cache
+def get_symbols_reload_seconds() -> float:
+    """Retrieve the minimum interval between checks of the symbol source.
+
+    Returns:
+        float: Seconds between reload checks.
+
+    Defaults to 30 if not set.
+
+    """
+    return float(get_config_value_cached("SYMBOLS_RELOAD_SECONDS", "30"))
+
+
+# --- Message Serialization Configuration ---
+
+
+@lru_cache
+def get_message_format() -> str:
+    """Retrieve the wire format for queue messages.
+
+    Returns:
+        str: 'json' (orjson when installed) or 'msgpack'.
+
+    Defaults to 'json' if not set.
+
+    """
+    return get_config_value_cached("MESSAGE_FORMAT", "json").lower()
+
+
+@lru_cache
+def get_message_compression() -> str:
+    """Retrieve the compression applied to large queue messages.
+
+    Returns:
+        str: 'none' or 'zstd'.
+
+    Defaults to 'none' if not set.
+
+    """
+    return get_config_value_cached("MESSAGE_COMPRESSION", "none").lower()
+
+
+@lru_cache
+def get_message_compression_threshold() -> int:
+    """Retrieve the minimum encoded message size that gets compressed.
+
+    Returns:
+        int: Size threshold in bytes.
+
+    Defaults to 4096 if not set.
+
+    """
+    return int(get_config_value_cached("MESSAGE_COMPRESSION_THRESHOLD", "4096"))
+
+
+# --- Validation & Dead Letter Configuration ---
+
+
+@lru_cache
+def get_validation_enabled() -> bool:
+    """Retrieve whether batches are validated before publishing.
+
+    Returns:
+        bool: True if VALIDATION_ENABLED is enabled, else False.
+
+    Defaults to True if not set.
+
+    """
+    return get_config_bool("VALIDATION_ENABLED", True)
+
+
+@lru_cache
+def get_dead_letter_file() -> str:
+    """Retrieve the file that rejected messages are appended to.
+
+    Returns:
+        str: Path of the newline-delimited JSON dead-letter file.
+
+    Defaults to 'dead_letter.ndjson' if not set.
+
+    """
+    return get_config_value_cached("DEAD_LETTER_FILE", "dead_letter.ndjson")
+
+
+@lru_cache
+def get_dlq_target() -> str:
+    """Retrieve where dead-lettered messages are sent.
+
+    Returns:
+        str: 'queue' to publish to DLQ_NAME on the configured broker (falling
+        back to the dead-letter file if that fails), or 'file'.
+
+    Defaults to 'queue' if not set.
+
+    """
+    return get_config_value_cached("DLQ_TARGET", "queue").lower()
+
+
+@lru_cache
+def get_max_message_bytes() -> int:
+    """Retrieve the largest encoded message body that will be published.
+
+    Returns:
+        int: Maximum body size in bytes; larger messages are dead-lettered.
+
+    Defaults to 262144 (the SQS limit) if not set.
+
+    """
+    return int(get_config_value_cached("MAX_MESSAGE_BYTES", "262144"))
+
+
+# --- Output Sink Configuration ---
+
+
+@lru_cache
+def get_sink_batch_size(sink: str) -> int:
+    """Retrieve the maximum number of messages an output sink writes at once.
+
+    Looks up '<SINK>_BATCH_SIZE' (e.g. S3_BATCH_SIZE) first, then the shared
+    SINK_BATCH_SIZE.
+
+    Args:
+        sink (str): Output mode (e.g. 's3').
+
+    Returns:
+        int: Messages per batch.
+
+    Defaults to 500 if not set.
+
+    """
+    default = get_config_value_cached("SINK_BATCH_SIZE", "500")
+    return max(1, int(get_config_value_cached(f"{sink.upper()}_BATCH_SIZE", default)))
+
+
+@lru_cache
+def get_sink_flush_interval(sink: str) -> float:
+    """Retrieve the maximum time a message waits in an output sink's buffer.
+
+    Looks up '<SINK>_FLUSH_INTERVAL' first, then the shared SINK_FLUSH_INTERVAL.
+
+    Args:
+        sink (str): Output mode (e.g. 'rest').
+
+    Returns:
+        float: Seconds before a partial batch is written.
+
+    Defaults to 5 if not set.
+
+    """
+    default = get_config_value_cached("SINK_FLUSH_INTERVAL", "5")
+    return float(get_config_value_cached(f"{sink.upper()}_FLUSH_INTERVAL", default))
+
+
+@lru_cache
+def get_sink_buffer_size(sink: str) -> int:
+    """Retrieve how many messages an output sink buffers before dropping new ones.
+
+    Looks up '<SINK>_BUFFER_SIZE' first, then the shared SINK_BUFFER_SIZE.
+
+    Args:
+        sink (str): Output mode (e.g. 'database').
+
+    Returns:
+        int: Buffer capacity in messages.
+
+    Defaults to 10000 if not set.
+
+    """
+    default = get_config_value_cached("SINK_BUFFER_SIZE", "10000")
+    return max(1, int(get_config_value_cached(f"{sink.upper()}_BUFFER_SIZE", default)))
+
+
+def clear_config_cache() -> None:
+    """Drop every cached getter value so the next calls read the configuration again."""
+    for value in list(globals().values()):
+        if hasattr(value, "cache_clear"):
+            value.cache_clear()
+
+
+get_vault_snapshot().subscribe(clear_config_cache)
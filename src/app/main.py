@@ -3,55 +3,103 @@
 This application polls sentiment-related sources (e.g., NewsAPI, Finviz, Stocktwits)
 based on the POLLER_TYPE environment variable and sends structured data to
 a message queue for downstream analysis.
+
+POLLER_TYPE may name a single source, a comma-separated list of sources, or
+"all"; more than one source runs them together in one process under a
+shared scheduler.
+
+Metrics, health, readiness and debug stats are served on METRICS_PORT by the
+observability server started before the pollers.
 """
 
+import importlib
 import os
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from app.pollers.poller_benzinga import run_benzinga_poller
-from app.pollers.poller_finviz import run_finviz_poller
-from app.pollers.poller_google_news import run_google_news_poller
-
-# Import poller runners
-from app.pollers.poller_newsapi import run_newsapi_poller
-from app.pollers.poller_seeking_alpha import run_seeking_alpha_poller
-from app.pollers.poller_stocktwits import run_stocktwits_poller
-from app.pollers.poller_yahoo_finance import run_yahoo_poller
-from app.pollers.poller_youtube import run_youtube_poller
 from app.utils.setup_logger import setup_logger
 
-# Optional placeholder or testing stub
-# from app.pollers.poller_reddit import run_reddit_poller
-# from app.pollers.poller_twitter import run_twitter_poller
-
-POLLERS = {
-    "newsapi": run_newsapi_poller,
-    "finviz": run_finviz_poller,
-    "stocktwits": run_stocktwits_poller,
-    "yahoo": run_yahoo_poller,
-    "google_news": run_google_news_poller,
-    "seeking_alpha": run_seeking_alpha_poller,
-    "youtube": run_youtube_poller,
-    "benzinga": run_benzinga_poller,
-    # "reddit": run_reddit_poller,
-    # "twitter": run_twitter_poller,
+if TYPE_CHECKING:
+    from app.pollers.runner import PollerSource
+
+# Poller runners, as (module, runner function). Modules are imported only when
+# selected, so a Stocktwits pod never loads googleapiclient, bs4 or feedparser.
+POLLERS: dict[str, tuple[str, str]] = {
+    "newsapi": ("app.pollers.poller_newsapi", "run_newsapi_poller"),
+    "finviz": ("app.pollers.poller_finviz", "run_finviz_poller"),
+    "stocktwits": ("app.pollers.poller_stocktwits", "run_stocktwits_poller"),
+    "yahoo": ("app.pollers.poller_yahoo_finance", "run_yahoo_poller"),
+    "google_news": ("app.pollers.poller_google_news", "run_google_news_poller"),
+    "seeking_alpha": ("app.pollers.poller_seeking_alpha", "run_seeking_alpha_poller"),
+    "youtube": ("app.pollers.poller_youtube", "run_youtube_poller"),
+    "benzinga": ("app.pollers.poller_benzinga", "run_benzinga_poller"),
+    # "reddit": ("app.pollers.poller_reddit", "run_reddit_poller"),
+    # "twitter": ("app.pollers.poller_twitter", "run_twitter_poller"),
 }
 
+
+def load_runner(poller_type: str) -> Callable[[], None]:
+    """Import and return the runner for a poller type.
+
+    Args:
+        poller_type (str): Key in POLLERS.
+
+    Returns:
+        Callable[[], None]: The poller's main loop.
+
+    """
+    module_name, attr = POLLERS[poller_type]
+    runner: Callable[[], None] = getattr(importlib.import_module(module_name), attr)
+    return runner
+
+
+def load_source(poller_type: str) -> "PollerSource":
+    """Import and return the source description for a poller type.
+
+    Args:
+        poller_type (str): Key in POLLERS.
+
+    Returns:
+        PollerSource: Source used by the multi-source runner.
+
+    """
+    module_name, _ = POLLERS[poller_type]
+    source: PollerSource = importlib.import_module(module_name).SOURCE
+    return source
+
+
 logger = setup_logger("main")
 
 
 def main() -> None:
-    """ """
+    """Start the poller(s) selected by POLLER_TYPE."""
     poller_type = os.getenv("POLLER_TYPE", "").lower()
     logger.info(f"Sentiment data poller starting: type={poller_type}")
 
-    runner = POLLERS.get(poller_type)
-    if runner:
-        runner()
-    else:
+    from app.utils.observability_server import start_observability_server
+
+    start_observability_server()
+
+    # Entries are stripped and empty ones dropped, so "finviz," or "finviz, yahoo" work.
+    poller_types = list(dict.fromkeys(t.strip() for t in poller_type.split(",") if t.strip()))
+    if poller_types == ["all"]:
+        poller_types = list(POLLERS)
+
+    unknown = [t for t in poller_types if t not in POLLERS]
+    if unknown or not poller_types:
         logger.error(
-            f"❌ Unknown POLLER_TYPE: {poller_type}. Available options: {', '.join(POLLERS)}"
+            f"❌ Unknown POLLER_TYPE: {', '.join(unknown) or poller_type}. "
+            f"Available options: {', '.join(POLLERS)}"
         )
+        return
+
+    if len(poller_types) == 1:
+        load_runner(poller_types[0])()
+        return
+
+    from app.pollers.runner import run_sources
 
+    run_sources([load_source(t) for t in poller_types])
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,85 @@
+"""Dead-letter sink for messages that cannot be published.
+
+Rejected messages are appended to a newline-delimited JSON file together with
+the reason they were rejected, so they can be inspected or replayed without
+blocking the main pipeline.
+"""
+
+import datetime
+import json
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from app import config_shared
+from app.records import to_wire
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class FileDeadLetterSink:
+    """Append rejected messages to an NDJSON file."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the sink.
+
+        Args:
+            path (str): File to append to; created on first write.
+
+        """
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        """Return the dead-letter file path."""
+        return self._path
+
+    def write(self, entries: Iterable[tuple[Any, str, str]]) -> int:
+        """Append rejected messages to the file.
+
+        Args:
+            entries (Iterable[tuple[Any, str, str]]): (message, reason, detail)
+                triples; detail is e.g. the failing field or error text.
+
+        Returns:
+            int: Number of entries written; 0 if the file could not be written.
+
+        """
+        failed_at = datetime.datetime.now(datetime.UTC).isoformat()
+        lines = [
+            json.dumps(
+                {
+                    "reason": reason,
+                    "detail": detail,
+                    "failed_at": failed_at,
+                    "payload": to_wire(message),
+                },
+                default=repr,
+            )
+            for message, reason, detail in entries
+        ]
+        if not lines:
+            return 0
+        try:
+            with self._lock, open(self._path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            logger.error(f"❌ Failed to write {len(lines)} dead letters to {self._path}: {e}")
+            return 0
+        return len(lines)
+
+
+_sink: FileDeadLetterSink | None = None
+_sink_lock = threading.Lock()
+
+
+def get_dead_letter_sink() -> FileDeadLetterSink:
+    """Return the process-wide dead-letter file sink."""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = FileDeadLetterSink(config_shared.get_dead_letter_file())
+    return _sink
@@ -0,0 +1,76 @@
+"""In-process broker stand-in used with QUEUE_TYPE=memory.
+
+Published messages are kept, already encoded, in a bounded in-memory queue
+instead of being sent to RabbitMQ or SQS. Load tests and benchmarks use it to
+exercise the full publish path (validation, serialization, dead-lettering)
+without a broker; the oldest messages are discarded once the queue is full.
+"""
+
+import collections
+import threading
+
+from app import config_shared
+from app.message_queue.serializers import EncodedMessage
+
+
+class MemoryBroker:
+    """Bounded, thread-safe store of published messages."""
+
+    def __init__(self, max_messages: int = 100000) -> None:
+        """Initialize an empty broker.
+
+        Args:
+            max_messages (int): Messages retained; older ones are discarded.
+
+        """
+        self._lock = threading.Lock()
+        self._messages: collections.deque[EncodedMessage] = collections.deque(
+            maxlen=max(1, max_messages)
+        )
+        self.published = 0
+        self.published_bytes = 0
+
+    def publish(self, encoded: EncodedMessage) -> None:
+        """Store one published message.
+
+        Args:
+            encoded (EncodedMessage): Serialized message.
+
+        """
+        with self._lock:
+            self._messages.append(encoded)
+            self.published += 1
+            self.published_bytes += len(encoded.body)
+
+    def drain(self) -> list[EncodedMessage]:
+        """Remove and return every retained message, oldest first.
+
+        Returns:
+            list[EncodedMessage]: Retained messages.
+
+        """
+        with self._lock:
+            messages = list(self._messages)
+            self._messages.clear()
+        return messages
+
+    def reset(self) -> None:
+        """Discard retained messages and zero the counters."""
+        with self._lock:
+            self._messages.clear()
+            self.published = 0
+            self.published_bytes = 0
+
+
+_broker: MemoryBroker | None = None
+_broker_lock = threading.Lock()
+
+
+def get_memory_broker() -> MemoryBroker:
+    """Return the process-wide in-memory broker."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = MemoryBroker(config_shared.get_memory_broker_max_messages())
+    return _broker
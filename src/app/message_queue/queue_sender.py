@@ -1,13 +1,54 @@
-"""Module to publish processed analysis data to RabbitMQ or AWS SQS."""
+"""Module to publish processed analysis data to RabbitMQ or AWS SQS.
 
+QUEUE_TYPE=memory publishes to an in-process broker stand-in instead, for
+load tests and benchmarks.
+
+The broker client libraries (pika, boto3) are imported on first publish so
+that importing this module stays cheap. Message bodies are produced by the
+configured serializer and their content type and encoding are sent as AMQP
+properties or SQS message attributes. Messages that can never be published
+(invalid, unserializable or oversize) are sent with error metadata to the
+dead-letter queue (DLQ_NAME) or a local file. A broker that fails a publish
+is a transient condition: the batch stops there and the unsent messages are
+handed back in a :class:`QueueUnavailableError` so the caller can retry them.
+A circuit breaker per queue type stops publishing to a broker that keeps
+failing; while it is open the unsent messages are handed back with the time
+left until the next probe, so the queue sink backs off and keeps its buffer
+until the broker recovers instead of dead-lettering healthy messages.
+The first message accepted by the broker marks the service ready.
+
+Validation, serialization and broker publishing are timed per batch as the
+``validate``, ``serialize`` and ``publish`` stages of ``sink:<QUEUE_TYPE>``;
+batches mix sources once buffered, so they are not attributed per source.
+"""
+
+import base64
+import datetime
 import json
 import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
-import boto3
-import pika
-from botocore.exceptions import BotoCoreError, NoCredentialsError
-
+from app import config_shared
+from app.message_queue.dead_letter import get_dead_letter_sink
+from app.message_queue.serializers import (
+    BASE64_ENCODING,
+    JSON_CONTENT_TYPE,
+    EncodedMessage,
+    get_serializer,
+)
+from app.records import Payload, SentimentMessage, to_wire
+from app.utils.batch_validation import validate_batch
+from app.utils.circuit_breaker import OPEN, CircuitBreaker, get_circuit_breaker
+from app.utils.healthcheck import set_ready
+from app.utils.metrics import record_dead_letter_metrics, record_queue_metrics
 from app.utils.setup_logger import setup_logger
+from app.utils.stage_timer import record_stage, stage
+
+if TYPE_CHECKING:
+    from pika import BlockingConnection
+    from pika.adapters.blocking_connection import BlockingChannel
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -27,115 +68,451 @@ RABBITMQ_PASSWORD = os.getenv("RABBITMQ_PASSWORD", "guest")
 SQS_QUEUE_URL = os.getenv("SQS_QUEUE_URL", "")
 SQS_REGION = os.getenv("SQS_REGION", "us-east-1")
 
-# Initialize SQS client if needed
-sqs_client = None
-if QUEUE_TYPE == "sqs":
-    try:
-        sqs_client = boto3.client("sqs", region_name=SQS_REGION)
-        logger.info(f"SQS client initialized for region {SQS_REGION}")
-    except (BotoCoreError, NoCredentialsError) as e:
-        logger.error("Failed to initialize SQS client: %s", e)
-        sqs_client = None
+# SQS client, created on first use
+sqs_client: Any = None
+_sqs_initialized = False
+
+# A single RabbitMQ connection is shared by every poller in the process.
+# pika's BlockingConnection is not thread-safe, so publishes are serialized.
+_rabbitmq_connection: "BlockingConnection | None" = None
+_rabbitmq_channel: "BlockingChannel | None" = None
+_publish_lock = threading.Lock()
+
+# Dead-letter queue state: whether the RabbitMQ DLQ was declared, and the
+# resolved SQS DLQ URL.
+_dlq_declared = False
+_dlq_url: str | None = None
+
+# (message, reason, detail) for a message that could not be published.
+DeadLetter = tuple[Any, str, str]
+
+
+class QueueUnavailableError(RuntimeError):
+    """Raised when the broker fails a publish; the unsent messages should be retried."""
+
+    def __init__(self, message: str, unsent: list[Payload], retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            message (str): Error description.
+            unsent (list[Payload]): Messages not published, in their original order.
+            retry_after (float): Seconds to wait before publishing them again.
 
+        """
+        super().__init__(message)
+        self.unsent = unsent
+        self.retry_after = retry_after
 
-def publish_to_queue(payload: list[dict]) -> None:
+
+def publish_to_queue(payload: list[Payload]) -> None:
     """Publishes a list of messages to the configured message queue.
 
+    Safe to call from several pollers at once; publishes are serialized over
+    the shared connection. Messages that fail validation, cannot be
+    serialized or exceed MAX_MESSAGE_BYTES are dead-lettered instead, so one
+    bad item never blocks the batch.
+
     Args:
-    ----
-      payload(list[dict]): List of JSON-serializable dictionaries.
-      payload: list[dict]:
-      payload: list[dict]:
-
-    :param payload: list[dict]:
-    :param payload: list[dict]:
-    :param payload: list[dict]:
-    :param payload: type payload: list[dict] :
-    :param payload: type payload: list[dict] :
-    :param payload: list[dict]:
-    :param payload: list[dict]:
-    :param payload: list[dict]:
-    :param payload: list[dict]:
+        payload (list[Payload]): Messages, as records or JSON-serializable dicts.
+
+    Raises:
+        QueueUnavailableError: If the broker failed a publish or its circuit
+            is open. Messages from that one on were neither published nor
+            dead-lettered.
 
     """
-    for message in payload:
-        if QUEUE_TYPE == "rabbitmq":
-            _send_to_rabbitmq(message)
-        elif QUEUE_TYPE == "sqs":
-            _send_to_sqs(message)
-        else:
-            logger.error("Invalid QUEUE_TYPE specified. Use 'rabbitmq' or 'sqs'.")
+    rejected: list[DeadLetter] = []
+    stage_source = f"sink:{QUEUE_TYPE}"
+    if config_shared.get_validation_enabled():
+        with stage(stage_source, "validate"):
+            result = validate_batch(payload)
+        if result.invalid:
+            logger.warning(
+                f"⚠️ {len(result.invalid)} of {len(payload)} messages failed validation: "
+                f"{result.field_errors}"
+            )
+            rejected.extend(
+                (message, "schema_invalid", field) for message, field in result.invalid
+            )
+        payload = result.valid
+
+    serializer = get_serializer()
+    max_bytes = config_shared.get_max_message_bytes()
+    breaker = get_circuit_breaker(f"sink:{QUEUE_TYPE}")
+    serialize_time = publish_time = 0.0
+    unavailable: QueueUnavailableError | None = None
+    with _publish_lock:
+        for position, message in enumerate(payload):
+            start = time.perf_counter()
+            try:
+                encoded = serializer.encode(message)
+            except (TypeError, ValueError) as e:
+                rejected.append((message, "unserializable", str(e)))
+                continue
+            finally:
+                serialize_time += time.perf_counter() - start
+            if len(encoded.body) > max_bytes:
+                rejected.append((message, "oversize", f"{len(encoded.body)} bytes"))
+                continue
 
+            if QUEUE_TYPE not in ("rabbitmq", "sqs", "memory"):
+                logger.error("Invalid QUEUE_TYPE specified. Use 'rabbitmq', 'sqs' or 'memory'.")
+                continue
+            if not breaker.allow():
+                unavailable = QueueUnavailableError(
+                    f"circuit open for {breaker.name}", payload[position:], _backoff(breaker)
+                )
+                break
+            start = time.perf_counter()
+            if QUEUE_TYPE == "rabbitmq":
+                error = _send_to_rabbitmq(encoded)
+            elif QUEUE_TYPE == "sqs":
+                error = _send_to_sqs(encoded)
+            else:
+                error = _send_to_memory(encoded)
+            duration = time.perf_counter() - start
+            publish_time += duration
+            if error is not None:
+                breaker.record_failure()
+                record_queue_metrics(QUEUE_TYPE, "failure", duration)
+                unavailable = QueueUnavailableError(error, payload[position:], _backoff(breaker))
+                break
+            else:
+                breaker.record_success()
+                record_queue_metrics(QUEUE_TYPE, "success", duration)
+                set_ready()
 
-def _send_to_rabbitmq(data: dict) -> None:
-    """Helper to send a message to RabbitMQ.
+        if payload:
+            record_stage(stage_source, "serialize", serialize_time)
+            record_stage(stage_source, "publish", publish_time)
+        if rejected:
+            _dead_letter(rejected)
+    if unavailable is not None:
+        raise unavailable
+
+
+def _backoff(breaker: CircuitBreaker) -> float:
+    """Return how long to wait before publishing to the broker again.
 
     Args:
-    ----
-      data: dict:
-      data: dict:
-
-    :param data: dict:
-    :param data: dict:
-    :param data: dict:
-    :param data: type data: dict :
-    :param data: type data: dict :
-    :param data: dict:
-    :param data: dict:
-    :param data: dict:
-    :param data: dict:
+        breaker (CircuitBreaker): The broker's circuit breaker.
+
+    Returns:
+        float: Time left until the breaker allows a probe if it is open,
+            otherwise the circuit reset timeout.
 
     """
-    try:
+    return breaker.retry_after() or config_shared.get_circuit_reset_seconds()
+
+
+def _get_sqs_client() -> Any:
+    """Return the SQS client, creating it on first use.
+
+    Returns:
+        Any: A boto3 SQS client, or None if it could not be initialized.
+
+    """
+    global sqs_client, _sqs_initialized
+    if not _sqs_initialized:
+        _sqs_initialized = True
+        import boto3
+        from botocore.exceptions import BotoCoreError, NoCredentialsError
+
+        try:
+            sqs_client = boto3.client("sqs", region_name=SQS_REGION)
+            logger.info(f"SQS client initialized for region {SQS_REGION}")
+        except (BotoCoreError, NoCredentialsError) as e:
+            logger.error("Failed to initialize SQS client: %s", e)
+            sqs_client = None
+    return sqs_client
+
+
+def _get_rabbitmq_channel() -> "BlockingChannel":
+    """Return the shared RabbitMQ channel, connecting if necessary."""
+    global _rabbitmq_connection, _rabbitmq_channel
+    if _rabbitmq_channel is None or not _rabbitmq_channel.is_open:
+        import pika
+
+        _close_rabbitmq()
         credentials = pika.PlainCredentials(RABBITMQ_USER, RABBITMQ_PASSWORD)
-        connection = pika.BlockingConnection(
+        _rabbitmq_connection = pika.BlockingConnection(
             pika.ConnectionParameters(
                 host=RABBITMQ_HOST,
                 virtual_host=RABBITMQ_VHOST,
                 credentials=credentials,
             )
         )
-        channel = connection.channel()
+        _rabbitmq_channel = _rabbitmq_connection.channel()
+        logger.info("Connected to RabbitMQ at %s", RABBITMQ_HOST)
+    return _rabbitmq_channel
 
-        channel.basic_publish(
-            exchange=RABBITMQ_EXCHANGE,
-            routing_key=RABBITMQ_ROUTING_KEY,
-            body=json.dumps(data),
-        )
-        connection.close()
-        logger.info("Published message to RabbitMQ")
-    except Exception as e:
-        logger.error("Failed to publish message to RabbitMQ: %s", e)
 
+def _close_rabbitmq() -> None:
+    """Close the shared RabbitMQ connection, ignoring errors."""
+    global _rabbitmq_connection, _rabbitmq_channel
+    if _rabbitmq_connection is not None:
+        try:
+            _rabbitmq_connection.close()
+        except Exception as e:  # noqa: BLE001 - a broken connection may fail to close in any way
+            logger.debug("Ignoring error while closing RabbitMQ connection: %s", e)
+    _rabbitmq_connection = None
+    _rabbitmq_channel = None
+
+
+def _send_to_rabbitmq(encoded: EncodedMessage) -> str | None:
+    """Helper to send a message to RabbitMQ over the shared connection.
+
+    A stale connection (e.g. dropped after an idle period) is reopened and
+    the publish retried once.
+
+    Args:
+        encoded (EncodedMessage): Serialized message.
+
+    Returns:
+        str | None: Error description if the publish failed, else None.
+
+    """
+    import pika
+
+    properties = pika.BasicProperties(
+        content_type=encoded.content_type,
+        content_encoding=encoded.content_encoding,
+    )
+    for attempt in (1, 2):
+        try:
+            channel = _get_rabbitmq_channel()
+            channel.basic_publish(
+                exchange=RABBITMQ_EXCHANGE,
+                routing_key=RABBITMQ_ROUTING_KEY,
+                body=encoded.body,
+                properties=properties,
+            )
+            logger.debug("Published message to RabbitMQ")
+            return None
+        except Exception as e:
+            _close_rabbitmq()
+            if attempt == 2:
+                logger.error("Failed to publish message to RabbitMQ: %s", e)
+                return str(e)
+    return None
+
+
+def _sqs_body(encoded: EncodedMessage) -> tuple[str, dict[str, Any]]:
+    """Convert an encoded message to an SQS body and message attributes.
+
+    SQS bodies must be text, so binary bodies (MessagePack or compressed) are
+    base64-encoded and 'base64' is appended to the declared encoding.
+
+    Args:
+        encoded (EncodedMessage): Serialized message.
+
+    Returns:
+        tuple[str, dict[str, Any]]: Message body and MessageAttributes.
 
-def _send_to_sqs(data: dict) -> None:
+    """
+    encoding = encoded.content_encoding
+    if encoded.content_type == JSON_CONTENT_TYPE and encoding is None:
+        body = encoded.body.decode("utf-8")
+    else:
+        body = base64.b64encode(encoded.body).decode("ascii")
+        encoding = f"{encoding},{BASE64_ENCODING}" if encoding else BASE64_ENCODING
+
+    attributes = {"ContentType": {"DataType": "String", "StringValue": encoded.content_type}}
+    if encoding:
+        attributes["ContentEncoding"] = {"DataType": "String", "StringValue": encoding}
+    return body, attributes
+
+
+def _send_to_sqs(encoded: EncodedMessage) -> str | None:
     """Helper to send a message to AWS SQS.
 
     Args:
-    ----
-      data: dict:
-      data: dict:
-
-    :param data: dict:
-    :param data: dict:
-    :param data: dict:
-    :param data: type data: dict :
-    :param data: type data: dict :
-    :param data: dict:
-    :param data: dict:
-    :param data: dict:
-    :param data: dict:
+        encoded (EncodedMessage): Serialized message.
+
+    Returns:
+        str | None: Error description if the publish failed, else None.
 
     """
-    if not sqs_client or not SQS_QUEUE_URL:
+    client = _get_sqs_client()
+    if not client or not SQS_QUEUE_URL:
         logger.error("SQS client is not initialized or missing SQS_QUEUE_URL")
-        return
+        return "SQS client is not initialized or missing SQS_QUEUE_URL"
 
     try:
-        response = sqs_client.send_message(
+        body, attributes = _sqs_body(encoded)
+        response = client.send_message(
             QueueUrl=SQS_QUEUE_URL,
-            MessageBody=json.dumps(data),
+            MessageBody=body,
+            MessageAttributes=attributes,
         )
         logger.info("Published message to SQS, MessageId: %s", response["MessageId"])
+        return None
     except Exception as e:
         logger.error("Failed to publish message to SQS: %s", e)
+        return str(e)
+
+
+def _send_to_memory(encoded: EncodedMessage) -> str | None:
+    """Helper to publish a message to the in-process broker.
+
+    Args:
+        encoded (EncodedMessage): Serialized message.
+
+    Returns:
+        str | None: Always None; the in-memory broker cannot fail.
+
+    """
+    from app.message_queue.memory_broker import get_memory_broker
+
+    get_memory_broker().publish(encoded)
+    return None
+
+
+def _dead_letter_body(message: Any) -> EncodedMessage:
+    """Encode a dead-lettered message, falling back to lenient JSON."""
+    try:
+        return get_serializer().encode(message)
+    except (TypeError, ValueError):
+        body = json.dumps(to_wire(message), default=repr).encode("utf-8")
+        return EncodedMessage(body, JSON_CONTENT_TYPE)
+
+
+def _message_source(message: Any) -> str:
+    """Return the source a message came from, or '' if it has none."""
+    if isinstance(message, SentimentMessage):
+        return message.source
+    if isinstance(message, dict):
+        return str(message.get("source") or "")
+    return ""
+
+
+def _dead_letter_metadata(message: Any, reason: str, detail: str, attempt: int) -> dict[str, str]:
+    """Return the error metadata attached to a dead-lettered message.
+
+    Args:
+        message (Any): The rejected message.
+        reason (str): Why it was rejected.
+        detail (str): The failing field or error text.
+        attempt (int): 1-based attempt at publishing the dead letter; a
+            consumer seeing attempt 2 may also have received attempt 1.
+
+    Returns:
+        dict[str, str]: Header name to value.
+
+    """
+    return {
+        "x-dead-letter-reason": reason,
+        "x-dead-letter-detail": detail[:1024],
+        "x-dead-letter-source": _message_source(message),
+        "x-dead-letter-attempt": str(attempt),
+        "x-dead-letter-failed-at": datetime.datetime.now(datetime.UTC).isoformat(),
+        "x-original-routing-key": RABBITMQ_ROUTING_KEY if QUEUE_TYPE == "rabbitmq" else "",
+    }
+
+
+def _send_dead_letter_to_rabbitmq(message: Any, reason: str, detail: str) -> bool:
+    """Publish one dead letter to the DLQ via the default exchange.
+
+    Like regular publishes, a stale connection is reopened and the publish
+    retried once.
+
+    Returns:
+        bool: True if the message was published.
+
+    """
+    global _dlq_declared
+    import pika
+
+    encoded = _dead_letter_body(message)
+    for attempt in (1, 2):
+        try:
+            channel = _get_rabbitmq_channel()
+            dlq_name = config_shared.get_dlq_name()
+            if not _dlq_declared:
+                channel.queue_declare(queue=dlq_name, durable=True)
+                _dlq_declared = True
+            channel.basic_publish(
+                exchange="",
+                routing_key=dlq_name,
+                body=encoded.body,
+                properties=pika.BasicProperties(
+                    content_type=encoded.content_type,
+                    content_encoding=encoded.content_encoding,
+                    headers=_dead_letter_metadata(message, reason, detail, attempt),
+                    delivery_mode=2,
+                ),
+            )
+            return True
+        except Exception as e:  # noqa: BLE001 - fall back to the dead-letter file on any error
+            _close_rabbitmq()
+            if attempt == 2:
+                logger.warning("Failed to publish dead letter to RabbitMQ: %s", e)
+    return False
+
+
+def _get_dlq_url(client: Any) -> str:
+    """Resolve and cache the SQS URL of the DLQ."""
+    global _dlq_url
+    if _dlq_url is None:
+        _dlq_url = client.get_queue_url(QueueName=config_shared.get_dlq_name())["QueueUrl"]
+    return _dlq_url
+
+
+def _send_dead_letter_to_sqs(message: Any, reason: str, detail: str) -> bool:
+    """Send one dead letter to the SQS DLQ.
+
+    Returns:
+        bool: True if the message was sent.
+
+    """
+    client = _get_sqs_client()
+    if not client:
+        return False
+    try:
+        body, attributes = _sqs_body(_dead_letter_body(message))
+        for key, value in _dead_letter_metadata(message, reason, detail, 1).items():
+            # SQS attribute names allow letters, digits, '-', '_' and '.'.
+            if value:
+                attributes[key] = {"DataType": "String", "StringValue": value}
+        client.send_message(
+            QueueUrl=_get_dlq_url(client), MessageBody=body, MessageAttributes=attributes
+        )
+        return True
+    except Exception as e:  # noqa: BLE001 - fall back to the dead-letter file on any error
+        logger.warning("Failed to send dead letter to SQS: %s", e)
+        return False
+
+
+def _dead_letter(entries: list[DeadLetter]) -> None:
+    """Route rejected messages to the DLQ, or to the dead-letter file.
+
+    With DLQ_TARGET=queue, messages go to DLQ_NAME on the configured broker;
+    oversize messages, any the DLQ does not accept, and everything while the
+    broker's circuit is open are written to the dead-letter file instead.
+    The caller must hold ``_publish_lock``.
+
+    Args:
+        entries (list[DeadLetter]): (message, reason, detail) triples.
+
+    """
+    to_file: list[DeadLetter] = []
+    use_queue = (
+        config_shared.get_dlq_target() == "queue"
+        and get_circuit_breaker(f"sink:{QUEUE_TYPE}").state != OPEN
+    )
+    for message, reason, detail in entries:
+        sent = False
+        if use_queue and reason != "oversize":
+            if QUEUE_TYPE == "rabbitmq":
+                sent = _send_dead_letter_to_rabbitmq(message, reason, detail)
+            elif QUEUE_TYPE == "sqs":
+                sent = _send_dead_letter_to_sqs(message, reason, detail)
+        if sent:
+            record_dead_letter_metrics(reason, QUEUE_TYPE)
+        else:
+            to_file.append((message, reason, detail))
+
+    if to_file and get_dead_letter_sink().write(to_file):
+        for _, reason, _ in to_file:
+            record_dead_letter_metrics(reason, "file")
+    logger.warning(f"⚠️ Dead-lettered {len(entries)} messages")
@@ -0,0 +1,201 @@
+"""Message serialization for queue publishing.
+
+Messages are encoded as JSON (orjson when installed, else the stdlib) or as
+MessagePack, and optionally wrapped in a zstd frame when the encoded body is
+larger than a threshold. The resulting content type and encoding travel with
+the message (AMQP properties or SQS message attributes) so consumers can
+decode with :func:`decode_message`. SQS bodies are text, so binary bodies are
+also base64-encoded there and the encoding is declared as e.g. 'zstd,base64'.
+
+orjson, msgpack and zstandard ship in the image (requirements.txt) and the
+``serialization`` extra. They stay optional imports: without orjson the
+stdlib encoder is used, and selecting msgpack or zstd without the package
+installed raises at startup rather than on the first publish.
+"""
+
+import base64
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app import config_shared
+from app.records import to_wire
+
+# Declared Any so the None fallback type-checks whether or not orjson is installed.
+orjson: Any
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+ZSTD_ENCODING = "zstd"
+BASE64_ENCODING = "base64"
+
+
+@dataclass(frozen=True)
+class EncodedMessage:
+    """A serialized message body and how to decode it."""
+
+    body: bytes
+    content_type: str
+    content_encoding: str | None = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(obj)
+        return encoded
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _msgpack() -> Any:
+    """Import msgpack, raising a clear error if it is not installed."""
+    try:
+        import msgpack
+    except ImportError as e:
+        raise RuntimeError("MESSAGE_FORMAT=msgpack requires the 'msgpack' package") from e
+    return msgpack
+
+
+def _zstandard() -> Any:
+    """Import zstandard, raising a clear error if it is not installed."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError("MESSAGE_COMPRESSION=zstd requires the 'zstandard' package") from e
+    return zstandard
+
+
+class MessageSerializer:
+    """Encode messages in one format with optional zstd compression."""
+
+    def __init__(
+        self,
+        message_format: str = "json",
+        compression: str = "none",
+        compression_threshold: int = 4096,
+        compression_level: int = 3,
+    ) -> None:
+        """Initialize the serializer.
+
+        Args:
+            message_format (str): 'json' or 'msgpack'.
+            compression (str): 'none' or 'zstd'.
+            compression_threshold (int): Minimum encoded size in bytes before
+                a body is compressed.
+            compression_level (int): zstd compression level.
+
+        Raises:
+            ValueError: If the format or compression is not supported.
+            RuntimeError: If the package for the selected option is missing.
+
+        """
+        self._dumps: Callable[[Any], bytes]
+        if message_format == "json":
+            self._dumps = _json_dumps
+            self.content_type = JSON_CONTENT_TYPE
+        elif message_format == "msgpack":
+            self._dumps = _msgpack().packb
+            self.content_type = MSGPACK_CONTENT_TYPE
+        else:
+            raise ValueError(f"Unsupported message format: {message_format}")
+
+        if compression not in ("none", ZSTD_ENCODING):
+            raise ValueError(f"Unsupported message compression: {compression}")
+        self._zstd = _zstandard() if compression == ZSTD_ENCODING else None
+        self._threshold = compression_threshold
+        self._level = compression_level
+        # zstd compressors are not safe for concurrent use; keep one per thread.
+        self._local = threading.local()
+
+    def _compress(self, zstd: Any, body: bytes) -> bytes:
+        """Compress ``body`` with this thread's zstd compressor."""
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = zstd.ZstdCompressor(level=self._level)
+            self._local.compressor = compressor
+        compressed: bytes = compressor.compress(body)
+        return compressed
+
+    def encode(self, message: Any) -> EncodedMessage:
+        """Serialize a message, compressing it if it is large enough.
+
+        Args:
+            message (Any): Message to serialize; records are converted with
+                their ``to_wire()`` form.
+
+        Returns:
+            EncodedMessage: Body with its content type and encoding.
+
+        """
+        body = self._dumps(to_wire(message))
+        if self._zstd is not None and len(body) >= self._threshold:
+            compressed = self._compress(self._zstd, body)
+            return EncodedMessage(compressed, self.content_type, ZSTD_ENCODING)
+        return EncodedMessage(body, self.content_type)
+
+
+def decode_message(
+    body: bytes | str, content_type: str | None, content_encoding: str | None
+) -> Any:
+    """Decode a message produced by :class:`MessageSerializer`.
+
+    Args:
+        body (bytes | str): Message body; SQS message bodies may be passed as
+            the received string.
+        content_type (str | None): Declared content type; JSON if missing.
+        content_encoding (str | None): Declared encodings in the order they
+            were applied, e.g. 'zstd' or 'zstd,base64'.
+
+    Returns:
+        Any: The decoded message.
+
+    Raises:
+        ValueError: If the content type or encoding is not supported.
+
+    """
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    encodings = [e.strip() for e in (content_encoding or "").split(",") if e.strip()]
+    for encoding in reversed(encodings):
+        if encoding == BASE64_ENCODING:
+            data = base64.b64decode(data)
+        elif encoding == ZSTD_ENCODING:
+            data = _zstandard().ZstdDecompressor().decompress(data)
+        else:
+            raise ValueError(f"Unsupported content encoding: {content_encoding}")
+
+    if content_type in (None, JSON_CONTENT_TYPE):
+        return _json_loads(data)
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return _msgpack().unpackb(data)
+    raise ValueError(f"Unsupported content type: {content_type}")
+
+
+_serializer: MessageSerializer | None = None
+_serializer_lock = threading.Lock()
+
+
+def get_serializer() -> MessageSerializer:
+    """Return the process-wide serializer configured from MESSAGE_* settings."""
+    global _serializer
+    if _serializer is None:
+        with _serializer_lock:
+            if _serializer is None:
+                _serializer = MessageSerializer(
+                    message_format=config_shared.get_message_format(),
+                    compression=config_shared.get_message_compression(),
+                    compression_threshold=config_shared.get_message_compression_threshold(),
+                )
+    return _serializer
@@ -0,0 +1,6 @@
+"""Output sinks for sentiment data poller.
+
+This package fans each batch of messages out to every configured output
+(queue, log, stdout, REST, S3, database). Each sink buffers and batches on
+its own worker thread, so a slow or failing sink does not hold up the others.
+"""
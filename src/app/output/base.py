@@ -0,0 +1,313 @@
+"""Base class for buffered output sinks.
+
+Every sink owns a bounded buffer and a worker thread. ``submit`` queues
+messages for the worker, which writes them in batches of up to ``batch_size``
+or after ``flush_interval`` seconds, whichever comes first. By default a full
+buffer drops new messages rather than slowing the pollers; a sink that must
+not lose messages sets ``block_when_full`` and ``submit`` waits for room
+instead, so back-pressure reaches the pollers. An exception from one batch is
+logged and counted without stopping the sink.
+
+A destination that is only temporarily unavailable raises
+:class:`SinkUnavailableError` instead: the worker keeps the undelivered
+messages, waits ``retry_after`` seconds and writes them again, taking nothing
+new from the buffer in the meantime. At shutdown each held batch gets one
+last attempt.
+
+The first successfully written batch marks the service ready (``/ready``),
+unless the sink sets ``signals_ready`` to False and reports readiness itself.
+Listeners added with ``add_listener`` are told which messages were delivered
+and which were dropped or failed, e.g. so the dedup index only remembers
+items that actually went out.
+
+Subclasses that need periodic work while idle (e.g. rolling files by age) set
+``tick_interval`` and override ``on_tick``; ``on_close`` runs on the worker
+thread after the final batch.
+"""
+
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+
+from app.records import Payload
+from app.utils.healthcheck import set_ready
+from app.utils.metrics import record_sink_metrics
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Control items placed on a sink's buffer alongside messages: flush markers
+# are Events the worker sets, and this one stops the worker instead.
+_STOP = threading.Event()
+
+# Callback told which messages a sink delivered (True) or gave up on (False).
+DeliveryListener = Callable[[list[Payload], bool], None]
+
+
+class SinkUnavailableError(Exception):
+    """Raised by ``write_batch`` when the destination is temporarily unavailable."""
+
+    def __init__(self, message: str, pending: list[Payload], retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            message (str): Error description.
+            pending (list[Payload]): Messages not yet written, to be retried.
+            retry_after (float): Seconds to wait before writing them again.
+
+        """
+        super().__init__(message)
+        self.pending = pending
+        self.retry_after = retry_after
+
+
+class BufferedSink(ABC):
+    """Output sink with its own buffer, batching and worker thread."""
+
+    # Seconds between on_tick calls; None disables ticking.
+    tick_interval: float | None = None
+
+    # Whether a successful write_batch marks the service ready.
+    signals_ready: bool = True
+
+    # Whether submit waits for buffer space instead of dropping messages.
+    block_when_full: bool = False
+
+    def __init__(
+        self,
+        name: str,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        buffer_size: int = 10000,
+    ) -> None:
+        """Initialize the sink and start its worker thread.
+
+        Args:
+            name (str): Sink name, used as the metric label.
+            batch_size (int): Maximum messages per ``write_batch`` call.
+            flush_interval (float): Maximum seconds a message waits in the buffer.
+            buffer_size (int): Maximum buffered messages before new ones are
+                dropped or, with ``block_when_full``, ``submit`` waits.
+
+        """
+        self.name = name
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._buffer: queue.Queue[Payload | threading.Event] = queue.Queue(maxsize=buffer_size)
+        self._dropped = 0
+        self._closing = threading.Event()
+        self._listeners: list[DeliveryListener] = []
+        self._thread = threading.Thread(target=self._run, name=f"sink-{name}", daemon=True)
+        self._thread.start()
+
+    @abstractmethod
+    def write_batch(self, batch: list[Payload]) -> None:
+        """Write one batch to the destination.
+
+        Args:
+            batch (list[Payload]): Messages to write.
+
+        Raises:
+            SinkUnavailableError: If the destination is temporarily down; its
+                pending messages are retried.
+            Exception: Any other error; the batch is counted as failed.
+
+        """
+
+    def add_listener(self, listener: DeliveryListener) -> None:
+        """Register a callback told about delivered and lost messages.
+
+        Listeners are called on the sink's worker (or request) threads, once
+        per written, failed or dropped batch.
+
+        Args:
+            listener (DeliveryListener): Callback taking the messages and
+                whether they were delivered.
+
+        """
+        self._listeners.append(listener)
+
+    def submit(self, messages: Iterable[Payload]) -> int:
+        """Queue messages for this sink.
+
+        Returns at once unless the buffer is full and the sink blocks when
+        full, in which case it waits until the worker makes room.
+
+        Args:
+            messages (Iterable[Payload]): Messages to write.
+
+        Returns:
+            int: Number of messages dropped because the buffer was full.
+
+        """
+        dropped: list[Payload] = []
+        for message in messages:
+            if self.block_when_full:
+                self._buffer.put(message)
+                continue
+            try:
+                self._buffer.put_nowait(message)
+            except queue.Full:
+                dropped.append(message)
+        if dropped:
+            self._dropped += len(dropped)
+            logger.warning(f"⚠️ {self.name} sink buffer full; dropped {len(dropped)} messages")
+            record_sink_metrics(self.name, "dropped", 0.0, failed=True)
+            self._notify(dropped, False)
+        return len(dropped)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything submitted so far has been written.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the buffer drained in time.
+
+        """
+        done = threading.Event()
+        try:
+            self._buffer.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Write any buffered messages and stop the worker thread.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait for the worker.
+
+        """
+        self._closing.set()
+        try:
+            self._buffer.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning(f"⚠️ {self.name} sink did not drain before shutdown")
+            return
+        self._thread.join(timeout)
+
+    def on_tick(self) -> None:
+        """Run periodic work on the worker thread; no-op by default."""
+
+    def on_close(self) -> None:
+        """Release resources on the worker thread at shutdown; no-op by default."""
+
+    def _notify(self, batch: list[Payload], delivered: bool) -> None:
+        """Tell every listener the outcome of a batch, isolating their errors."""
+        for listener in self._listeners:
+            try:
+                listener(batch, delivered)
+            except Exception as e:  # noqa: BLE001 - a listener must not stop the sink
+                logger.error(f"❌ {self.name} sink delivery listener failed: {e}")
+
+    def _deliver(self, batch: list[Payload]) -> None:
+        """Write a batch, waiting out and retrying an unavailable destination."""
+        while True:
+            unavailable = self._write(batch)
+            if unavailable is None:
+                return
+            batch = unavailable.pending
+            if self._closing.is_set():
+                logger.error(
+                    f"❌ {self.name} sink still unavailable at shutdown; "
+                    f"{len(batch)} messages not written"
+                )
+                self._notify(batch, False)
+                return
+            logger.warning(
+                f"⏸️ {self.name} sink unavailable ({unavailable}); retrying "
+                f"{len(batch)} messages in {unavailable.retry_after:.1f}s"
+            )
+            self._closing.wait(unavailable.retry_after)
+
+    def _write(self, batch: list[Payload]) -> SinkUnavailableError | None:
+        """Write a batch, isolating and recording failures.
+
+        Returns:
+            SinkUnavailableError | None: The error if the messages should be
+                retried, else None.
+
+        """
+        start = time.perf_counter()
+        try:
+            self.write_batch(batch)
+        except SinkUnavailableError as e:
+            record_sink_metrics(
+                self.name,
+                "unavailable",
+                time.perf_counter() - start,
+                failed=True,
+                batch_size=len(batch),
+            )
+            pending = {id(message) for message in e.pending}
+            written = [message for message in batch if id(message) not in pending]
+            if written:
+                self._notify(written, True)
+            return e
+        except Exception as e:  # noqa: BLE001 - one bad batch must not stop the worker
+            logger.error(f"❌ {self.name} sink failed to write {len(batch)} messages: {e}")
+            record_sink_metrics(
+                self.name,
+                "failure",
+                time.perf_counter() - start,
+                failed=True,
+                batch_size=len(batch),
+            )
+            self._notify(batch, False)
+            return None
+        record_sink_metrics(
+            self.name, "success", time.perf_counter() - start, batch_size=len(batch)
+        )
+        if self.signals_ready:
+            set_ready()
+        self._notify(batch, True)
+        return None
+
+    def _guarded(self, hook: Callable[[], None]) -> None:
+        """Run a hook, logging instead of raising on failure."""
+        try:
+            hook()
+        except Exception as e:  # noqa: BLE001 - a hook must not stop the worker
+            logger.error(f"❌ {self.name} sink {hook.__name__} failed: {e}")
+
+    def _run(self) -> None:
+        """Worker loop: collect messages into batches and write them."""
+        batch: list[Payload] = []
+        deadline = 0.0
+        next_tick = time.monotonic() + (self.tick_interval or 0.0)
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            if self.tick_interval is not None:
+                until_tick = max(0.0, next_tick - time.monotonic())
+                timeout = until_tick if timeout is None else min(timeout, until_tick)
+            item: Payload | threading.Event | None
+            try:
+                item = self._buffer.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, threading.Event):
+                if batch:
+                    self._deliver(batch)
+                    batch = []
+                if item is _STOP:
+                    self._guarded(self.on_close)
+                    return
+                item.set()
+                continue
+
+            if self.tick_interval is not None and time.monotonic() >= next_tick:
+                next_tick = time.monotonic() + self.tick_interval
+                self._guarded(self.on_tick)
+
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self._flush_interval
+                batch.append(item)
+            if batch and (len(batch) >= self._batch_size or time.monotonic() >= deadline):
+                self._deliver(batch)
+                batch = []
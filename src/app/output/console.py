@@ -0,0 +1,39 @@
+"""Output sinks that write messages to the log or to standard output."""
+
+import json
+import sys
+
+from app.output.base import BufferedSink
+from app.records import Payload, to_wire
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class LogSink(BufferedSink):
+    """Log each message at INFO level."""
+
+    def write_batch(self, batch: list[Payload]) -> None:
+        """Log a batch of messages.
+
+        Args:
+            batch (list[Payload]): Messages to log.
+
+        """
+        for message in batch:
+            logger.info(f"📝 {to_wire(message)}")
+
+
+class StdoutSink(BufferedSink):
+    """Write messages to standard output as newline-delimited JSON."""
+
+    def write_batch(self, batch: list[Payload]) -> None:
+        """Write a batch as NDJSON lines.
+
+        Args:
+            batch (list[Payload]): Messages to write.
+
+        """
+        lines = "".join(json.dumps(to_wire(message), default=str) + "\n" for message in batch)
+        sys.stdout.write(lines)
+        sys.stdout.flush()
@@ -0,0 +1,145 @@
+"""Fan-out of message batches to every configured output sink.
+
+Sinks are selected with OUTPUT_MODES (comma-separated OutputMode values, e.g.
+'queue,s3') or, if that is unset, the single OUTPUT_MODE. Sink modules are
+imported only when their mode is enabled, so optional dependencies such as
+boto3 or a database driver are not needed otherwise.
+"""
+
+import atexit
+import importlib
+import threading
+from collections.abc import Collection, Sequence
+
+from app import config_shared
+from app.output.base import BufferedSink
+from app.records import Payload
+from app.utils.setup_logger import setup_logger
+from app.utils.types import OutputMode
+
+logger = setup_logger(__name__)
+
+# Sink implementations, as (module, class), keyed by OutputMode value.
+SINKS: dict[str, tuple[str, str]] = {
+    OutputMode.QUEUE.value: ("app.output.queue_sink", "QueueSink"),
+    OutputMode.LOG.value: ("app.output.console", "LogSink"),
+    OutputMode.STDOUT.value: ("app.output.console", "StdoutSink"),
+    OutputMode.S3.value: ("app.output.s3_sink", "S3Sink"),
+    OutputMode.DATABASE.value: ("app.output.db_sink", "DatabaseSink"),
+    OutputMode.REST.value: ("app.output.rest_sink", "RestSink"),
+}
+
+
+def create_sink(mode: str) -> BufferedSink:
+    """Import and construct the sink for an output mode.
+
+    Batch size, flush interval and buffer size come from the per-sink
+    ``<MODE>_BATCH_SIZE``, ``<MODE>_FLUSH_INTERVAL`` and ``<MODE>_BUFFER_SIZE``
+    settings.
+
+    Args:
+        mode (str): OutputMode value (e.g. 'queue').
+
+    Returns:
+        BufferedSink: A running sink.
+
+    Raises:
+        ValueError: If no sink is available for the mode.
+
+    """
+    if mode not in SINKS:
+        raise ValueError(f"No output sink for mode '{mode}'. Available: {', '.join(SINKS)}")
+    module_name, class_name = SINKS[mode]
+    sink_class = getattr(importlib.import_module(module_name), class_name)
+    sink: BufferedSink = sink_class(
+        name=mode,
+        batch_size=config_shared.get_sink_batch_size(mode),
+        flush_interval=config_shared.get_sink_flush_interval(mode),
+        buffer_size=config_shared.get_sink_buffer_size(mode),
+    )
+    return sink
+
+
+class OutputDispatcher:
+    """Submit each batch to every sink."""
+
+    def __init__(self, sinks: Sequence[BufferedSink]) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            sinks (Sequence[BufferedSink]): Sinks to fan out to.
+
+        """
+        self._sinks = list(sinks)
+
+    @property
+    def sinks(self) -> list[BufferedSink]:
+        """Return the configured sinks."""
+        return list(self._sinks)
+
+    def dispatch(self, batch: list[Payload], sinks: Collection[str] | None = None) -> None:
+        """Hand a batch to every sink without waiting for it to be written.
+
+        Only waits if a sink that blocks when full (the queue sink) has no
+        buffer space left.
+
+        Args:
+            batch (list[Payload]): Messages to output.
+            sinks (Collection[str] | None): Names of the sinks to send to;
+                every sink if None.
+
+        """
+        for sink in self._sinks:
+            if sinks is None or sink.name in sinks:
+                sink.submit(batch)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every sink has written what it was given.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait per sink.
+
+        Returns:
+            bool: True if all sinks drained in time.
+
+        """
+        # Flush every sink, even after one has timed out.
+        drained = [sink.flush(timeout) for sink in self._sinks]
+        return all(drained)
+
+    def close(self) -> None:
+        """Flush and stop every sink."""
+        for sink in self._sinks:
+            sink.close()
+
+
+def _configured_modes() -> list[str]:
+    """Return OUTPUT_MODES, or the single OUTPUT_MODE if that is unset."""
+    modes = config_shared.get_output_modes()
+    return modes or [config_shared.get_output_mode().value]
+
+
+_dispatcher: OutputDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_output_dispatcher() -> OutputDispatcher:
+    """Return the process-wide dispatcher, creating its sinks on first use.
+
+    Modes without an available sink are logged and skipped so the remaining
+    outputs still run.
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                sinks = []
+                for mode in dict.fromkeys(_configured_modes()):
+                    try:
+                        sinks.append(create_sink(mode))
+                    except Exception as e:  # noqa: BLE001 - one broken output must not disable the rest
+                        logger.error(f"❌ Output '{mode}' disabled: {e}")
+                logger.info(f"📤 Output sinks: {', '.join(s.name for s in sinks) or 'none'}")
+                _dispatcher = OutputDispatcher(sinks)
+                atexit.register(_dispatcher.close)
+    return _dispatcher
@@ -0,0 +1,34 @@
+"""Output sink that publishes to the configured message queue."""
+
+from app.message_queue.queue_sender import QueueUnavailableError, publish_to_queue
+from app.output.base import BufferedSink, SinkUnavailableError
+from app.records import Payload
+
+
+class QueueSink(BufferedSink):
+    """Publish batches to RabbitMQ or SQS via ``publish_to_queue``."""
+
+    # publish_to_queue dead-letters bad messages instead of raising, so it
+    # marks the service ready itself once the broker accepts a message.
+    signals_ready = False
+
+    # Deduplicated items are not fetched again, so a full buffer slows the
+    # pollers down rather than dropping them.
+    block_when_full = True
+
+    def write_batch(self, batch: list[Payload]) -> None:
+        """Publish a batch; validation and dead-lettering happen in the publisher.
+
+        Args:
+            batch (list[Payload]): Messages to publish.
+
+        Raises:
+            SinkUnavailableError: If the broker failed a publish or its circuit
+                is open; the unsent messages are kept and retried once the
+                breaker allows a probe.
+
+        """
+        try:
+            publish_to_queue(batch)
+        except QueueUnavailableError as e:
+            raise SinkUnavailableError(str(e), e.unsent, e.retry_after) from e
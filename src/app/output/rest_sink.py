@@ -0,0 +1,196 @@
+"""Batched REST output sink.
+
+Each batch is POSTed to REST_OUTPUT_URL as one gzip-compressed JSON array over
+a keep-alive ``requests.Session``. Up to REST_OUTPUT_MAX_IN_FLIGHT requests run
+concurrently on a small thread pool; when all slots are busy the sink's worker
+waits, so back-pressure fills the sink buffer instead of spawning requests.
+
+Connection errors, timeouts, 429 and 5xx responses are retried by the shared
+retry policy (full-jitter backoff, ``Retry-After`` honoured, global retry
+budget). Other 4xx responses are not retried. A circuit breaker rejects batches
+immediately while the endpoint is unhealthy; only an HTTP response counts as
+healthy, so requests that never reach the endpoint count as failures. Batches that still fail are
+written to the dead-letter file.
+"""
+
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app import config_shared
+from app.message_queue.dead_letter import get_dead_letter_sink
+from app.output.base import BufferedSink
+from app.records import Payload, to_wire
+from app.utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from app.utils.healthcheck import set_ready
+from app.utils.metrics import record_dead_letter_metrics, record_sink_metrics
+from app.utils.retry_policy import RetryPolicy, is_retryable
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class RestDispatchError(RuntimeError):
+    """Raised when a batch could not be delivered to the REST endpoint."""
+
+
+class RestRejectedError(RestDispatchError):
+    """Raised when the endpoint rejects a batch with a non-retryable status."""
+
+
+class RestSink(BufferedSink):
+    """POST batches of messages to an HTTP endpoint as JSON arrays."""
+
+    def __init__(
+        self,
+        name: str = "rest",
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        buffer_size: int = 10000,
+        session: requests.Session | None = None,
+    ) -> None:
+        """Initialize the sink from REST_OUTPUT_* settings.
+
+        Args:
+            name (str): Sink name, used as the metric label.
+            batch_size (int): Maximum messages per request.
+            flush_interval (float): Maximum seconds a message waits in the buffer.
+            buffer_size (int): Maximum buffered messages.
+            session (requests.Session | None): Session to send with; a pooled
+                session is created if None.
+
+        Raises:
+            ValueError: If REST_OUTPUT_URL is not set.
+
+        """
+        self._url = config_shared.get_rest_output_url()
+        if not self._url:
+            raise ValueError("REST_OUTPUT_URL must be set for the rest output")
+        self._timeout = config_shared.get_rest_timeout()
+        self._retry = RetryPolicy(
+            name,
+            max_attempts=config_shared.get_rest_output_max_retries() + 1,
+            base_delay=config_shared.get_rest_output_backoff_seconds(),
+            max_delay=config_shared.get_rest_output_backoff_max_seconds(),
+        )
+        max_in_flight = max(1, config_shared.get_rest_output_max_in_flight())
+        self._session = session if session is not None else self._create_session(max_in_flight)
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._max_in_flight = max_in_flight
+        self._executor = ThreadPoolExecutor(max_in_flight, thread_name_prefix=f"sink-{name}-post")
+        self._breaker = get_circuit_breaker(f"sink:{name}")
+        super().__init__(name, batch_size, flush_interval, buffer_size)
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """Create a keep-alive session with one pooled connection per slot."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Content-Type": "application/json", "Content-Encoding": "gzip"})
+        return session
+
+    def write_batch(self, batch: list[Payload]) -> None:
+        """POST one batch, retrying transient failures.
+
+        Args:
+            batch (list[Payload]): Messages to send.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open.
+            RestRejectedError: If the endpoint rejected the batch.
+            RestDispatchError: If retries ran out.
+
+        """
+        self._breaker.check()
+        try:
+            body = gzip.compress(
+                json.dumps([to_wire(m) for m in batch], default=str).encode("utf-8"),
+                compresslevel=5,
+            )
+            self._retry.call(self._post, body)
+        except requests.RequestException as e:
+            if e.response is not None and not is_retryable(e):
+                # The endpoint answered, so it is healthy even if it refused the batch.
+                self._breaker.record_success()
+                raise RestRejectedError(str(e)) from e
+            self._breaker.record_failure()
+            raise RestDispatchError(f"{type(e).__name__}: {e}") from e
+        except BaseException:
+            # No answer from the endpoint either way, so leave the state as is.
+            self._breaker.release()
+            raise
+        self._breaker.record_success()
+
+    def _post(self, body: bytes) -> None:
+        """Send one attempt, raising on connection errors and error statuses."""
+        response = self._session.post(self._url, data=body, timeout=self._timeout)
+        response.raise_for_status()
+
+    def _write(self, batch: list[Payload]) -> None:
+        """Hand a batch to the request pool, waiting for a free slot."""
+        self._slots.acquire()
+        self._executor.submit(self._send, batch)
+
+    def _send(self, batch: list[Payload]) -> None:
+        """Deliver a batch on a pool thread, recording metrics and dead letters."""
+        start = time.perf_counter()
+        try:
+            self.write_batch(batch)
+        except Exception as e:  # noqa: BLE001 - runs on a pool thread; errors are recorded
+            status = "circuit_open" if isinstance(e, CircuitOpenError) else "failure"
+            logger.error(f"❌ {self.name} sink failed to send {len(batch)} messages: {e}")
+            record_sink_metrics(
+                self.name, status, time.perf_counter() - start, failed=True, batch_size=len(batch)
+            )
+            written = get_dead_letter_sink().write((m, f"rest_{status}", str(e)) for m in batch)
+            if written:
+                record_dead_letter_metrics(f"rest_{status}", "file", written)
+            self._notify(batch, False)
+        else:
+            record_sink_metrics(
+                self.name, "success", time.perf_counter() - start, batch_size=len(batch)
+            )
+            if self.signals_ready:
+                set_ready()
+            self._notify(batch, True)
+        finally:
+            self._slots.release()
+
+    def _wait_idle(self, timeout: float | None) -> bool:
+        """Wait until no requests are in flight."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        taken = 0
+        try:
+            for _ in range(self._max_in_flight):
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not self._slots.acquire(timeout=remaining):
+                    return False
+                taken += 1
+            return True
+        finally:
+            for _ in range(taken):
+                self._slots.release()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything submitted so far has been sent.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the buffer drained and no requests are in flight.
+
+        """
+        return super().flush(timeout) and self._wait_idle(timeout)
+
+    def on_close(self) -> None:
+        """Wait for in-flight requests, then release the pool and session."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
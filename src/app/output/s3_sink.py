@@ -0,0 +1,329 @@
+"""Archival output sink writing rolled, compressed files to S3.
+
+Messages are grouped by source and UTC date into one open file per
+partition::
+
+    {prefix}source={source}/date={YYYY-MM-DD}/{host}-{start}-{seq}.ndjson.zst
+
+A file is rolled (completed and made visible) once it reaches
+S3_ROLL_BYTES of uncompressed data or has been open for S3_ROLL_SECONDS.
+NDJSON files are compressed as a stream and uploaded with S3 multipart
+upload as each S3_PART_BYTES chunk fills, so memory stays bounded to about one
+part per open partition. Parquet files (S3_OUTPUT_FORMAT=parquet, requires
+pyarrow) are built in memory at roll time and uploaded with boto3's managed
+transfer.
+
+Upload failures never discard data. A part that fails to upload stays
+buffered and is retried with the next part. A file that fails to complete is
+set aside with its rows and any uploaded parts, and completed on a later
+tick. Only at shutdown is a file that still cannot be completed given up,
+with its multipart upload aborted.
+
+S3_OUTPUT_ENDPOINT_URL points the client at a local MinIO or moto server.
+"""
+
+import datetime
+import io
+import json
+import os
+import time
+import zlib
+from typing import Any
+
+from app import config_shared
+from app.output.base import BufferedSink
+from app.records import Payload, to_wire
+from app.utils.metrics import record_s3_upload_metrics
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# S3 rejects multipart parts smaller than 5 MiB (except the last one).
+MIN_PART_BYTES = 5 * 1024 * 1024
+
+
+class _StreamCompressor:
+    """Incremental zstd or gzip compressor."""
+
+    def __init__(self, compression: str) -> None:
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError as e:
+                raise RuntimeError("S3_OUTPUT_COMPRESSION=zstd requires 'zstandard'") from e
+            self._obj: Any = zstandard.ZstdCompressor(level=3).compressobj()
+            self.extension = ".zst"
+        elif compression == "gzip":
+            self._obj = zlib.compressobj(6, zlib.DEFLATED, 31)
+            self.extension = ".gz"
+        else:
+            raise ValueError(f"Unsupported S3 output compression: {compression}")
+
+    def compress(self, data: bytes) -> bytes:
+        chunk: bytes = self._obj.compress(data)
+        return chunk
+
+    def flush(self) -> bytes:
+        chunk: bytes = self._obj.flush()
+        return chunk
+
+
+class _RollingObject:
+    """One open archive file for a partition."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.opened_at = time.monotonic()
+        self.raw_bytes = 0
+        self.uploaded_bytes = 0
+        self.rows: list[dict[str, Any]] = []
+        self.pending = bytearray()
+        self.compressor: _StreamCompressor | None = None
+        self.upload_id: str | None = None
+        self.parts: list[dict[str, Any]] = []
+
+    def finish(self) -> None:
+        """End the compressed stream; no more rows may be added."""
+        if self.compressor is not None:
+            self.pending += self.compressor.flush()
+            self.compressor = None
+
+
+class S3Sink(BufferedSink):
+    """Archive every message to S3 as rolled NDJSON or Parquet files."""
+
+    tick_interval = 5.0
+
+    def __init__(
+        self,
+        name: str = "s3",
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        buffer_size: int = 10000,
+        client: Any = None,
+    ) -> None:
+        """Initialize the sink from S3_OUTPUT_* and S3_ROLL_* settings.
+
+        Args:
+            name (str): Sink name, used as the metric label.
+            batch_size (int): Maximum messages per write.
+            flush_interval (float): Maximum seconds a message waits in the buffer.
+            buffer_size (int): Maximum buffered messages.
+            client (Any): boto3 S3 client; created from settings if None.
+
+        Raises:
+            ValueError: If S3_OUTPUT_BUCKET is not set or the format is unknown.
+
+        """
+        self._bucket = config_shared.get_s3_output_bucket()
+        if not self._bucket:
+            raise ValueError("S3_OUTPUT_BUCKET must be set for the s3 output")
+        self._prefix = config_shared.get_s3_output_prefix()
+        self._format = config_shared.get_s3_output_format()
+        if self._format not in ("ndjson", "parquet"):
+            raise ValueError(f"Unsupported S3_OUTPUT_FORMAT: {self._format}")
+        self._compression = config_shared.get_s3_output_compression()
+        self._roll_bytes = config_shared.get_s3_roll_bytes()
+        self._roll_seconds = config_shared.get_s3_roll_seconds()
+        self._part_bytes = max(MIN_PART_BYTES, config_shared.get_s3_part_bytes())
+        self._host = os.getenv("HOSTNAME", "poller")
+        self._client = client if client is not None else self._create_client()
+        self._open: dict[tuple[str, str], _RollingObject] = {}
+        # Rolled objects whose upload failed, retried on every tick.
+        self._unfinished: list[_RollingObject] = []
+        self._sequence = 0
+        if self._format == "ndjson":
+            # Fail at startup rather than on the first roll.
+            _StreamCompressor(self._compression)
+        super().__init__(name, batch_size, flush_interval, buffer_size)
+
+    @staticmethod
+    def _create_client() -> Any:
+        """Create a boto3 S3 client from the S3_OUTPUT_* settings."""
+        import boto3
+
+        return boto3.client(
+            "s3",
+            region_name=config_shared.get_s3_output_region() or None,
+            endpoint_url=config_shared.get_s3_output_endpoint_url() or None,
+        )
+
+    def _object_key(self, source: str, date: str) -> str:
+        """Return a unique key for a new object in a partition."""
+        self._sequence += 1
+        start = datetime.datetime.now(datetime.UTC).strftime("%Y%m%dT%H%M%S")
+        extension = ".parquet" if self._format == "parquet" else ".ndjson"
+        if self._format == "ndjson":
+            extension += ".zst" if self._compression == "zstd" else ".gz"
+        return (
+            f"{self._prefix}source={source}/date={date}/"
+            f"{self._host}-{start}-{self._sequence:06d}{extension}"
+        )
+
+    def write_batch(self, batch: list[Payload]) -> None:
+        """Append a batch to the open partition files, rolling full ones.
+
+        Args:
+            batch (list[Payload]): Messages to archive.
+
+        """
+        date = datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%d")
+        touched: set[tuple[str, str]] = set()
+        for message in batch:
+            wire = to_wire(message)
+            partition = (str(wire.get("source", "unknown")).lower(), date)
+            obj = self._open.get(partition)
+            if obj is None:
+                obj = self._open[partition] = _RollingObject(self._object_key(*partition))
+            self._append(obj, wire)
+            touched.add(partition)
+
+        for partition in touched:
+            if self._open[partition].raw_bytes >= self._roll_bytes:
+                self._roll(partition)
+
+    def _append(self, obj: _RollingObject, wire: dict[str, Any]) -> None:
+        """Add one message to an open object."""
+        if self._format == "parquet":
+            data = wire.get("data") or {}
+            row = {k: v for k, v in wire.items() if k != "data"}
+            row.update(data)
+            obj.rows.append(row)
+            obj.raw_bytes += sum(len(str(v)) for v in row.values())
+            return
+
+        line = json.dumps(wire, default=str, ensure_ascii=False).encode("utf-8") + b"\n"
+        obj.raw_bytes += len(line)
+        if obj.compressor is None:
+            obj.compressor = _StreamCompressor(self._compression)
+        obj.pending += obj.compressor.compress(line)
+        if len(obj.pending) >= self._part_bytes:
+            try:
+                self._upload_part(obj, bytes(obj.pending))
+            except Exception as e:  # noqa: BLE001 - the part is kept and retried
+                # Keep the data buffered; it goes up with the next part.
+                logger.warning(f"⚠️ Failed to upload part of {obj.key}, will retry: {e}")
+                return
+            obj.pending.clear()
+
+    def _upload_part(self, obj: _RollingObject, data: bytes) -> None:
+        """Upload one multipart part, starting the upload if needed."""
+        start = time.perf_counter()
+        if obj.upload_id is None:
+            response = self._client.create_multipart_upload(Bucket=self._bucket, Key=obj.key)
+            obj.upload_id = response["UploadId"]
+        number = len(obj.parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=obj.key,
+            UploadId=obj.upload_id,
+            PartNumber=number,
+            Body=data,
+        )
+        obj.parts.append({"ETag": response["ETag"], "PartNumber": number})
+        obj.uploaded_bytes += len(data)
+        record_s3_upload_metrics("part", len(data), time.perf_counter() - start)
+
+    def _roll(self, partition: tuple[str, str]) -> None:
+        """Close the open object for a partition and upload it.
+
+        New messages for the partition go to a new object. If the upload
+        fails, the closed object is kept and retried on the next tick.
+        """
+        obj = self._open.pop(partition)
+        obj.finish()
+        if not self._complete(obj):
+            self._unfinished.append(obj)
+
+    def _complete(self, obj: _RollingObject) -> bool:
+        """Upload what remains of a closed object and make it visible.
+
+        Returns:
+            bool: True if the object was completed; False if it must be retried.
+
+        """
+        start = time.perf_counter()
+        try:
+            if self._format == "parquet":
+                size = self._put_parquet(obj)
+                kind = "parquet"
+            elif obj.upload_id is None:
+                size = len(obj.pending)
+                self._client.put_object(Bucket=self._bucket, Key=obj.key, Body=bytes(obj.pending))
+                kind = "put"
+            else:
+                if obj.pending:
+                    self._upload_part(obj, bytes(obj.pending))
+                    obj.pending.clear()
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=obj.key,
+                    UploadId=obj.upload_id,
+                    MultipartUpload={"Parts": obj.parts},
+                )
+                size = obj.uploaded_bytes
+                kind = "complete"
+        except Exception as e:  # noqa: BLE001 - the object is kept and retried
+            logger.error(f"❌ Failed to archive {obj.key}, will retry: {e}")
+            return False
+        record_s3_upload_metrics(kind, size, time.perf_counter() - start)
+        logger.info(f"🪣 Archived s3://{self._bucket}/{obj.key} ({size} bytes)")
+        return True
+
+    def _retry_unfinished(self) -> None:
+        """Try again to complete objects whose earlier upload failed."""
+        self._unfinished = [obj for obj in self._unfinished if not self._complete(obj)]
+
+    def _put_parquet(self, obj: _RollingObject) -> int:
+        """Write buffered rows as a zstd Parquet file and upload it."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("S3_OUTPUT_FORMAT=parquet requires 'pyarrow'") from e
+        from boto3.s3.transfer import TransferConfig
+
+        buffer = io.BytesIO()
+        pq.write_table(pa.Table.from_pylist(obj.rows), buffer, compression="zstd")
+        size = buffer.tell()
+        buffer.seek(0)
+        self._client.upload_fileobj(
+            buffer,
+            self._bucket,
+            obj.key,
+            Config=TransferConfig(
+                multipart_threshold=self._part_bytes, multipart_chunksize=self._part_bytes
+            ),
+        )
+        return size
+
+    def _abort(self, obj: _RollingObject) -> None:
+        """Abort a failed multipart upload so its parts are not billed."""
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=obj.key, UploadId=obj.upload_id
+            )
+        except Exception as e:  # noqa: BLE001 - best-effort cleanup
+            logger.warning(f"⚠️ Failed to abort multipart upload for {obj.key}: {e}")
+
+    def _roll_due(self, force: bool = False) -> None:
+        """Roll every partition that is old enough (or all, if forced)."""
+        now = time.monotonic()
+        for partition, obj in list(self._open.items()):
+            if force or now - obj.opened_at >= self._roll_seconds:
+                self._roll(partition)
+
+    def on_tick(self) -> None:
+        """Retry failed uploads and roll files open for S3_ROLL_SECONDS."""
+        self._retry_unfinished()
+        self._roll_due()
+
+    def on_close(self) -> None:
+        """Roll every open file at shutdown, giving up on any that still fail."""
+        self._retry_unfinished()
+        self._roll_due(force=True)
+        for obj in self._unfinished:
+            logger.error(f"❌ Giving up on s3://{self._bucket}/{obj.key} at shutdown")
+            if obj.upload_id is not None:
+                self._abort(obj)
+        self._unfinished = []
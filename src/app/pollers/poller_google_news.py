@@ -1,41 +1,66 @@
 """Polls Google News RSS feed headlines for each stock symbol."""
 
 import datetime
-import time
 import urllib.parse
 from typing import Any
 
 import feedparser
 
-from app.config import get_symbols
-from app.config_shared import get_config_value, get_polling_interval
-from app.message_queue.queue_sender import publish_to_queue
+from app.pollers.runner import PollerSource, run_poller
+from app.records import Article, SentimentMessage
+from app.utils.http_client import HttpResponse, http_get_parsed
 from app.utils.setup_logger import setup_logger
+from app.utils.stage_timer import timed_stage
 
 logger = setup_logger(__name__)
 
+# Article fields this source sends in the wire "data" object.
+FIELDS = ("headline", "url")
+
 GOOGLE_NEWS_RSS = (
     "https://news.google.com/rss/search?q={symbol}+stock&hl=en-US&gl=US&ceid=US:en"
 )
 
 
-def fetch_google_news(symbol: str) -> list[dict[str, Any]]:
+@timed_stage("parse", "google_news")
+def parse_feed(response: HttpResponse) -> Any:
+    """Parse a Google News RSS response.
+
+    Args:
+        response (HttpResponse): Feed response.
+
+    Returns:
+        Any: The feedparser result, shared with concurrent callers.
+
+    """
+    response.raise_for_status()
+    return feedparser.parse(response.content)
+
+
+def fetch_google_news(symbol: str) -> list[Article]:
     """Fetches news headlines from Google News RSS for a given stock symbol.
 
     Args:
         symbol (str): Stock symbol to query.
 
     Returns:
-        list[dict[str, Any]]: A list of news article dictionaries.
+        list[Article]: News articles.
+
     """
     encoded_symbol = urllib.parse.quote_plus(symbol)
     url = GOOGLE_NEWS_RSS.format(symbol=encoded_symbol)
 
     logger.debug(f"Fetching Google News RSS for {symbol}: {url}")
-    feed = feedparser.parse(url)
+    try:
+        # Aliases that map to the same query share one request and one parse.
+        feed = http_get_parsed(url, parse_feed, timeout=10, source="google_news")
+    except Exception as e:  # noqa: BLE001 - a failed feed must not stop the cycle
+        logger.warning(f"Failed to fetch Google News RSS for {symbol}: {e}")
+        return []
+
     entries = getattr(feed, "entries", [])
 
-    news_items: list[dict[str, Any]] = []
+    news_items: list[Article] = []
 
     for entry in entries:
         if not isinstance(entry, dict):
@@ -48,65 +73,41 @@ def fetch_google_news(symbol: str) -> list[dict[str, Any]]:
         try:
             dt = datetime.datetime.strptime(published, "%a, %d %b %Y %H:%M:%S %Z")
             timestamp = dt.isoformat()
-        except Exception as e:
+        except (TypeError, ValueError) as e:
             logger.warning(
                 f"Failed to parse publish date for {symbol}: {published} ({e})"
             )
             timestamp = datetime.datetime.utcnow().isoformat()
 
-        news_items.append(
-            {
-                "timestamp": timestamp,
-                "headline": title,
-                "url": link,
-            }
-        )
+        news_items.append(Article(timestamp=timestamp, headline=title, url=link))
 
     return news_items
 
 
-def build_payload(symbol: str, article: dict[str, Any]) -> dict[str, Any]:
+def build_payload(symbol: str, article: Article) -> SentimentMessage:
     """Constructs a standard payload for queue publishing.
 
     Args:
         symbol (str): Stock symbol.
-        article (dict[str, Any]): Article data from RSS feed.
+        article (Article): Article data from RSS feed.
 
     Returns:
-        dict[str, Any]: Payload formatted for downstream processing.
+        SentimentMessage: Message formatted for downstream processing.
+
     """
-    return {
-        "symbol": symbol,
-        "timestamp": article["timestamp"],
-        "source": "GoogleNews",
-        "data": {
-            "headline": article["headline"],
-            "url": article["url"],
-            "platform": "google_news",
-        },
-    }
+    return SentimentMessage(
+        symbol=symbol, source="GoogleNews", platform="google_news", article=article, fields=FIELDS
+    )
+
+
+SOURCE = PollerSource(
+    name="google_news",
+    label="Google News items",
+    fetch=fetch_google_news,
+    build=build_payload,
+)
 
 
 def run_google_news_poller() -> None:
     """Main polling loop for Google News."""
-    logger.info("📡 Google News poller started")
-    interval = get_polling_interval()
-
-    while True:
-        all_payloads: list[dict[str, Any]] = []
-        symbols = get_symbols()
-
-        for symbol in symbols:
-            articles = fetch_google_news(symbol)
-            for article in articles:
-                payload = build_payload(symbol, article)
-                all_payloads.append(payload)
-
-        if all_payloads:
-            publish_to_queue(all_payloads)
-            logger.info(f"✅ Published {len(all_payloads)} Google News items")
-        else:
-            logger.info("No new headlines this round")
-
-        logger.info(f"⏱️ Sleeping for {interval} seconds")
-        time.sleep(interval)
+    run_poller(SOURCE)
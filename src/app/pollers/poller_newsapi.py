@@ -1,51 +1,29 @@
 """Polls financial news from NewsAPI and publishes structured sentiment-ready data."""
 
 import datetime
-import time
 from typing import Any
 
-import requests
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
-
-from app.config_shared import (
-    get_config_value,
-    get_polling_interval,
-)
-
-from app.config import get_symbols
-from app.config_shared import get_config_value, get_polling_interval
-from app.message_queue.queue_sender import publish_to_queue
-from app.utils.rate_limit import RateLimiter
+from app.config_shared import get_config_value, get_newsapi_timeout
+from app.pollers.runner import PollerSource, run_poller
+from app.records import Article, SentimentMessage
+from app.utils.http_client import http_get
 from app.utils.setup_logger import setup_logger
+from app.utils.stage_timer import stage
 
 logger = setup_logger(__name__)
 
+# Article fields this source sends in the wire "data" object.
+FIELDS = ("headline", "summary", "url", "source_name")
+
 NEWSAPI_URL = "https://newsapi.org/v2/everything"
 QUERY = "stocks OR earnings OR finance"
 
-# These config keys must exist in Vault or environment
-NEWSAPI_KEY = get_config_value("NEWSAPI_KEY", "")
-NEWSAPI_RATE_LIMIT = int(get_config_value("NEWSAPI_RATE_LIMIT", "60"))  # requests
-NEWSAPI_WINDOW_SECONDS = int(
-    get_config_value("NEWSAPI_WINDOW_SECONDS", "60")
-)  # seconds
-NEWSAPI_TIMEOUT = int(get_config_value("NEWSAPI_TIMEOUT", "10"))
-
-rate_limiter = RateLimiter(
-    max_requests=NEWSAPI_RATE_LIMIT, time_window=NEWSAPI_WINDOW_SECONDS
-)
+# NEWSAPI_KEY and NEWSAPI_TIMEOUT are read from Vault or environment on first
+# use. The per-key request limit (NEWSAPI_RATE_LIMIT / NEWSAPI_WINDOW_SECONDS)
+# is applied in http_get, which also retries transient failures under the
+# "newsapi" retry policy (NEWSAPI_RETRY_MAX_ATTEMPTS).
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(requests.RequestException),
-)
 def fetch_newsapi_articles(symbol: str) -> list[dict[str, Any]]:
     """Fetches NewsAPI articles for a given stock symbol.
 
@@ -55,25 +33,32 @@ def fetch_newsapi_articles(symbol: str) -> list[dict[str, Any]]:
     Returns:
         list[dict[str, Any]]: List of article entries.
     """
-    rate_limiter.acquire("NewsAPIPoller")
     try:
+        api_key = get_config_value("NEWSAPI_KEY", "")
         logger.debug(f"Querying NewsAPI for: {symbol}")
         params = {
             "q": f"{symbol} {QUERY}",
             "sortBy": "publishedAt",
             "language": "en",
             "pageSize": 10,
-            "apiKey": NEWSAPI_KEY,
+            "apiKey": api_key,
         }
-        response = requests.get(NEWSAPI_URL, params=params, timeout=NEWSAPI_TIMEOUT)
+        response = http_get(
+            NEWSAPI_URL,
+            params=params,
+            timeout=get_newsapi_timeout(),
+            credential=api_key,
+            source="newsapi",
+        )
         response.raise_for_status()
-        return response.json().get("articles", [])
+        with stage("newsapi", "parse"):
+            return response.json().get("articles", [])
     except Exception as e:
         logger.warning(f"NewsAPI fetch failed for {symbol}: {e}")
         return []
 
 
-def build_payload(symbol: str, article: dict[str, Any]) -> dict[str, Any]:
+def build_payload(symbol: str, article: dict[str, Any]) -> SentimentMessage:
     """Constructs a queue-ready payload from a NewsAPI article.
 
     Args:
@@ -81,42 +66,28 @@ def build_payload(symbol: str, article: dict[str, Any]) -> dict[str, Any]:
         article (dict[str, Any]): Raw article entry.
 
     Returns:
-        dict[str, Any]: Payload for publishing.
+        SentimentMessage: Message for publishing.
     """
-    return {
-        "symbol": symbol,
-        "timestamp": article.get("publishedAt", datetime.datetime.utcnow().isoformat()),
-        "source": "NewsAPI",
-        "data": {
-            "headline": article.get("title", ""),
-            "summary": article.get("description", ""),
-            "url": article.get("url", ""),
-            "source_name": article.get("source", {}).get("name", ""),
-            "platform": "newsapi",
-        },
-    }
+    record = Article(
+        timestamp=article.get("publishedAt", datetime.datetime.utcnow().isoformat()),
+        headline=article.get("title", ""),
+        summary=article.get("description", ""),
+        url=article.get("url", ""),
+        source_name=article.get("source", {}).get("name", ""),
+    )
+    return SentimentMessage(
+        symbol=symbol, source="NewsAPI", platform="newsapi", article=record, fields=FIELDS
+    )
+
+
+SOURCE = PollerSource(
+    name="newsapi",
+    label="NewsAPI articles",
+    fetch=fetch_newsapi_articles,
+    build=build_payload,
+)
 
 
 def run_newsapi_poller() -> None:
     """Main polling loop for NewsAPI."""
-    logger.info("📡 NewsAPI poller started")
-    interval = get_polling_interval()
-
-    while True:
-        all_payloads: list[dict[str, Any]] = []
-        symbols = get_symbols()
-
-        for symbol in symbols:
-            articles = fetch_newsapi_articles(symbol)
-            for article in articles:
-                payload = build_payload(symbol, article)
-                all_payloads.append(payload)
-
-        if all_payloads:
-            publish_to_queue(all_payloads)
-            logger.info(f"✅ Published {len(all_payloads)} NewsAPI articles")
-        else:
-            logger.info("No new articles this round")
-
-        logger.info(f"⏱️ Sleeping for {interval} seconds")
-        time.sleep(interval)
+    run_poller(SOURCE)
@@ -1,49 +1,64 @@
 """Polls Seeking Alpha RSS feeds for articles related to each stock symbol."""
 
 import datetime
-import time
 import urllib.parse
-from typing import Any
 
 import feedparser
 
-from app.config import get_symbols
-from app.config_shared import get_config_value, get_polling_interval
-from app.message_queue.queue_sender import publish_to_queue
+from app.pollers.runner import PollerSource, run_poller
+from app.records import Article, SentimentMessage
+from app.utils.http_client import HttpResponse, http_get_parsed
 from app.utils.setup_logger import setup_logger
+from app.utils.stage_timer import timed_stage
 
 logger = setup_logger(__name__)
 
+# Article fields this source sends in the wire "data" object.
+FIELDS = ("headline", "summary", "url", "source_name")
+
 BASE_RSS_URL = "https://seekingalpha.com/api/sa/combined/{symbol}.xml"
 
 
-def fetch_seeking_alpha_feed(symbol: str) -> list[dict[str, Any]]:
+@timed_stage("parse", "seeking_alpha")
+def parse_feed(response: HttpResponse) -> list[Article]:
+    """Parse a Seeking Alpha RSS response into articles.
+
+    Args:
+        response (HttpResponse): Feed response.
+
+    Returns:
+        list[Article]: Parsed news entries.
+
+    """
+    response.raise_for_status()
+    feed = feedparser.parse(response.content)
+    return [
+        Article(
+            timestamp=entry.get("published", datetime.datetime.utcnow().isoformat()),
+            headline=entry.get("title", ""),
+            summary=entry.get("summary", ""),
+            url=entry.get("link", ""),
+            source_name="Seeking Alpha",
+        )
+        for entry in feed.entries
+    ]
+
+
+def fetch_seeking_alpha_feed(symbol: str) -> list[Article]:
     """Fetch and parse Seeking Alpha RSS feed for the given symbol.
 
     Args:
         symbol (str): Stock symbol.
 
     Returns:
-        list[dict[str, Any]]: Parsed news entries.
+        list[Article]: Parsed news entries.
+
     """
     try:
         encoded_symbol = urllib.parse.quote_plus(symbol)
         url = BASE_RSS_URL.format(symbol=encoded_symbol)
-        feed = feedparser.parse(url)
-
-        results = []
-        for entry in feed.entries:
-            results.append(
-                {
-                    "timestamp": entry.get(
-                        "published", datetime.datetime.utcnow().isoformat()
-                    ),
-                    "headline": entry.get("title", ""),
-                    "summary": entry.get("summary", ""),
-                    "url": entry.get("link", ""),
-                    "source_name": "Seeking Alpha",
-                }
-            )
+        # Concurrent fetches of the same feed share one request and one parse.
+        results = list(http_get_parsed(url, parse_feed, timeout=10, source="seeking_alpha"))
 
         logger.debug(f"Fetched {len(results)} Seeking Alpha items for {symbol}")
         return results
@@ -53,50 +68,34 @@ def fetch_seeking_alpha_feed(symbol: str) -> list[dict[str, Any]]:
         return []
 
 
-def build_payload(symbol: str, article: dict[str, Any]) -> dict[str, Any]:
+def build_payload(symbol: str, article: Article) -> SentimentMessage:
     """Constructs a queue-ready payload from a Seeking Alpha article.
 
     Args:
         symbol (str): Stock symbol.
-        article (dict[str, Any]): Article data.
+        article (Article): Article data.
 
     Returns:
-        dict[str, Any]: Payload for message queue.
+        SentimentMessage: Message for the queue.
+
     """
-    return {
-        "symbol": symbol,
-        "timestamp": article["timestamp"],
-        "source": "SeekingAlpha",
-        "data": {
-            "headline": article["headline"],
-            "summary": article["summary"],
-            "url": article["url"],
-            "source_name": article["source_name"],
-            "platform": "seeking_alpha",
-        },
-    }
+    return SentimentMessage(
+        symbol=symbol,
+        source="SeekingAlpha",
+        platform="seeking_alpha",
+        article=article,
+        fields=FIELDS,
+    )
+
+
+SOURCE = PollerSource(
+    name="seeking_alpha",
+    label="Seeking Alpha articles",
+    fetch=fetch_seeking_alpha_feed,
+    build=build_payload,
+)
 
 
 def run_seeking_alpha_poller() -> None:
     """Main polling loop for Seeking Alpha."""
-    logger.info("📡 Seeking Alpha poller started")
-    interval = get_polling_interval()
-
-    while True:
-        all_payloads: list[dict[str, Any]] = []
-        symbols = get_symbols()
-
-        for symbol in symbols:
-            articles = fetch_seeking_alpha_feed(symbol)
-            for article in articles:
-                payload = build_payload(symbol, article)
-                all_payloads.append(payload)
-
-        if all_payloads:
-            publish_to_queue(all_payloads)
-            logger.info(f"✅ Published {len(all_payloads)} Seeking Alpha articles")
-        else:
-            logger.info("No articles found this round")
-
-        logger.info(f"⏱️ Sleeping for {interval} seconds")
-        time.sleep(interval)
+    run_poller(SOURCE)
@@ -1,18 +1,19 @@
 """Polls recent sentiment messages from Stocktwits public API."""
 
 import datetime
-import time
 from typing import Any
 
-import requests
-
-from app.config import get_symbols
-from app.config_shared import get_config_value, get_polling_interval
-from app.message_queue.queue_sender import publish_to_queue
+from app.pollers.runner import PollerSource, run_poller
+from app.records import Article, SentimentMessage
+from app.utils.http_client import http_get
 from app.utils.setup_logger import setup_logger
+from app.utils.stage_timer import stage
 
 logger = setup_logger(__name__)
 
+# Article fields this source sends in the wire "data" object.
+FIELDS = ("username", "content")
+
 API_URL = "https://api.stocktwits.com/api/2/streams/symbol/{}.json"
 
 
@@ -27,9 +28,10 @@ def fetch_stocktwits_messages(symbol: str) -> list[dict[str, Any]]:
     """
     try:
         url = API_URL.format(symbol)
-        response = requests.get(url, timeout=10)
+        response = http_get(url, timeout=10, source="stocktwits")
         response.raise_for_status()
-        messages = response.json().get("messages", [])
+        with stage("stocktwits", "parse"):
+            messages = response.json().get("messages", [])
         logger.debug(f"Fetched {len(messages)} messages for {symbol}")
         return messages
     except Exception as e:
@@ -37,7 +39,7 @@ def fetch_stocktwits_messages(symbol: str) -> list[dict[str, Any]]:
         return []
 
 
-def build_payload(symbol: str, msg: dict[str, Any]) -> dict[str, Any]:
+def build_payload(symbol: str, msg: dict[str, Any]) -> SentimentMessage:
     """Constructs a standardized message from a Stocktwits post.
 
     Args:
@@ -45,40 +47,26 @@ def build_payload(symbol: str, msg: dict[str, Any]) -> dict[str, Any]:
         msg (dict[str, Any]): Message object.
 
     Returns:
-        dict[str, Any]: Queue-ready payload.
+        SentimentMessage: Queue-ready message.
     """
-    return {
-        "symbol": symbol,
-        "timestamp": msg.get("created_at", datetime.datetime.utcnow().isoformat()),
-        "source": "Stocktwits",
-        "data": {
-            "username": msg.get("user", {}).get("username", ""),
-            "content": msg.get("body", ""),
-            "platform": "stocktwits",
-        },
-    }
+    article = Article(
+        timestamp=msg.get("created_at", datetime.datetime.utcnow().isoformat()),
+        username=msg.get("user", {}).get("username", ""),
+        content=msg.get("body", ""),
+    )
+    return SentimentMessage(
+        symbol=symbol, source="Stocktwits", platform="stocktwits", article=article, fields=FIELDS
+    )
+
+
+SOURCE = PollerSource(
+    name="stocktwits",
+    label="Stocktwits messages",
+    fetch=fetch_stocktwits_messages,
+    build=build_payload,
+)
 
 
 def run_stocktwits_poller() -> None:
     """Main polling loop for Stocktwits."""
-    logger.info("📡 Stocktwits poller started")
-    interval = get_polling_interval()
-
-    while True:
-        all_payloads: list[dict[str, Any]] = []
-        symbols = get_symbols()
-
-        for symbol in symbols:
-            messages = fetch_stocktwits_messages(symbol)
-            for msg in messages:
-                payload = build_payload(symbol, msg)
-                all_payloads.append(payload)
-
-        if all_payloads:
-            publish_to_queue(all_payloads)
-            logger.info(f"✅ Published {len(all_payloads)} Stocktwits messages")
-        else:
-            logger.info("No new messages this round")
-
-        logger.info(f"⏱️ Sleeping for {interval} seconds")
-        time.sleep(interval)
+    run_poller(SOURCE)
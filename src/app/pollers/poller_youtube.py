@@ -2,9 +2,6 @@
 
 """Polls YouTube for recent financial videos and transcripts per stock symbol."""
 
-import time
-from typing import Any
-
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from youtube_transcript_api import YouTubeTranscriptApi
@@ -14,43 +11,74 @@ try:
 except ImportError:
     TranscriptsDisabled = Exception  # fallback if API changes
 
-from app.config import get_symbols
-from app.config_shared import get_config_value, get_polling_interval
-from app.message_queue.queue_sender import publish_to_queue
+from app.config_shared import get_config_value
+from app.pollers.runner import PollerSource, run_poller
+from app.records import Article, SentimentMessage
+from app.utils.rate_limit_registry import get_rate_limit_registry
 from app.utils.setup_logger import setup_logger
+from app.utils.single_flight import SingleFlight
+from app.utils.stage_timer import stage, timed_stage
 
 logger = setup_logger(__name__)
 
-YOUTUBE_API_KEY = get_config_value("YOUTUBE_API_KEY")
+# Article fields this source sends in the wire "data" object.
+FIELDS = ("headline", "url", "transcript")
+
+# A video found for several tickers at once is only transcribed once.
+_transcripts = SingleFlight("youtube_transcript")
+
 YOUTUBE_SEARCH_QUERY = "finance|stock|market|earnings"
 MAX_RESULTS = 5
 
 
-def fetch_youtube_transcripts(symbol: str) -> list[dict[str, Any]]:
+@timed_stage("fetch", "youtube")
+def fetch_transcript(video_id: str) -> str:
+    """Fetch a video's transcript as a single string.
+
+    Args:
+        video_id (str): YouTube video ID.
+
+    Returns:
+        str: Transcript text.
+
+    """
+    get_rate_limit_registry().acquire("www.youtube.com")
+    transcript = YouTubeTranscriptApi.get_transcript(video_id)
+    return " ".join([seg["text"] for seg in transcript])
+
+
+def fetch_youtube_transcripts(symbol: str) -> list[Article]:
     """Fetch recent YouTube videos and transcripts for the given symbol.
 
     Args:
         symbol (str): Stock ticker symbol.
 
     Returns:
-        list[dict[str, Any]]: List of video metadata with transcripts.
+        list[Article]: Videos with their transcripts.
+
     """
-    videos: list[dict[str, Any]] = []
+    videos: list[Article] = []
+    registry = get_rate_limit_registry()
 
     try:
-        service = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
-
-        search_response = (
-            service.search()
-            .list(
-                q=f"{symbol} {YOUTUBE_SEARCH_QUERY}",
-                part="snippet",
-                type="video",
-                maxResults=MAX_RESULTS,
-                order="date",
+        api_key = get_config_value("YOUTUBE_API_KEY")
+        # googleapiclient and youtube_transcript_api use their own HTTP stacks,
+        # so acquire from the shared registry explicitly before each call.
+        registry.acquire("www.googleapis.com", credential=api_key)
+        service = build("youtube", "v3", developerKey=api_key)
+
+        with stage("youtube", "fetch"):
+            search_response = (
+                service.search()
+                .list(
+                    q=f"{symbol} {YOUTUBE_SEARCH_QUERY}",
+                    part="snippet",
+                    type="video",
+                    maxResults=MAX_RESULTS,
+                    order="date",
+                )
+                .execute()
             )
-            .execute()
-        )
 
         for item in search_response.get("items", []):
             video_id = item["id"]["videoId"]
@@ -58,8 +86,7 @@ def fetch_youtube_transcripts(symbol: str) -> list[dict[str, Any]]:
             published_at = item["snippet"]["publishedAt"]
 
             try:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id)
-                transcript_text = " ".join([seg["text"] for seg in transcript])
+                transcript_text = _transcripts.do(video_id, fetch_transcript, video_id)
             except TranscriptsDisabled:
                 logger.info(f"Transcript disabled for video {video_id}")
                 continue
@@ -68,12 +95,12 @@ def fetch_youtube_transcripts(symbol: str) -> list[dict[str, Any]]:
                 continue
 
             videos.append(
-                {
-                    "timestamp": published_at,
-                    "headline": title,
-                    "url": f"https://www.youtube.com/watch?v={video_id}",
-                    "transcript": transcript_text,
-                }
+                Article(
+                    timestamp=published_at,
+                    headline=title,
+                    url=f"https://www.youtube.com/watch?v={video_id}",
+                    transcript=transcript_text,
+                )
             )
 
     except HttpError as e:
@@ -84,49 +111,30 @@ def fetch_youtube_transcripts(symbol: str) -> list[dict[str, Any]]:
     return videos
 
 
-def build_payload(symbol: str, video: dict[str, Any]) -> dict[str, Any]:
+def build_payload(symbol: str, video: Article) -> SentimentMessage:
     """Constructs a standardized message from a YouTube video.
 
     Args:
         symbol (str): Stock ticker symbol.
-        video (dict[str, Any]): Parsed video information.
+        video (Article): Parsed video information.
 
     Returns:
-        dict[str, Any]: Queue-ready payload.
+        SentimentMessage: Queue-ready message.
+
     """
-    return {
-        "symbol": symbol,
-        "timestamp": video["timestamp"],
-        "source": "YouTube",
-        "data": {
-            "headline": video["headline"],
-            "url": video["url"],
-            "transcript": video["transcript"],
-            "platform": "youtube",
-        },
-    }
+    return SentimentMessage(
+        symbol=symbol, source="YouTube", platform="youtube", article=video, fields=FIELDS
+    )
+
+
+SOURCE = PollerSource(
+    name="youtube",
+    label="YouTube video transcripts",
+    fetch=fetch_youtube_transcripts,
+    build=build_payload,
+)
 
 
 def run_youtube_poller() -> None:
     """Main polling loop for YouTube."""
-    logger.info("📡 YouTube poller started")
-    interval = get_polling_interval()
-
-    while True:
-        all_payloads: list[dict[str, Any]] = []
-        symbols = get_symbols()
-
-        for symbol in symbols:
-            videos = fetch_youtube_transcripts(symbol)
-            for video in videos:
-                payload = build_payload(symbol, video)
-                all_payloads.append(payload)
-
-        if all_payloads:
-            publish_to_queue(all_payloads)
-            logger.info(f"✅ Published {len(all_payloads)} YouTube video transcripts")
-        else:
-            logger.info("No video transcripts this round")
-
-        logger.info(f"⏱️ Sleeping for {interval} seconds")
-        time.sleep(interval)
+    run_poller(SOURCE)
@@ -0,0 +1,175 @@
+"""Shared polling loop and multi-source scheduler.
+
+Each poller module describes itself with a :class:`PollerSource` (how to
+fetch items for a symbol and turn them into payloads). The same cycle code
+then drives either a single source (one pod per source) or several sources
+in one process, where they share the HTTP session, the output sinks,
+the dedup index and the metrics registry.
+
+Every cycle is counted in the poll metrics, and payload building is timed as
+the source's ``build`` stage; fetch and parse are timed where they happen
+(the HTTP client and each poller's parsing code).
+"""
+
+import heapq
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from app import config_shared
+from app.config import get_symbols
+from app.output.dispatcher import get_output_dispatcher
+from app.records import Payload
+from app.utils.dedup import get_dedup_index
+from app.utils.metrics import record_poll_metrics
+from app.utils.setup_logger import setup_logger
+from app.utils.stage_timer import stage
+
+logger = setup_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PollerSource:
+    """Description of a pollable sentiment source."""
+
+    name: str
+    label: str
+    fetch: Callable[[str], list[Any]]
+    build: Callable[[str, Any], Payload]
+
+
+def _collect(source: PollerSource, symbol: str) -> list[Payload]:
+    """Fetch and build payloads for one symbol, isolating failures."""
+    try:
+        items = source.fetch(symbol)
+        with stage(source.name, "build"):
+            return [source.build(symbol, item) for item in items]
+    except Exception as e:  # noqa: BLE001 - one symbol must not fail the cycle
+        logger.warning(f"❌ {source.name} failed for {symbol}: {e}")
+        return []
+
+
+def poll_cycle(source: PollerSource, executor: ThreadPoolExecutor | None = None) -> int:
+    """Run one polling cycle for a source and send the results to every output.
+
+    Args:
+        source (PollerSource): Source to poll.
+        executor (ThreadPoolExecutor | None): Pool bounding the source's
+            concurrent fetches; symbols are fetched sequentially if None.
+
+    Returns:
+        int: Number of payloads dispatched, including ones re-sent to sinks
+            that failed them earlier.
+
+    """
+    start = time.perf_counter()
+    try:
+        dispatched = _run_cycle(source, executor)
+    except Exception:
+        record_poll_metrics(source.name, True, time.perf_counter() - start)
+        raise
+    record_poll_metrics(source.name, False, time.perf_counter() - start)
+    return dispatched
+
+
+def _run_cycle(source: PollerSource, executor: ThreadPoolExecutor | None) -> int:
+    """Fetch, build, dedup and dispatch one cycle's payloads."""
+    symbols = get_symbols()
+    if executor is None:
+        batches = [_collect(source, symbol) for symbol in symbols]
+    else:
+        batches = list(executor.map(lambda symbol: _collect(source, symbol), symbols))
+
+    all_payloads = [payload for batch in batches for payload in batch]
+    dispatcher = get_output_dispatcher()
+    resent = 0
+    if config_shared.get_dedup_enabled():
+        index = get_dedup_index()
+        for sink_name, owed in index.owed(all_payloads).items():
+            dispatcher.dispatch(owed, sinks=[sink_name])
+            logger.info(f"🔁 Re-sent {len(owed)} {source.label} to the {sink_name} output")
+            resent += len(owed)
+        all_payloads = index.filter(all_payloads)
+
+    if all_payloads:
+        dispatcher.dispatch(all_payloads)
+        logger.info(f"✅ Dispatched {len(all_payloads)} {source.label}")
+    elif not resent:
+        logger.info(f"No new {source.label} this round")
+    return len(all_payloads) + resent
+
+
+def _guarded_cycle(source: PollerSource, executor: ThreadPoolExecutor | None) -> int:
+    """Run a cycle, logging failures so one source cannot stop the scheduler."""
+    try:
+        return poll_cycle(source, executor)
+    except Exception as e:  # noqa: BLE001 - keeps the scheduler running
+        logger.error(f"❌ {source.name} cycle failed: {e}")
+        return 0
+
+
+def _make_executor(source: PollerSource) -> ThreadPoolExecutor | None:
+    """Create the fetch pool for a source, or None for sequential fetching."""
+    workers = config_shared.get_source_concurrency(source.name)
+    if workers <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix=source.name)
+
+
+def run_poller(source: PollerSource) -> None:
+    """Main polling loop for a single source."""
+    logger.info(f"📡 {source.label} poller started")
+    interval = config_shared.get_polling_interval()
+    executor = _make_executor(source)
+
+    while True:
+        poll_cycle(source, executor)
+        logger.info(f"⏱️ Sleeping for {interval} seconds")
+        time.sleep(interval)
+
+
+def run_sources(sources: list[PollerSource]) -> None:
+    """Run several sources in one process under a shared scheduler.
+
+    Cycles are staggered across the polling interval so sources do not all
+    publish at once. Each source has its own fetch pool (its concurrency
+    quota); a cycle that is still running when its next slot comes up is
+    skipped rather than queued.
+
+    Args:
+        sources (list[PollerSource]): Sources to run.
+
+    """
+    if not sources:
+        raise ValueError("At least one source is required")
+
+    interval = config_shared.get_polling_interval()
+    executors = {source.name: _make_executor(source) for source in sources}
+    cycle_pool = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="cycle")
+    running: dict[str, Future[int]] = {}
+
+    logger.info(f"📡 Multi-source poller started: {', '.join(s.name for s in sources)}")
+
+    start = time.monotonic()
+    schedule = [
+        (start + interval * i / len(sources), i, source) for i, source in enumerate(sources)
+    ]
+    heapq.heapify(schedule)
+
+    while True:
+        due, order, source = heapq.heappop(schedule)
+        delay = due - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+        previous = running.get(source.name)
+        if previous is None or previous.done():
+            running[source.name] = cycle_pool.submit(
+                _guarded_cycle, source, executors[source.name]
+            )
+        else:
+            logger.warning(f"⏭️ Skipping {source.name} cycle; previous cycle still running")
+
+        heapq.heappush(schedule, (due + interval, order, source))
@@ -0,0 +1,109 @@
+"""Compact record types for items flowing from pollers to the queue.
+
+Pollers produce :class:`Article` records and wrap them in a
+:class:`SentimentMessage`; the nested wire dict is only built by
+:meth:`SentimentMessage.to_wire` when the message is serialized. Both types
+are slotted dataclasses, so a cycle's worth of messages holds no per-item
+``__dict__`` and no per-item copies of constant keys. Source and platform
+names are code constants and symbols are interned when the symbol list is
+parsed, so every message shares the same string objects.
+
+Records are treated as immutable once built. They are not declared frozen
+because frozen dataclass construction is about three times slower.
+
+Wire format (unchanged from the original dict payloads)::
+
+    {"symbol": ..., "timestamp": ..., "source": ...,
+     "data": {<the message's fields>..., "platform": ...}}
+
+Each poller passes the Article fields its source has always sent as
+``fields``; they are all emitted, with None values kept as null.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+# Article fields copied into the wire "data" object by default, in output order.
+_DATA_FIELDS = (
+    "headline",
+    "summary",
+    "url",
+    "source_name",
+    "username",
+    "content",
+    "transcript",
+    "sentiment",
+)
+
+
+@dataclass(slots=True)
+class Article:
+    """A single item fetched from a source.
+
+    Fields a source does not provide are left as None.
+    """
+
+    timestamp: str
+    headline: str | None = None
+    summary: str | None = None
+    url: str | None = None
+    source_name: str | None = None
+    username: str | None = None
+    content: str | None = None
+    transcript: str | None = None
+    sentiment: str | None = None
+
+
+@dataclass(slots=True)
+class SentimentMessage:
+    """An article tagged with its symbol and source, ready to publish.
+
+    ``fields`` names the Article fields in the wire "data" object. Pollers
+    share one tuple per source, so it costs a reference per message.
+    """
+
+    symbol: str
+    source: str
+    platform: str
+    article: Article
+    fields: tuple[str, ...] = _DATA_FIELDS
+
+    @property
+    def timestamp(self) -> str:
+        """Return the article timestamp."""
+        return self.article.timestamp
+
+    def to_wire(self) -> dict[str, Any]:
+        """Return the message in its queue wire format.
+
+        Returns:
+            dict[str, Any]: Payload with symbol, timestamp, source and data.
+
+        """
+        article = self.article
+        data: dict[str, Any] = {name: getattr(article, name) for name in self.fields}
+        data["platform"] = self.platform
+        return {
+            "symbol": self.symbol,
+            "timestamp": article.timestamp,
+            "source": self.source,
+            "data": data,
+        }
+
+
+Payload = dict[str, Any] | SentimentMessage
+
+
+def to_wire(message: Payload) -> dict[str, Any]:
+    """Return the wire dict for a record or an already-built dict payload.
+
+    Args:
+        message (Payload): SentimentMessage or wire-format dict.
+
+    Returns:
+        dict[str, Any]: Wire-format payload.
+
+    """
+    if isinstance(message, SentimentMessage):
+        return message.to_wire()
+    return message
@@ -2,31 +2,38 @@
 
 Included Utilities:
 - setup_logger: Configures logging with structured output.
-- retry_request: Retries a function with optional delay on failure.
+- retry_request: Retries a function with jittered backoff on transient failures.
 - request_with_timeout: Makes HTTP GET requests with timeout and validation.
 - validate_data: Validates schema and batch structure of data.
 - validate_environment_variables: Ensures required environment variables are set.
 - track_polling_metrics: Logs success/failure of polling operations.
 - track_request_metrics: Logs request-level metrics (rate limits, success, etc.).
+
+Utilities are imported on first attribute access so that importing a light
+module such as ``app.utils.setup_logger`` does not pull in requests or
+prometheus_client.
 """
 
-from .request_with_timeout import request_with_timeout
-from .retry_request import retry_request
-from .setup_logger import setup_logger
-from .track_polling_metrics import track_polling_metrics
-from .track_request_metrics import track_request_metrics
-from .validate_data import validate_data
-from .validate_environment_variables import validate_environment_variables
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "setup_logger": ".setup_logger",
+    "retry_request": ".retry_request",
+    "request_with_timeout": ".request_with_timeout",
+    "validate_data": ".validate_data",
+    "validate_environment_variables": ".validate_environment_variables",
+    "track_polling_metrics": ".track_polling_metrics",
+    "track_request_metrics": ".track_request_metrics",
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    "setup_logger",
-    "retry_request",
-    "request_with_timeout",
-    "validate_data",
-    "validate_environment_variables",
-    "track_polling_metrics",
-    "track_request_metrics",
-]
 
-# Initialize package-level logger for utilities
-logger = setup_logger(name="utils")
+def __getattr__(name: str) -> Any:
+    """Import exported utilities lazily (PEP 562)."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
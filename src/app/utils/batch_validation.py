@@ -0,0 +1,125 @@
+"""Batch validation of outgoing messages against a precompiled schema.
+
+The schema is a fixed tuple of (field, getter, check) rules, bound once for
+records and once for wire dicts, so validating a batch is a tight loop with no
+per-item schema lookups or logging. Failures are counted per field and
+exported once per batch.
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.records import Payload, SentimentMessage
+from app.utils.metrics import record_batch_validation_metrics
+
+Rule = tuple[str, Callable[[Any], Any], Callable[[Any], bool]]
+Validator = Callable[[Any], str | None]
+
+
+def _is_text(value: Any) -> bool:
+    """Return True for a non-blank string."""
+    return isinstance(value, str) and bool(value) and not value.isspace()
+
+
+def _is_dict(value: Any) -> bool:
+    """Return True for a dict."""
+    return isinstance(value, dict)
+
+
+RECORD_RULES: tuple[Rule, ...] = (
+    ("symbol", lambda m: m.symbol, _is_text),
+    ("timestamp", lambda m: m.article.timestamp, _is_text),
+    ("source", lambda m: m.source, _is_text),
+    ("platform", lambda m: m.platform, _is_text),
+    ("text", lambda m: m.article.headline or m.article.content, _is_text),
+)
+
+DICT_RULES: tuple[Rule, ...] = (
+    ("symbol", lambda m: m.get("symbol"), _is_text),
+    ("timestamp", lambda m: m.get("timestamp"), _is_text),
+    ("source", lambda m: m.get("source"), _is_text),
+    ("data", lambda m: m.get("data"), _is_dict),
+    ("platform", lambda m: m["data"].get("platform"), _is_text),
+    ("text", lambda m: m["data"].get("headline") or m["data"].get("content"), _is_text),
+)
+
+
+def compile_rules(rules: Sequence[Rule]) -> Validator:
+    """Compile rules into a function returning the first failing field.
+
+    Args:
+        rules (Sequence[Rule]): (field, getter, check) rules, checked in order.
+
+    Returns:
+        Validator: Function returning the failing field name, or None if valid.
+
+    """
+    compiled = tuple(rules)
+
+    def validate(message: Any) -> str | None:
+        for name, getter, check in compiled:
+            if not check(getter(message)):
+                return name
+        return None
+
+    return validate
+
+
+_validate_record = compile_rules(RECORD_RULES)
+_validate_dict = compile_rules(DICT_RULES)
+
+
+def first_invalid_field(message: Any) -> str | None:
+    """Return the first field that fails validation, or None if valid.
+
+    Args:
+        message (Any): SentimentMessage or wire-format dict.
+
+    Returns:
+        str | None: Failing field name ('message' for unsupported types).
+
+    """
+    if isinstance(message, SentimentMessage):
+        return _validate_record(message)
+    if isinstance(message, dict):
+        return _validate_dict(message)
+    return "message"
+
+
+@dataclass
+class BatchValidationResult:
+    """Outcome of validating a batch."""
+
+    valid: list[Payload] = field(default_factory=list)
+    invalid: list[tuple[Any, str]] = field(default_factory=list)
+    field_errors: dict[str, int] = field(default_factory=dict)
+
+
+def validate_batch(messages: Sequence[Any], processor: str = "publish") -> BatchValidationResult:
+    """Split a batch into valid and invalid messages and record metrics.
+
+    Args:
+        messages (Sequence[Any]): Messages to validate.
+        processor (str): Metric label for the validating component.
+
+    Returns:
+        BatchValidationResult: Valid messages in order, and (message, field)
+        pairs for rejected ones.
+
+    """
+    result = BatchValidationResult()
+    valid_append = result.valid.append
+    start = time.perf_counter()
+    for message in messages:
+        failed = first_invalid_field(message)
+        if failed is None:
+            valid_append(message)
+        else:
+            result.invalid.append((message, failed))
+            result.field_errors[failed] = result.field_errors.get(failed, 0) + 1
+    duration = time.perf_counter() - start
+
+    record_batch_validation_metrics(processor, len(messages), duration, result.field_errors)
+    return result
@@ -0,0 +1,205 @@
+"""Record and replay HTTP traffic for offline, deterministic poller runs.
+
+With HTTP_CASSETTE_MODE=record, every GET sent through the shared HTTP client
+is performed normally and its status, headers and body are appended to the
+cassette (HTTP_CASSETTE_PATH, gzip-compressed NDJSON). With
+HTTP_CASSETTE_MODE=replay, no network call is made: responses are served from
+the cassette, after HTTP_CASSETTE_LATENCY_MS of simulated latency, and a
+HTTP_CASSETTE_ERROR_RATE share of calls fails with a timeout or a 503 so retry
+and circuit-breaker paths can be exercised. HTTP_CASSETTE_SEED makes injected
+errors reproducible.
+
+Requests are matched on method, URL and query parameters. Credential-like
+parameters (api keys, tokens) are left out of both the match key and the
+file. A request recorded several times is replayed in recorded order,
+cycling. Unknown requests get a 404.
+
+Only traffic through :func:`app.utils.http_client.http_get` is covered; the
+YouTube client libraries use their own HTTP stacks.
+"""
+
+import atexit
+import base64
+import gzip
+import json
+import random
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Query parameters never written to a cassette.
+_SECRET_PARAMS = frozenset({"apikey", "api_key", "key", "token", "access_token", "secret"})
+
+# Response headers not worth replaying.
+_DROPPED_HEADERS = frozenset({"set-cookie", "content-encoding", "transfer-encoding"})
+
+
+def cassette_key(method: str, url: str, params: dict[str, Any] | None) -> str:
+    """Return the match key for a request, without credential parameters.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL without the query string from ``params``.
+        params (dict[str, Any] | None): Query parameters.
+
+    Returns:
+        str: ``"METHOD url?sorted-params"``.
+
+    """
+    query = sorted(
+        (k, str(v)) for k, v in (params or {}).items() if k.lower() not in _SECRET_PARAMS
+    )
+    return f"{method} {url}?{urlencode(query)}" if query else f"{method} {url}"
+
+
+def redact_url(url: str) -> str:
+    """Return ``url`` without credential query parameters.
+
+    Args:
+        url (str): URL, possibly with api keys or tokens in its query string.
+
+    Returns:
+        str: The URL with those parameters removed.
+
+    """
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _SECRET_PARAMS
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class RecordingSession:
+    """Session wrapper that performs requests and records their responses."""
+
+    def __init__(self, session: requests.Session, path: str) -> None:
+        """Initialize the recorder.
+
+        Args:
+            session (requests.Session): Session that sends the real requests.
+            path (str): Cassette file, appended to.
+
+        """
+        self._session = session
+        self._path = path
+        self._lock = threading.Lock()
+        # Held open across requests and closed by close(), so no context manager.
+        self._file = gzip.open(path, "at", encoding="utf-8")  # noqa: SIM115
+        self._count = 0
+        atexit.register(self.close)
+        logger.info(f"📼 Recording HTTP traffic to {path}")
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET and record the response."""
+        response = self._session.get(url, **kwargs)
+        entry = {
+            "key": cassette_key("GET", url, kwargs.get("params")),
+            "status": response.status_code,
+            "headers": {
+                k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS
+            },
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._count += 1
+        return response
+
+    def close(self) -> None:
+        """Flush and close the cassette."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                logger.info(f"📼 Recorded {self._count} responses to {self._path}")
+
+
+class ReplaySession:
+    """Session stand-in that serves recorded responses without the network."""
+
+    def __init__(
+        self, path: str, latency_ms: float = 0.0, error_rate: float = 0.0, seed: int | None = None
+    ) -> None:
+        """Load a cassette.
+
+        Args:
+            path (str): Cassette file written in record mode.
+            latency_ms (float): Simulated latency added to every call.
+            error_rate (float): Share of calls (0-1) that fail with an
+                injected timeout or 503.
+            seed (int | None): Seed for error injection.
+
+        """
+        self._latency = latency_ms / 1000
+        self._error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._entries: dict[str, list[dict[str, Any]]] = {}
+        self._positions: dict[str, int] = {}
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry["key"], []).append(entry)
+        total = sum(len(v) for v in self._entries.values())
+        logger.info(f"📼 Replaying {total} responses for {len(self._entries)} requests from {path}")
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Serve the next recorded response for a GET.
+
+        Raises:
+            requests.Timeout: When a timeout is injected.
+
+        """
+        key = cassette_key("GET", url, kwargs.get("params"))
+        with self._lock:
+            inject = self._error_rate > 0 and self._random.random() < self._error_rate
+            timeout_error = inject and self._random.random() < 0.5
+            recorded = self._entries.get(key)
+            entry = None
+            if recorded:
+                position = self._positions.get(key, 0)
+                entry = recorded[position % len(recorded)]
+                self._positions[key] = position + 1
+        if self._latency:
+            time.sleep(self._latency)
+
+        if timeout_error:
+            raise requests.Timeout(f"injected timeout for {key}")
+        if inject:
+            return _build_response(url, 503, {}, b"injected error")
+        if entry is None:
+            logger.debug(f"📼 No recorded response for {key}")
+            return _build_response(url, 404, {}, b"not in cassette")
+        return _build_response(
+            url, entry["status"], entry["headers"], base64.b64decode(entry["body"])
+        )
+
+    def mount(self, *args: Any) -> None:
+        """Accept adapter mounts for interface compatibility."""
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def _build_response(
+    url: str, status: int, headers: dict[str, str], body: bytes
+) -> requests.Response:
+    """Build a ``requests.Response`` from recorded parts."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response._content = body
+    return response
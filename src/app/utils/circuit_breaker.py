@@ -0,0 +1,181 @@
+"""Circuit breakers for calls to unreliable dependencies.
+
+A breaker starts ``closed`` and counts consecutive failures. After
+``failure_threshold`` of them it opens and :meth:`CircuitBreaker.allow`
+returns False, so callers fail fast instead of waiting on timeouts. Once
+``reset_timeout`` seconds have passed it goes ``half_open`` and lets a single
+probe through: success closes the circuit, failure opens it again. A caller
+whose probe ends without reaching the dependency (e.g. it raised before the
+call) gives it back with :meth:`CircuitBreaker.release`; a probe that never
+reports is abandoned after ``reset_timeout`` so the circuit cannot stick.
+
+Breakers are shared through :func:`get_circuit_breaker`, keyed per upstream
+host (``http:<host>``) and per output sink (``sink:<name>``). State changes,
+time spent open and rejected calls are exported as metrics.
+"""
+
+import threading
+import time
+
+from app import config_shared
+from app.utils.metrics import record_circuit_rejection, record_circuit_transition
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because its circuit is open."""
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            name (str): Key of the protected dependency, used in logs and metrics.
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds to stay open before probing.
+
+        """
+        self.name = name
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+
+    def _transition(self, state: str) -> None:
+        """Move to a new state and record it. The caller holds ``_lock``."""
+        previous = self._state
+        if previous == state:
+            return
+        now = time.monotonic()
+        open_seconds = now - self._opened_at if previous == OPEN else 0.0
+        self._state = state
+        if state == OPEN:
+            self._opened_at = now
+            logger.warning(f"⛔ Circuit {self.name} opened after {self._failures} failures")
+        elif state == CLOSED:
+            logger.info(f"✅ Circuit {self.name} closed")
+        record_circuit_transition(self.name, previous, state, open_seconds)
+
+    @property
+    def state(self) -> str:
+        """Return the current state, moving open to half-open when due."""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+                self._transition(HALF_OPEN)
+            return self._state
+
+    def retry_after(self) -> float:
+        """Return how long a rejected caller should wait before trying again.
+
+        Returns:
+            float: The rest of the open period, the full reset timeout while a
+                half-open probe is in flight, or 0 if calls are allowed now.
+
+        """
+        state = self.state
+        with self._lock:
+            if state == OPEN:
+                return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+            if state == HALF_OPEN and self._probing:
+                return self._reset_timeout
+        return 0.0
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed.
+
+        In the half-open state only one probe is allowed until it reports back
+        or ``reset_timeout`` passes. Rejected calls are counted.
+
+        Returns:
+            bool: True if the caller should make the call.
+
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN:
+            with self._lock:
+                now = time.monotonic()
+                if not self._probing or now - self._probe_started >= self._reset_timeout:
+                    self._probing = True
+                    self._probe_started = now
+                    return True
+        record_circuit_rejection(self.name)
+        return False
+
+    def check(self) -> None:
+        """Raise if a call may not proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is in flight.
+
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"circuit open for {self.name}")
+
+    def record_success(self) -> None:
+        """Report a successful call, closing the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._transition(CLOSED)
+
+    def release(self) -> None:
+        """Give back a probe that ended without an outcome, leaving the state as is."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Report a failed call, opening the circuit if the threshold is hit."""
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._state == HALF_OPEN or self._failures >= self._failure_threshold:
+                self._transition(OPEN)
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker_states() -> dict[str, str]:
+    """Return the current state of every breaker, by key."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.state for breaker in breakers}
+
+
+def get_circuit_breaker(key: str) -> CircuitBreaker:
+    """Return the shared breaker for a key, creating it on first use.
+
+    Args:
+        key (str): Dependency key, e.g. ``http:<host>`` or ``sink:<name>``.
+
+    Returns:
+        CircuitBreaker: Breaker configured from CIRCUIT_* settings.
+
+    """
+    breaker = _breakers.get(key)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(key)
+            if breaker is None:
+                breaker = _breakers[key] = CircuitBreaker(
+                    key,
+                    failure_threshold=config_shared.get_circuit_failure_threshold(),
+                    reset_timeout=config_shared.get_circuit_reset_seconds(),
+                )
+    return breaker
@@ -0,0 +1,254 @@
+"""Bounded, thread-safe index of already-published items.
+
+Pollers re-fetch the same headlines every cycle; the index drops items whose
+identity key was delivered recently so they are not published again. In
+multi-source mode one index is shared by every source in the process. Keys
+for symbols that leave the symbol universe are retired on reload.
+
+An item passed by :meth:`DedupIndex.filter` is pending until every output
+sink has reported on it. Pending items are not dispatched again, and the key
+is only remembered once all sinks delivered the item. Delivery is tracked per
+sink: if some sinks dropped or failed the item, it is owed to those sinks only,
+and :meth:`DedupIndex.owed` hands it back for them when a later cycle fetches
+it again, so sinks that already took it do not receive a duplicate.
+"""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from app import config_shared
+from app.output.dispatcher import OutputDispatcher, get_output_dispatcher
+from app.records import Payload, SentimentMessage
+from app.utils.symbol_source import SymbolDiff, get_symbol_universe
+
+
+def item_key(payload: Payload) -> bytes:
+    """Return a compact identity key for a payload.
+
+    Items with a URL are identified by source, symbol and URL; other items
+    (e.g. Stocktwits messages) by source, symbol, timestamp and content.
+
+    Args:
+        payload (Payload): Queue-ready message or payload dict.
+
+    Returns:
+        bytes: 16-byte digest identifying the item.
+
+    """
+    if isinstance(payload, SentimentMessage):
+        article = payload.article
+        source, symbol, timestamp = payload.source, payload.symbol, article.timestamp
+        url, body = article.url, article.headline or article.content or ""
+    else:
+        data = payload.get("data") or {}
+        source, symbol, timestamp = (
+            str(payload.get("source")),
+            str(payload.get("symbol")),
+            str(payload.get("timestamp")),
+        )
+        url, body = data.get("url"), data.get("headline") or data.get("content") or ""
+
+    identity = f"{source}|{symbol}|{url}" if url else f"{source}|{symbol}|{timestamp}|{body}"
+    return hashlib.blake2b(identity.encode(), digest_size=16).digest()
+
+
+def _symbol(payload: Payload) -> str:
+    """Return the symbol of a payload."""
+    if isinstance(payload, SentimentMessage):
+        return payload.symbol
+    return str(payload.get("symbol"))
+
+
+@dataclass(slots=True)
+class _Pending:
+    """Delivery state of an item not yet delivered by every sink.
+
+    An item with sinks still ``waiting`` is in flight; once none are waiting,
+    it is owed to the ``failed`` sinks.
+    """
+
+    symbol: str
+    waiting: set[str]
+    failed: set[str] = field(default_factory=set)
+
+
+class DedupIndex:
+    """LRU set of delivered item keys with a fixed maximum size."""
+
+    def __init__(self, max_entries: int, sinks: Sequence[str] = ()) -> None:
+        """Initialize the index.
+
+        Args:
+            max_entries (int): Maximum number of keys to remember, and of
+                items awaiting or owed delivery.
+            sinks (Sequence[str]): Names of the sinks that must report delivery
+                before a key is remembered; with none, keys are remembered as
+                soon as they pass ``filter``. Set by ``track``.
+
+        Raises:
+            ValueError: If max_entries is non-positive.
+
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self._max_entries = max_entries
+        self._sinks = frozenset(sinks)
+        # Maps item key -> symbol so keys can be retired per symbol.
+        self._keys: OrderedDict[bytes, str] = OrderedDict()
+        self._pending: dict[bytes, _Pending] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of remembered keys."""
+        return len(self._keys)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of items awaiting or owed delivery."""
+        return len(self._pending)
+
+    def track(self, dispatcher: OutputDispatcher) -> None:
+        """Remember keys only once every sink of ``dispatcher`` delivered them.
+
+        Args:
+            dispatcher (OutputDispatcher): Dispatcher whose sinks report delivery.
+
+        """
+        sinks = dispatcher.sinks
+        self._sinks = frozenset(sink.name for sink in sinks)
+        for sink in sinks:
+            sink.add_listener(functools.partial(self.settle, sink=sink.name))
+
+    def filter(self, payloads: list[Payload]) -> list[Payload]:
+        """Return only payloads neither delivered nor pending, marking them pending.
+
+        Items owed to some sinks are not returned; use :meth:`owed` for those.
+
+        Args:
+            payloads (list[Payload]): Candidate payloads.
+
+        Returns:
+            list[Payload]: New payloads, in their original order.
+
+        """
+        fresh: list[Payload] = []
+        keys = [item_key(p) for p in payloads]
+        with self._lock:
+            for key, payload in zip(keys, payloads, strict=True):
+                if key in self._keys:
+                    self._keys.move_to_end(key)
+                    continue
+                if key in self._pending:
+                    continue
+                if self._sinks:
+                    self._pending[key] = _Pending(_symbol(payload), set(self._sinks))
+                else:
+                    self._keys[key] = _symbol(payload)
+                fresh.append(payload)
+            self._trim()
+        return fresh
+
+    def owed(self, payloads: list[Payload]) -> dict[str, list[Payload]]:
+        """Return payloads owed to sinks that failed them, marking them pending.
+
+        Args:
+            payloads (list[Payload]): Candidate payloads, e.g. a cycle's fetch.
+
+        Returns:
+            dict[str, list[Payload]]: Payloads to resend, by sink name.
+
+        """
+        retries: dict[str, list[Payload]] = {}
+        if not self._pending:
+            return retries
+        keys = [item_key(p) for p in payloads]
+        with self._lock:
+            for key, payload in zip(keys, payloads, strict=True):
+                pending = self._pending.get(key)
+                if pending is None or pending.waiting:
+                    continue
+                for name in pending.failed:
+                    retries.setdefault(name, []).append(payload)
+                pending.waiting, pending.failed = pending.failed, set()
+        return retries
+
+    def settle(self, payloads: list[Payload], delivered: bool, sink: str) -> None:
+        """Record one sink's outcome for dispatched payloads.
+
+        A key is remembered once every sink has delivered the item. If any
+        sink failed it, the item stays owed to the sinks that failed.
+
+        Args:
+            payloads (list[Payload]): Payloads the sink reported on.
+            delivered (bool): Whether the sink delivered them.
+            sink (str): Name of the reporting sink.
+
+        """
+        keys = [item_key(p) for p in payloads]
+        with self._lock:
+            for key in keys:
+                pending = self._pending.get(key)
+                if pending is None or sink not in pending.waiting:
+                    continue
+                pending.waiting.discard(sink)
+                if not delivered:
+                    pending.failed.add(sink)
+                if pending.waiting or pending.failed:
+                    continue
+                del self._pending[key]
+                self._keys[key] = pending.symbol
+            self._trim()
+
+    def _trim(self) -> None:
+        """Evict the oldest keys and pending items over the limit. The caller holds ``_lock``."""
+        while len(self._keys) > self._max_entries:
+            self._keys.popitem(last=False)
+        # During a long sink outage owed items pile up; forgetting the oldest
+        # means they are sent to every sink again if they are fetched again.
+        while len(self._pending) > self._max_entries:
+            del self._pending[next(iter(self._pending))]
+
+    def discard_symbols(self, symbols: frozenset[str]) -> int:
+        """Forget every key belonging to the given symbols.
+
+        Args:
+            symbols (frozenset[str]): Symbols to retire.
+
+        Returns:
+            int: Number of keys removed.
+
+        """
+        if not symbols:
+            return 0
+        with self._lock:
+            stale = [key for key, symbol in self._keys.items() if symbol in symbols]
+            for key in stale:
+                del self._keys[key]
+            for key in [k for k, p in self._pending.items() if p.symbol in symbols]:
+                del self._pending[key]
+        return len(stale)
+
+    def on_symbols_changed(self, diff: SymbolDiff) -> None:
+        """Retire keys for symbols this replica no longer owns."""
+        self.discard_symbols(diff.removed)
+
+
+_index: DedupIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_dedup_index() -> DedupIndex:
+    """Return the process-wide dedup index, tracking the output sinks' deliveries."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = DedupIndex(config_shared.get_dedup_max_entries())
+                index.track(get_output_dispatcher())
+                get_symbol_universe().subscribe(index.on_symbols_changed)
+                _index = index
+    return _index
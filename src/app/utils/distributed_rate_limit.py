@@ -0,0 +1,377 @@
+"""Cluster-wide rate limiting shared by all poller replicas.
+
+A single token bucket lives in Redis and is updated atomically by a Lua
+script. Each replica leases small batches of tokens from it and serves
+``acquire()`` calls from its local pool, so the hot path only reaches Redis
+when the pool runs dry. Lease sizes are capped at the replica's fair share
+(capacity divided by the number of replicas seen recently), so no single pod
+can drain the bucket.
+
+The backend only needs a client exposing ``register_script`` (``redis-py``),
+so it can be exercised against a local ``redis-server`` or ``fakeredis``.
+"""
+
+import asyncio
+import os
+import socket
+import threading
+import time
+from typing import Any
+
+from app import config_shared
+from app.utils.metrics import record_rate_limit_metrics
+from app.utils.rate_limit import RateLimiter, _hash_context, _sanitize_context
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# KEYS[1]: bucket hash, KEYS[2]: replica heartbeat sorted set
+# ARGV: capacity, refill rate (tokens/s), requested, member id, member ttl (s)
+# Returns: {granted, retry_after (string), active members}
+_LEASE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local member_ttl = tonumber(ARGV[5])
+
+redis.call('ZADD', KEYS[2], now, ARGV[4])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - member_ttl)
+local members = redis.call('ZCARD', KEYS[2])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local share = math.max(1, math.floor(capacity / members))
+local granted = math.max(0, math.min(requested, share, math.floor(tokens)))
+tokens = tokens - granted
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) * 2 + 1)
+redis.call('EXPIRE', KEYS[2], math.ceil(member_ttl) * 2)
+
+local retry_after = 0
+if granted == 0 then
+    retry_after = (1 - tokens) / rate
+end
+return {granted, tostring(retry_after), members}
+"""
+
+
+class RedisTokenBucket:
+    """Global token bucket stored in Redis and updated with an atomic Lua script."""
+
+    def __init__(self, client: Any, key_prefix: str = "ratelimit") -> None:
+        """Initialize the backend.
+
+        Args:
+            client (Any): A ``redis.Redis``-compatible client.
+            key_prefix (str): Prefix for the bucket and heartbeat keys.
+
+        """
+        self._client = client
+        self._key_prefix = key_prefix
+        self._script = client.register_script(_LEASE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "ratelimit") -> "RedisTokenBucket":
+        """Create a backend connected to the given Redis URL.
+
+        Raises:
+            RuntimeError: If the optional ``redis`` package is not installed.
+
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the 'redis' package") from e
+        return cls(redis.Redis.from_url(url, socket_timeout=2), key_prefix=key_prefix)
+
+    def lease(
+        self,
+        name: str,
+        capacity: int,
+        refill_rate: float,
+        requested: int,
+        member_id: str,
+        member_ttl: float,
+    ) -> tuple[int, float, int]:
+        """Lease up to ``requested`` tokens from the shared bucket.
+
+        Args:
+            name (str): Bucket name (e.g. 'newsapi').
+            capacity (int): Bucket capacity across the whole cluster.
+            refill_rate (float): Tokens added per second.
+            requested (int): Tokens wanted by this replica.
+            member_id (str): Unique id of the calling replica.
+            member_ttl (float): Seconds a replica counts as active after a lease.
+
+        Returns:
+            tuple[int, float, int]: (granted tokens, seconds until a retry can
+            succeed, number of active replicas).
+
+        """
+        keys = [f"{self._key_prefix}:{name}:bucket", f"{self._key_prefix}:{name}:members"]
+        granted, retry_after, members = self._script(
+            keys=keys, args=[capacity, refill_rate, requested, member_id, member_ttl]
+        )
+        return int(granted), float(retry_after), int(members)
+
+
+class DistributedRateLimiter:
+    """Rate limiter that shares one quota between every replica in the cluster.
+
+    Exposes the same ``acquire``/``try_acquire``/``acquire_async`` interface as
+    :class:`RateLimiter`. If the backend is unreachable it degrades to a local
+    bucket sized to this replica's last known share.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_requests: int,
+        time_window: float,
+        backend: RedisTokenBucket,
+        prefetch: int = 5,
+        member_ttl: float = 30.0,
+        member_id: str | None = None,
+    ) -> None:
+        """Initialize a distributed limiter.
+
+        Args:
+            name (str): Shared bucket name; replicas using the same name share a quota.
+            max_requests (int): Maximum requests per window across the cluster.
+            time_window (float): Time window in seconds.
+            backend (RedisTokenBucket): Shared token store.
+            prefetch (int): Tokens leased per round-trip to the backend.
+            member_ttl (float): Seconds a replica counts towards the fair share.
+            member_id (str | None): Unique replica id (defaults to hostname:pid).
+
+        Raises:
+            ValueError: If max_requests, time_window or prefetch is non-positive.
+
+        """
+        if max_requests <= 0:
+            raise ValueError("max_requests must be greater than 0")
+        if time_window <= 0:
+            raise ValueError("time_window must be greater than 0")
+        if prefetch <= 0:
+            raise ValueError("prefetch must be greater than 0")
+
+        self._name = name
+        self._max_requests = max_requests
+        self._time_window = time_window
+        self._refill_rate = max_requests / time_window
+        self._backend = backend
+        self._prefetch = min(prefetch, max_requests)
+        self._member_ttl = member_ttl
+        self._member_id = member_id or f"{socket.gethostname()}:{os.getpid()}"
+
+        self._local_tokens = 0
+        # Leased tokens expire so an idle replica cannot hoard a burst.
+        self._lease_expiry = 0.0
+        self._members = 1
+        self._fallback: RateLimiter | None = None
+        self._degraded = False
+        self._lock = threading.Lock()
+
+    @property
+    def max_requests(self) -> int:
+        """Return the cluster-wide bucket capacity."""
+        return self._max_requests
+
+    @property
+    def time_window(self) -> float:
+        """Return the window in seconds over which ``max_requests`` refill."""
+        return self._time_window
+
+    def _check_tokens(self, tokens: int) -> None:
+        """Validate a requested token count against the bucket capacity.
+
+        Raises:
+            ValueError: If tokens is not between 1 and max_requests.
+
+        """
+        if tokens < 1 or tokens > self._max_requests:
+            raise ValueError(
+                f"tokens must be between 1 and {self._max_requests}, got {tokens}"
+            )
+
+    def _get_fallback(self) -> RateLimiter:
+        """Return a local bucket sized to this replica's share of the quota."""
+        share = max(1, self._max_requests // max(1, self._members))
+        if self._fallback is None or self._fallback.max_requests != share:
+            self._fallback = RateLimiter(max_requests=share, time_window=self._time_window)
+        return self._fallback
+
+    def _take(self, tokens: int, context: str) -> float | None:
+        """Try to take tokens from the local pool, leasing more if needed.
+
+        Returns:
+            float | None: 0.0 if taken, seconds to wait if the shared bucket is
+            empty, or None if the backend failed and the fallback should be used.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._lease_expiry:
+                self._local_tokens = 0
+
+            if self._local_tokens < tokens:
+                wanted = max(self._prefetch, tokens - self._local_tokens)
+                try:
+                    granted, retry_after, self._members = self._backend.lease(
+                        self._name,
+                        self._max_requests,
+                        self._refill_rate,
+                        wanted,
+                        self._member_id,
+                        self._member_ttl,
+                    )
+                except Exception as e:  # noqa: BLE001 - any Redis error degrades to local limits
+                    if not self._degraded:
+                        logger.warning(
+                            f"⚠️ Distributed rate limiter '{self._name}' unavailable, "
+                            f"using local share: {e}"
+                        )
+                        self._degraded = True
+                    return None
+
+                if self._degraded:
+                    logger.info(f"✅ Distributed rate limiter '{self._name}' recovered")
+                    self._degraded = False
+
+                if granted:
+                    self._local_tokens += granted
+                    self._lease_expiry = now + self._time_window
+                if self._local_tokens < tokens:
+                    # Tokens granted so far stay in the local pool for the retry.
+                    missing = tokens - self._local_tokens
+                    return max(retry_after, missing / self._refill_rate)
+
+            self._local_tokens -= tokens
+            remaining = self._local_tokens
+
+        record_rate_limit_metrics(_sanitize_context(context), False, remaining)
+        return 0.0
+
+    def try_acquire(self, tokens: int = 1, context: str = "RateLimiter") -> float:
+        """Take tokens only if they are available right now.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the number of
+            seconds until they might be available.
+
+        """
+        self._check_tokens(tokens)
+        wait = self._take(tokens, context)
+        if wait is None:
+            fallback = self._get_fallback()
+            return fallback.try_acquire(min(tokens, fallback.max_requests), context)
+        if wait > 0:
+            record_rate_limit_metrics(_sanitize_context(context), True, 0.0)
+        return wait
+
+    def acquire(self, tokens: int = 1, context: str = "RateLimiter") -> float:
+        """Acquire tokens from the shared quota, blocking until available.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        self._check_tokens(tokens)
+        waited = 0.0
+        while True:
+            wait = self._take(tokens, context)
+            if wait is None:
+                fallback = self._get_fallback()
+                return waited + fallback.acquire(min(tokens, fallback.max_requests), context)
+            if wait == 0.0:
+                return waited
+            record_rate_limit_metrics(_sanitize_context(context), True, 0.0, wait)
+            logger.debug(
+                f"[ctx:{_hash_context(context)}] Shared quota '{self._name}' exhausted. "
+                f"Waiting {wait:.2f} seconds."
+            )
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, tokens: int = 1, context: str = "RateLimiter") -> float:
+        """Acquire tokens from the shared quota without blocking the event loop.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        self._check_tokens(tokens)
+        waited = 0.0
+        while True:
+            wait = await asyncio.to_thread(self._take, tokens, context)
+            if wait is None:
+                fallback = self._get_fallback()
+                return waited + await fallback.acquire_async(
+                    min(tokens, fallback.max_requests), context
+                )
+            if wait == 0.0:
+                return waited
+            record_rate_limit_metrics(_sanitize_context(context), True, 0.0, wait)
+            await asyncio.sleep(wait)
+            waited += wait
+
+
+_backend: RedisTokenBucket | None = None
+_backend_lock = threading.Lock()
+
+
+def _get_backend() -> RedisTokenBucket:
+    """Return the process-wide Redis backend, connecting on first use."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = RedisTokenBucket.from_url(config_shared.get_redis_url())
+        return _backend
+
+
+def create_rate_limiter(
+    name: str, max_requests: int, time_window: float
+) -> RateLimiter | DistributedRateLimiter:
+    """Build a rate limiter using the backend selected by RATE_LIMIT_BACKEND.
+
+    Args:
+        name (str): Quota name shared by all replicas (e.g. 'newsapi').
+        max_requests (int): Maximum requests per window.
+        time_window (float): Time window in seconds.
+
+    Returns:
+        RateLimiter | DistributedRateLimiter: Local or cluster-wide limiter.
+
+    """
+    backend = config_shared.get_rate_limit_backend()
+    if backend == "redis":
+        logger.info(f"🌐 Using Redis rate limiter for '{name}'")
+        return DistributedRateLimiter(
+            name,
+            max_requests,
+            time_window,
+            backend=_get_backend(),
+            prefetch=config_shared.get_rate_limit_prefetch(),
+            member_ttl=config_shared.get_rate_limit_member_ttl(),
+        )
+    if backend != "local":
+        logger.warning(f"⚠️ Unknown RATE_LIMIT_BACKEND '{backend}', using local limiter")
+    return RateLimiter(max_requests=max_requests, time_window=time_window)
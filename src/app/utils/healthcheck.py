@@ -38,8 +38,10 @@ def is_healthy() -> bool:
 
 
 def set_ready() -> None:
-    """Mark the service as ready to handle traffic."""
+    """Mark the service as ready to handle traffic; later calls are no-ops."""
     global _readiness_flag
+    if _readiness_flag:
+        return
     _readiness_flag = True
     logger.info("✅ Service marked as ready")
 
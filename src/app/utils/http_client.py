@@ -0,0 +1,283 @@
+"""Shared HTTP client used by all pollers.
+
+Every outbound request goes through :func:`http_get`, which acquires from the
+rate limit registry for the target host (and API key, if any) and then sends
+the request over a process-wide keep-alive ``requests.Session``. Each host has
+a circuit breaker: once it keeps failing (connection errors, timeouts or 5xx),
+requests to it fail fast with :class:`CircuitOpenError` until a probe succeeds.
+Passing ``source`` retries transient failures under that source's retry policy.
+
+Identical concurrent requests (same URL, parameters, headers and credential)
+are coalesced: one network call is made and every caller receives the same
+response. :func:`http_get_parsed` additionally shares one parsed result.
+Disable with SINGLE_FLIGHT_ENABLED=false.
+
+Sources with a cache TTL (``<SOURCE>_CACHE_TTL`` or HTTP_CACHE_TTL) are served
+from the shared response cache; see :mod:`app.utils.response_cache`.
+HTTP_CASSETTE_MODE=record|replay swaps the session for a cassette recorder or
+player; see :mod:`app.utils.cassette`. HTTP_UPSTREAM_OVERRIDE sends every
+request to ``<override>/<original host><path>`` (e.g. a local fake upstream)
+while rate limits and circuit breakers still apply per original host.
+
+Each attempt is counted in the HTTP request metrics per host and status, and
+each :func:`http_get` call with a ``source`` is timed as that source's
+``fetch`` stage (including retries and cache lookups).
+"""
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeAlias, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app import config_shared
+from app.utils.cassette import RecordingSession, ReplaySession
+from app.utils.circuit_breaker import get_circuit_breaker
+from app.utils.metrics import record_http_metrics
+from app.utils.rate_limit_registry import get_rate_limit_registry
+from app.utils.response_cache import CachedResponse, get_response_cache
+from app.utils.retry_policy import RETRYABLE_STATUS, get_retry_policy
+from app.utils.setup_logger import setup_logger
+from app.utils.single_flight import SingleFlight
+from app.utils.stage_timer import stage
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+# What http_get returns: a live response, or a cached copy for cached sources.
+HttpResponse: TypeAlias = requests.Response | CachedResponse
+
+_flight = SingleFlight("http")
+
+HttpSession: TypeAlias = requests.Session | RecordingSession | ReplaySession
+
+_session: HttpSession | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> HttpSession:
+    """Return the shared pooled session, creating it on first use.
+
+    Returns:
+        HttpSession: Session with keep-alive connection pools per host, wrapped
+            by a cassette recorder, or a cassette player in replay mode.
+
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
+
+
+def _create_session() -> HttpSession:
+    """Create the session for the configured cassette mode."""
+    mode = config_shared.get_http_cassette_mode()
+    path = config_shared.get_http_cassette_path()
+    if mode == "replay":
+        seed = config_shared.get_http_cassette_seed()
+        return ReplaySession(
+            path,
+            latency_ms=config_shared.get_http_cassette_latency_ms(),
+            error_rate=config_shared.get_http_cassette_error_rate(),
+            seed=int(seed) if seed else None,
+        )
+
+    pool_size = config_shared.get_http_pool_size()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if mode == "record":
+        return RecordingSession(session, path)
+    return session
+
+
+def http_get(
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 10,
+    credential: str | None = None,
+    source: str | None = None,
+) -> HttpResponse:
+    """Send a rate-limited GET request through the shared session.
+
+    With ``source`` set, connection errors, timeouts and retryable statuses
+    (429, 5xx, ...) are retried with jittered backoff; each attempt is rate
+    limited and goes through the host's circuit breaker.
+
+    Args:
+        url (str): Target URL.
+        params (dict[str, Any] | None): Query string parameters.
+        headers (dict[str, str] | None): Extra request headers.
+        timeout (float): Request timeout in seconds.
+        credential (str | None): API key sent with the request, used to select
+            the per-key rate limit. It is never logged.
+        source (str | None): Source name selecting the retry policy and cache
+            TTL; None sends a single, uncached attempt.
+
+    Returns:
+        HttpResponse: The response; callers decide how to handle errors. A
+            coalesced or cached response is shared with other callers and
+            must not be modified.
+
+    Raises:
+        CircuitOpenError: If the host's circuit is open.
+        requests.RequestException: On connection errors or timeouts.
+        requests.HTTPError: If retries end on a retryable status.
+
+    """
+    key = _request_key(url, params, headers, credential)
+
+    def load() -> requests.Response:
+        if not config_shared.get_single_flight_enabled():
+            return _get(url, params, headers, timeout, credential, source)
+        return _flight.do(key, _get, url, params, headers, timeout, credential, source)
+
+    if source is None:
+        return load()
+    with stage(source, "fetch"):
+        ttl = config_shared.get_http_cache_ttl(source)
+        if ttl > 0:
+            return get_response_cache().fetch(key, source, ttl, load)
+        return load()
+
+
+def http_get_parsed(
+    url: str,
+    parse: Callable[[HttpResponse], T],
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    timeout: float = 10,
+    credential: str | None = None,
+    source: str | None = None,
+) -> T:
+    """Fetch a URL and parse the response, sharing both with concurrent callers.
+
+    Callers that request the same URL with the same ``parse`` function while a
+    fetch is in flight receive the same parsed object, so it must be treated
+    as read-only.
+
+    Args:
+        url (str): Target URL.
+        parse (Callable[[HttpResponse], T]): Turns the response into the
+            result; it may raise (e.g. via ``raise_for_status``).
+        params (dict[str, Any] | None): Query string parameters.
+        headers (dict[str, str] | None): Extra request headers.
+        timeout (float): Request timeout in seconds.
+        credential (str | None): API key sent with the request.
+        source (str | None): Source name selecting the retry policy.
+
+    Returns:
+        T: The parsed result.
+
+    """
+
+    def fetch_and_parse() -> T:
+        response = http_get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            credential=credential,
+            source=source,
+        )
+        return parse(response)
+
+    if not config_shared.get_single_flight_enabled():
+        return fetch_and_parse()
+    key = (parse, _request_key(url, params, headers, credential))
+    return _flight.do(key, fetch_and_parse)
+
+
+def _upstream_url(url: str) -> str:
+    """Rewrite a URL to HTTP_UPSTREAM_OVERRIDE, if set."""
+    override = config_shared.get_http_upstream_override()
+    if not override:
+        return url
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{override.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+
+def _request_key(
+    url: str,
+    params: dict[str, Any] | None,
+    headers: dict[str, str] | None,
+    credential: str | None,
+) -> Hashable:
+    """Return the coalescing key for a GET request."""
+    return (
+        url,
+        tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+        tuple(sorted((headers or {}).items())),
+        credential,
+    )
+
+
+def _get(
+    url: str,
+    params: dict[str, Any] | None,
+    headers: dict[str, str] | None,
+    timeout: float,
+    credential: str | None,
+    source: str | None,
+) -> requests.Response:
+    """Send a GET, retrying under the source's policy if one is given."""
+    if source is None:
+        return _get_once(url, params, headers, timeout, credential)
+    return get_retry_policy(source).call(
+        _get_retryable, url, params, headers, timeout, credential
+    )
+
+
+def _get_retryable(
+    url: str,
+    params: dict[str, Any] | None,
+    headers: dict[str, str] | None,
+    timeout: float,
+    credential: str | None,
+) -> requests.Response:
+    """Send one attempt, raising HTTPError on a retryable status."""
+    response = _get_once(url, params, headers, timeout, credential)
+    if response.status_code in RETRYABLE_STATUS:
+        response.raise_for_status()
+    return response
+
+
+def _get_once(
+    url: str,
+    params: dict[str, Any] | None,
+    headers: dict[str, str] | None,
+    timeout: float,
+    credential: str | None,
+) -> requests.Response:
+    """Send one rate-limited GET through the host's circuit breaker."""
+    host = urlsplit(url).hostname or ""
+    breaker = get_circuit_breaker(f"http:{host}")
+    get_rate_limit_registry().acquire(host, credential=credential)
+    logger.debug(f"🔗 GET {host}{urlsplit(url).path}")
+    target = _upstream_url(url)
+    # Checked right before the request so a half-open probe always reports back.
+    breaker.check()
+    start = time.perf_counter()
+    try:
+        response = get_session().get(target, params=params, headers=headers, timeout=timeout)
+    except Exception:
+        record_http_metrics(host, "GET", "error", time.perf_counter() - start)
+        breaker.record_failure()
+        raise
+    record_http_metrics(host, "GET", str(response.status_code), time.perf_counter() - start)
+    if response.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
@@ -8,6 +8,8 @@ Exports counters and histograms for:
 - Paper trading
 - Rate limiting
 - Optional sinks: REST, S3, database
+- Dead-lettered messages
+- Per-stage poll cycle timing
 """
 
 import re
@@ -151,11 +153,23 @@ validation_failures = Counter(
 
 validation_duration = Histogram(
     "message_validation_duration_seconds",
-    "Duration of validation checks per message.",
+    "Duration of validation checks per message or batch.",
     ["processor"],
     buckets=[0.001, 0.01, 0.1, 0.5],
 )
 
+validation_items = Counter(
+    "message_validation_items_total",
+    "Number of messages checked by batch validation.",
+    ["processor"],
+)
+
+validation_field_errors = Counter(
+    "message_validation_field_errors_total",
+    "Number of messages rejected by validation, by first failing field.",
+    ["processor", "field"],
+)
+
 
 def record_processing_metrics(processor: str, success: bool, duration_sec: float) -> None:
     processor = _sanitize_label(processor)
@@ -173,6 +187,31 @@ def record_validation_metrics(processor: str, duration_sec: float, failed: bool
     validation_duration.labels(processor=processor).observe(duration_sec)
 
 
+def record_batch_validation_metrics(
+    processor: str, items: int, duration_sec: float, field_errors: dict[str, int]
+) -> None:
+    """Record metrics for one validated batch.
+
+    The cost per 10k messages is ``validation_duration`` sum divided by
+    ``message_validation_items_total``, times 10000.
+
+    Args:
+        processor (str): Component that ran the validation.
+        items (int): Number of messages in the batch.
+        duration_sec (float): Time taken to validate the whole batch.
+        field_errors (dict[str, int]): Rejected messages per failing field.
+
+    """
+    processor = _sanitize_label(processor)
+    validation_items.labels(processor=processor).inc(items)
+    validation_duration.labels(processor=processor).observe(duration_sec)
+    for field, count in field_errors.items():
+        validation_failures.labels(processor=processor).inc(count)
+        validation_field_errors.labels(processor=processor, field=_sanitize_label(field)).inc(
+            count
+        )
+
+
 # -----------------------------
 # Paper Trading Metrics
 # -----------------------------
@@ -221,10 +260,21 @@ rate_limiter_tokens_remaining = Gauge(
 )
 
 
-def record_rate_limit_metrics(context: str, blocked: bool, tokens_remaining: float) -> None:
+rate_limiter_blocked_seconds = Counter(
+    "rate_limiter_blocked_seconds_total",
+    "Total time callers spent waiting on the rate limiter",
+    ["context"],
+)
+
+
+def record_rate_limit_metrics(
+    context: str, blocked: bool, tokens_remaining: float, blocked_seconds: float = 0.0
+) -> None:
     context = _sanitize_label(context)
     if blocked:
         rate_limiter_blocked_total.labels(context=context).inc()
+    if blocked_seconds > 0:
+        rate_limiter_blocked_seconds.labels(context=context).inc(blocked_seconds)
     rate_limiter_tokens_remaining.labels(context=context).set(tokens_remaining)
 
 
@@ -288,9 +338,65 @@ db_dispatch_duration = Histogram(
     buckets=[0.01, 0.1, 0.5, 1, 2, 5],
 )
 
+sink_batch_size = Histogram(
+    "sink_batch_size",
+    "Number of messages per output sink write.",
+    ["sink"],
+    buckets=[1, 10, 50, 100, 250, 500, 1000, 5000],
+)
+
+
+s3_upload_duration = Histogram(
+    "s3_upload_duration_seconds",
+    "Time taken by S3 archive uploads, by kind (part, complete, put, parquet).",
+    ["kind"],
+    buckets=[0.05, 0.1, 0.5, 1, 2, 5, 10, 30],
+)
+
+s3_upload_bytes = Counter(
+    "s3_upload_bytes_total",
+    "Compressed bytes uploaded to the S3 archive, by kind.",
+    ["kind"],
+)
+
+
+def record_s3_upload_metrics(kind: str, size_bytes: int, duration_sec: float) -> None:
+    """Record one S3 archive upload.
+
+    Args:
+        kind (str): Upload step ("part", "complete", "put" or "parquet").
+        size_bytes (int): Bytes uploaded by this step.
+        duration_sec (float): Time taken by the upload.
+
+    """
+    kind = _sanitize_label(kind)
+    s3_upload_duration.labels(kind=kind).observe(duration_sec)
+    s3_upload_bytes.labels(kind=kind).inc(size_bytes)
+
+
+def record_sink_metrics(
+    sink: str,
+    status: str,
+    duration_sec: float,
+    failed: bool = False,
+    batch_size: int | None = None,
+) -> None:
+    """Record one output sink write.
 
-def record_sink_metrics(sink: str, status: str, duration_sec: float, failed: bool = False) -> None:
+    REST, S3 and database sinks have dedicated metrics; other sinks (queue,
+    log, stdout) are recorded as output metrics under their mode.
+
+    Args:
+        sink (str): Sink name (e.g. "rest", "s3", "database").
+        status (str): Outcome (e.g. "success", "failure", "dropped").
+        duration_sec (float): Time taken by the write.
+        failed (bool): Whether the write failed.
+        batch_size (int | None): Messages in the write, if it was a batch.
+
+    """
     status = _sanitize_label(status)
+    if batch_size is not None:
+        sink_batch_size.labels(sink=_sanitize_label(sink)).observe(batch_size)
     if sink == "rest":
         rest_dispatch_counter.labels(status=status).inc()
         rest_dispatch_duration.labels(status=status).observe(duration_sec)
@@ -301,11 +407,13 @@ def record_sink_metrics(sink: str, status: str, duration_sec: float, failed: boo
         s3_dispatch_duration.labels(status=status).observe(duration_sec)
         if failed:
             s3_dispatch_failures.labels(status=status).inc()
-    elif sink == "db":
+    elif sink in ("db", "database"):
         db_dispatch_counter.labels(status=status).inc()
         db_dispatch_duration.labels(status=status).observe(duration_sec)
         if failed:
             db_dispatch_failures.labels(status=status).inc()
+    else:
+        record_output_metrics(sink, not failed, duration_sec)
 
 
 # -----------------------------
@@ -338,3 +446,211 @@ def record_queue_metrics(queue_type: str, status: str, duration_sec: float) -> N
     status = _sanitize_label(status)
     queue_publish_counter.labels(queue_type=queue_type, status=status).inc()
     queue_publish_latency.labels(queue_type=queue_type, status=status).observe(duration_sec)
+
+
+# -----------------------------
+# Dead Letter Metrics
+# -----------------------------
+dead_letter_counter = Counter(
+    "dead_letter_messages_total",
+    "Total number of messages dead-lettered, by reason and target.",
+    ["reason", "target"],
+)
+
+
+def record_dead_letter_metrics(reason: str, target: str, count: int = 1) -> None:
+    """Record dead-lettered messages.
+
+    Args:
+        reason (str): Why the messages were rejected (e.g. "oversize").
+        target (str): Where they were sent ("rabbitmq", "sqs" or "file").
+        count (int): Number of messages.
+
+    """
+    dead_letter_counter.labels(reason=_sanitize_label(reason), target=_sanitize_label(target)).inc(
+        count
+    )
+
+
+# -----------------------------
+# Circuit Breaker Metrics
+# -----------------------------
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+circuit_breaker_state = Gauge(
+    "circuit_breaker_state",
+    "Current circuit breaker state (0=closed, 1=half_open, 2=open).",
+    ["breaker"],
+)
+
+circuit_breaker_transitions = Counter(
+    "circuit_breaker_transitions_total",
+    "Total number of circuit breaker state transitions.",
+    ["breaker", "from_state", "to_state"],
+)
+
+circuit_breaker_open_seconds = Counter(
+    "circuit_breaker_open_seconds_total",
+    "Total time circuit breakers spent open.",
+    ["breaker"],
+)
+
+circuit_breaker_rejections = Counter(
+    "circuit_breaker_rejections_total",
+    "Total number of calls rejected by an open circuit breaker.",
+    ["breaker"],
+)
+
+
+def record_circuit_transition(
+    breaker: str, from_state: str, to_state: str, open_seconds: float = 0.0
+) -> None:
+    """Record a circuit breaker state change.
+
+    Args:
+        breaker (str): Breaker key (e.g. "http:finance.yahoo.com", "sink:rabbitmq").
+        from_state (str): Previous state.
+        to_state (str): New state.
+        open_seconds (float): Time spent open, when leaving the open state.
+
+    """
+    breaker = _sanitize_label(breaker)
+    circuit_breaker_transitions.labels(
+        breaker=breaker, from_state=from_state, to_state=to_state
+    ).inc()
+    circuit_breaker_state.labels(breaker=breaker).set(CIRCUIT_STATE_VALUES[to_state])
+    if open_seconds > 0:
+        circuit_breaker_open_seconds.labels(breaker=breaker).inc(open_seconds)
+
+
+def record_circuit_rejection(breaker: str) -> None:
+    """Record a call rejected by an open circuit breaker.
+
+    Args:
+        breaker (str): Breaker key.
+
+    """
+    circuit_breaker_rejections.labels(breaker=_sanitize_label(breaker)).inc()
+
+
+# -----------------------------
+# Retry Metrics
+# -----------------------------
+retry_decisions = Counter(
+    "retry_decisions_total",
+    "Retry decisions after failed attempts, by source and outcome "
+    "(retried, exhausted, not_retryable, budget_exhausted).",
+    ["source", "outcome"],
+)
+
+
+def record_retry_metrics(source: str, outcome: str) -> None:
+    """Record what the retry policy did after a failed attempt.
+
+    Args:
+        source (str): Source or sink name.
+        outcome (str): 'retried', 'exhausted', 'not_retryable' or 'budget_exhausted'.
+
+    """
+    retry_decisions.labels(source=_sanitize_label(source), outcome=outcome).inc()
+
+
+# -----------------------------
+# Request Coalescing Metrics
+# -----------------------------
+single_flight_calls = Counter(
+    "single_flight_calls_total",
+    "Calls through a single-flight group; role=shared calls were collapsed "
+    "into an identical in-flight call.",
+    ["group", "role"],
+)
+
+
+def record_single_flight_metrics(group: str, shared: bool) -> None:
+    """Record one call through a single-flight group.
+
+    Args:
+        group (str): Group name (e.g. "http").
+        shared (bool): Whether the call reused an in-flight call's result.
+
+    """
+    single_flight_calls.labels(
+        group=_sanitize_label(group), role="shared" if shared else "leader"
+    ).inc()
+
+
+# -----------------------------
+# HTTP Response Cache Metrics
+# -----------------------------
+http_cache_requests = Counter(
+    "http_cache_requests_total",
+    "HTTP cache lookups by source and result (hit, stale, miss).",
+    ["source", "result"],
+)
+
+http_cache_bytes_saved = Counter(
+    "http_cache_bytes_saved_total",
+    "Response bytes served from the HTTP cache instead of the network.",
+    ["source"],
+)
+
+http_cache_size_bytes = Gauge(
+    "http_cache_size_bytes",
+    "Bytes currently held by the HTTP response cache.",
+)
+
+http_cache_entries = Gauge(
+    "http_cache_entries",
+    "Responses currently held by the HTTP response cache.",
+)
+
+
+def record_http_cache_metrics(source: str, result: str, bytes_saved: int) -> None:
+    """Record one HTTP cache lookup.
+
+    Args:
+        source (str): Source name.
+        result (str): 'hit', 'stale' or 'miss'.
+        bytes_saved (int): Body bytes served without a network call.
+
+    """
+    source = _sanitize_label(source)
+    http_cache_requests.labels(source=source, result=result).inc()
+    if bytes_saved:
+        http_cache_bytes_saved.labels(source=source).inc(bytes_saved)
+
+
+def set_http_cache_size(size_bytes: int, entries: int) -> None:
+    """Update the HTTP cache size gauges.
+
+    Args:
+        size_bytes (int): Bytes held.
+        entries (int): Number of entries.
+
+    """
+    http_cache_size_bytes.set(size_bytes)
+    http_cache_entries.set(entries)
+
+
+# -----------------------------
+# Stage Timing Metrics
+# -----------------------------
+stage_duration = Histogram(
+    "poller_stage_duration_seconds",
+    "Time spent per source in each stage of a poll cycle or publish "
+    "(fetch, parse, build, validate, serialize, publish).",
+    ["source", "stage"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+)
+
+
+def record_stage_metrics(source: str, stage: str, duration_sec: float) -> None:
+    """Record the duration of one stage.
+
+    Args:
+        source (str): Source name, or sink name for publisher stages.
+        stage (str): Stage name.
+        duration_sec (float): Time spent in the stage.
+
+    """
+    stage_duration.labels(source=_sanitize_label(source), stage=stage).observe(duration_sec)
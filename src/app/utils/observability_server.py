@@ -0,0 +1,170 @@
+"""Combined metrics, health and debug HTTP endpoint.
+
+One small HTTP server on one background thread serves:
+
+- ``/metrics``: Prometheus exposition of the default registry. The rendered
+  text (and its gzip form, for scrapers that accept it) is cached for
+  METRICS_CACHE_SECONDS, so several scrapers or a large label set cost one
+  render per interval rather than one per request.
+- ``/health``: liveness, 200 unless the service was marked unhealthy.
+- ``/ready``: readiness, 200 once a message has been published successfully.
+- ``/debug/stats``: JSON process statistics and circuit breaker states.
+
+It listens on METRICS_BIND_ADDRESS:METRICS_PORT. ``/metrics`` is only served
+when METRICS_ENABLED is true, and ``/health`` and ``/ready`` only when
+HEALTHCHECK_ENABLED is true; the server is not started if both are off.
+"""
+
+import gzip
+import json
+import os
+import resource
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlsplit
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+
+from app import config_shared
+from app.utils import healthcheck
+from app.utils.circuit_breaker import circuit_breaker_states
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_started_at = time.time()
+
+
+class ExpositionCache:
+    """Render the metrics registry at most once per ``ttl`` seconds."""
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl (float): Seconds a rendering is reused; 0 renders every scrape.
+
+        """
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._rendered_at = float("-inf")
+        self._body = b""
+        self._gzipped: bytes | None = None
+
+    def get(self, compressed: bool = False) -> bytes:
+        """Return the exposition text, rendering it if the copy is too old.
+
+        Args:
+            compressed (bool): Return the gzip-compressed form.
+
+        Returns:
+            bytes: Exposition body.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._rendered_at >= self._ttl:
+                self._body = generate_latest(REGISTRY)
+                self._gzipped = None
+                self._rendered_at = now
+            if not compressed:
+                return self._body
+            if self._gzipped is None:
+                self._gzipped = gzip.compress(self._body, compresslevel=1)
+            return self._gzipped
+
+
+def debug_stats() -> dict[str, object]:
+    """Return process statistics for ``/debug/stats``."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {
+        "service": config_shared.get_service_name(),
+        "pid": os.getpid(),
+        "uptime_seconds": round(time.time() - _started_at, 1),
+        "ready": healthcheck.is_ready(),
+        "healthy": healthcheck.is_healthy(),
+        "threads": threading.active_count(),
+        "cpu_seconds": round(usage.ru_utime + usage.ru_stime, 3),
+        "max_rss_mib": round(usage.ru_maxrss / 1024, 1),
+        "circuit_breakers": circuit_breaker_states(),
+    }
+
+
+def _make_handler(
+    metrics: ExpositionCache | None, health_enabled: bool
+) -> type[BaseHTTPRequestHandler]:
+    """Build the request handler for the enabled endpoints."""
+
+    class ObservabilityHandler(BaseHTTPRequestHandler):
+        """Route GET requests to the observability endpoints."""
+
+        def do_GET(self) -> None:
+            """Serve one endpoint."""
+            path = urlsplit(self.path).path
+            if path == "/metrics" and metrics is not None:
+                compressed = "gzip" in self.headers.get("Accept-Encoding", "")
+                body = metrics.get(compressed)
+                self._reply(200, body, CONTENT_TYPE_LATEST, gzipped=compressed)
+            elif path == "/health" and health_enabled:
+                healthy = healthcheck.is_healthy()
+                self._reply(200 if healthy else 500, b"healthy" if healthy else b"unhealthy")
+            elif path == "/ready" and health_enabled:
+                ready = healthcheck.is_ready()
+                self._reply(200 if ready else 503, b"ready" if ready else b"not ready")
+            elif path == "/debug/stats":
+                body = json.dumps(debug_stats(), sort_keys=True).encode("utf-8")
+                self._reply(200, body, "application/json")
+            else:
+                self._reply(404, b"not found")
+
+        def _reply(
+            self,
+            status: int,
+            body: bytes,
+            content_type: str = "text/plain; charset=utf-8",
+            gzipped: bool = False,
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            """Suppress per-request access logs."""
+
+    return ObservabilityHandler
+
+
+def start_observability_server() -> HTTPServer | None:
+    """Start the combined endpoint on a daemon thread.
+
+    Returns:
+        HTTPServer | None: The running server, or None if it is disabled or
+            the port could not be bound.
+
+    """
+    metrics_enabled = config_shared.get_metrics_enabled()
+    health_enabled = config_shared.get_healthcheck_enabled()
+    if not (metrics_enabled or health_enabled):
+        logger.info("⚠️ Observability server is disabled by configuration.")
+        return None
+
+    metrics = None
+    if metrics_enabled:
+        metrics = ExpositionCache(config_shared.get_metrics_cache_seconds())
+    host = config_shared.get_metrics_bind_address()
+    port = config_shared.get_metrics_port()
+    try:
+        server = HTTPServer((host, port), _make_handler(metrics, health_enabled))
+    except OSError as e:
+        logger.error(f"❌ Could not start observability server on {host}:{port}: {e}")
+        return None
+
+    thread = threading.Thread(target=server.serve_forever, name="observability", daemon=True)
+    thread.start()
+    logger.info(f"📡 Observability server running on {host}:{port}")
+    return server
@@ -1,32 +1,23 @@
 """Thread-safe rate limiter using the token bucket algorithm.
 
+Waiters reserve tokens under a short critical section and then sleep outside
+of it, so concurrent callers are served in arrival (FIFO) order instead of
+serializing behind a single sleeper. Blocking, non-blocking, weighted and
+asyncio variants share the same bucket.
+
 Includes Prometheus metrics and context hashing for structured logs.
 """
 
+import asyncio
 import hashlib
-import re
 import threading
 import time
 
-from prometheus_client import Counter, Gauge
-
+from app.utils.metrics import _sanitize_label, record_rate_limit_metrics
 from app.utils.setup_logger import setup_logger
 
 logger = setup_logger(__name__)
 
-# Prometheus metrics
-rate_limiter_blocked_total = Counter(
-    "rate_limiter_blocked_total",
-    "Total number of times the rate limiter blocked",
-    ["context"],
-)
-
-rate_limiter_tokens_remaining = Gauge(
-    "rate_limiter_tokens_remaining",
-    "Current number of available tokens in the rate limiter",
-    ["context"],
-)
-
 
 def _sanitize_context(context: str) -> str:
     """Sanitize a context string for use in Prometheus metric labels.
@@ -40,7 +31,7 @@ def _sanitize_context(context: str) -> str:
         str: Sanitized context label.
 
     """
-    return re.sub(r"[^\w\-:.]", "_", context)[:64]
+    return _sanitize_label(context)
 
 
 def _hash_context(context: str) -> str:
@@ -59,7 +50,9 @@ def _hash_context(context: str) -> str:
 class RateLimiter:
     """Thread-safe token bucket rate limiter with Prometheus integration.
 
-    Allows a maximum number of requests in a defined time window.
+    Allows a maximum number of requests in a defined time window. Tokens may
+    be reserved ahead of time: the bucket balance goes negative while callers
+    are waiting, and each new reservation is scheduled after all earlier ones.
     """
 
     def __init__(self, max_requests: int, time_window: float) -> None:
@@ -80,55 +73,152 @@ class RateLimiter:
 
         self._max_requests = max_requests
         self._time_window = time_window
+        self._refill_rate: float = max_requests / time_window
         self._tokens: float = float(max_requests)
-        self._last_check: float = time.time()
+        self._last_check: float = time.monotonic()
         self._lock = threading.Lock()
 
-    def acquire(self, context: str = "RateLimiter") -> None:
-        """Acquire a token, blocking if rate limit is exceeded.
+    @property
+    def max_requests(self) -> int:
+        """Return the bucket capacity."""
+        return self._max_requests
+
+    @property
+    def time_window(self) -> float:
+        """Return the window in seconds over which ``max_requests`` refill."""
+        return self._time_window
+
+    def _check_tokens(self, tokens: int) -> None:
+        """Validate a requested token count against the bucket capacity.
+
+        Raises:
+            ValueError: If tokens is not between 1 and max_requests.
+
+        """
+        if tokens < 1 or tokens > self._max_requests:
+            raise ValueError(
+                f"tokens must be between 1 and {self._max_requests}, got {tokens}"
+            )
+
+    def _refill(self) -> None:
+        """Replenish tokens based on elapsed time. Caller must hold the lock."""
+        now = time.monotonic()
+        elapsed = now - self._last_check
+        if elapsed > 0:
+            self._tokens = min(
+                float(self._max_requests), self._tokens + elapsed * self._refill_rate
+            )
+            self._last_check = now
 
-        Replenishes tokens based on elapsed time. Updates Prometheus metrics
-        and logs token state per context.
+    def _reserve(self, tokens: int) -> tuple[float, float]:
+        """Reserve tokens and return the time until they become usable.
 
         Args:
-            context (str): Label for Prometheus/logging context.
+            tokens (int): Number of tokens to reserve.
 
         Returns:
-            None
+            tuple[float, float]: (seconds to wait, remaining token balance).
 
         """
-        context_label = _sanitize_context(context)
-        context_id = _hash_context(context)
-
         with self._lock:
-            current_time = time.time()
-            elapsed = current_time - self._last_check
-            self._last_check = current_time
+            self._refill()
+            self._tokens -= tokens
+            remaining = self._tokens
 
-            # Replenish tokens based on elapsed time
-            refill_rate = self._max_requests / self._time_window
-            tokens_to_add = elapsed * refill_rate
-            self._tokens = min(self._max_requests, self._tokens + tokens_to_add)
+        wait = -remaining / self._refill_rate if remaining < 0 else 0.0
+        return wait, remaining
 
-            rate_limiter_tokens_remaining.labels(context=context_label).set(self._tokens)
+    def _release(self, tokens: int) -> None:
+        """Return unused reserved tokens to the bucket (e.g. on cancellation)."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(float(self._max_requests), self._tokens + tokens)
+
+    def _on_reserved(self, context: str, wait: float, remaining: float) -> None:
+        """Update metrics and logs after a reservation."""
+        context_label = _sanitize_context(context)
+        record_rate_limit_metrics(context_label, wait > 0, max(remaining, 0.0), wait)
+        if wait > 0:
+            logger.info(
+                f"[ctx:{_hash_context(context)}] Rate limit hit. "
+                f"Waiting {wait:.2f} seconds."
+            )
+        else:
             logger.debug(
-                f"[ctx:{context_id}] Replenished {tokens_to_add:.2f} tokens. "
-                f"Available: {self._tokens:.2f}"
+                f"[ctx:{_hash_context(context)}] Token consumed. Remaining: {remaining:.2f}"
             )
 
-            # If no tokens available, sleep and refill one
-            if self._tokens < 1:
-                sleep_time = (1 - self._tokens) / refill_rate
-                sleep_time = min(sleep_time, self._time_window)
-
-                logger.info(
-                    f"[ctx:{context_id}] Rate limit hit. Sleeping for {sleep_time:.2f} seconds."
-                )
-                rate_limiter_blocked_total.labels(context=context_label).inc()
-                time.sleep(sleep_time)
-                self._tokens = 1.0  # Ensure 1 token is available after sleep
-
-            # Consume a token
-            self._tokens -= 1
-            rate_limiter_tokens_remaining.labels(context=context_label).set(self._tokens)
-            logger.debug(f"[ctx:{context_id}] Token consumed. Remaining: {self._tokens:.2f}")
+    def try_acquire(self, tokens: int = 1, context: str = "RateLimiter") -> float:
+        """Take tokens only if they are available right now.
+
+        Never blocks and never jumps ahead of callers already waiting.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the number of
+            seconds until they would be available.
+
+        """
+        self._check_tokens(tokens)
+
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                remaining = self._tokens
+                wait = 0.0
+            else:
+                remaining = self._tokens
+                wait = (tokens - self._tokens) / self._refill_rate
+
+        record_rate_limit_metrics(_sanitize_context(context), wait > 0, max(remaining, 0.0))
+        return wait
+
+    def acquire(self, tokens: int = 1, context: str = "RateLimiter") -> float:
+        """Acquire tokens, blocking until they are available.
+
+        The wait happens outside the lock, so other callers can queue their
+        own reservations concurrently and are released in arrival order.
+
+        Args:
+            tokens (int): Number of tokens to take (e.g. batch size).
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        self._check_tokens(tokens)
+        wait, remaining = self._reserve(tokens)
+        self._on_reserved(context, wait, remaining)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 1, context: str = "RateLimiter") -> float:
+        """Acquire tokens without blocking the event loop.
+
+        If the awaiting task is cancelled, its reservation is returned to the
+        bucket so later callers are not penalized.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            context (str): Label for Prometheus/logging context.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        """
+        self._check_tokens(tokens)
+        wait, remaining = self._reserve(tokens)
+        self._on_reserved(context, wait, remaining)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._release(tokens)
+                raise
+        return wait
@@ -0,0 +1,220 @@
+"""Registry of nested rate limiters keyed by upstream host and API credential.
+
+Every outbound request acquires from up to three levels, innermost first:
+
+- credential: a per-API-key quota (e.g. NewsAPI 60/min per key)
+- host: a per-upstream quota for unauthenticated scraping (e.g. Finviz 30/min)
+- ip: a process-wide quota shared by all hosts (e.g. 300/min per pod)
+
+Limits are built lazily from the ``get_*_fill_rate_limit`` getters in
+``config_shared`` and use the backend chosen by ``create_rate_limiter`` so they
+are cluster-wide when RATE_LIMIT_BACKEND=redis. Time spent blocked is exported
+per limiter via ``rate_limiter_blocked_seconds_total``.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import TypeAlias
+
+from app import config_shared
+from app.utils.distributed_rate_limit import DistributedRateLimiter, create_rate_limiter
+from app.utils.rate_limit import RateLimiter, _hash_context
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+Limiter: TypeAlias = RateLimiter | DistributedRateLimiter
+LimitGetter: TypeAlias = Callable[[], tuple[int, float]]
+
+
+def _per_minute(getter_name: str) -> LimitGetter:
+    """Adapt a requests-per-minute ``config_shared`` getter to a (max_requests, window) getter.
+
+    The getter is looked up at call time because ``config_shared`` may still be
+    initializing when this module is first imported.
+    """
+    return lambda: (getattr(config_shared, getter_name)(), 60.0)
+
+
+# Unauthenticated hosts: quota applies to every request to the host.
+HOST_LIMITS: dict[str, LimitGetter] = {
+    "finviz.com": _per_minute("get_finviz_fill_rate_limit"),
+    "finance.yahoo.com": _per_minute("get_yfinance_fill_rate_limit"),
+    "api.stocktwits.com": _per_minute("get_stocktwits_fill_rate_limit"),
+    "news.google.com": _per_minute("get_google_news_fill_rate_limit"),
+    "seekingalpha.com": _per_minute("get_seekingalpha_fill_rate_limit"),
+    "www.youtube.com": _per_minute("get_youtube_fill_rate_limit"),
+}
+
+# Authenticated hosts: quota applies per API key.
+CREDENTIAL_LIMITS: dict[str, LimitGetter] = {
+    "newsapi.org": lambda: config_shared.get_newsapi_fill_rate_limit(),
+    "api.benzinga.com": _per_minute("get_benzinga_fill_rate_limit"),
+    "www.googleapis.com": _per_minute("get_youtube_fill_rate_limit"),
+}
+
+
+class HierarchicalRateLimiter:
+    """Acquire from a chain of limiters, innermost (most specific) first."""
+
+    def __init__(self, levels: list[tuple[str, Limiter]]) -> None:
+        """Initialize the chain.
+
+        Args:
+            levels (list[tuple[str, Limiter]]): (metric label, limiter) pairs,
+                ordered from innermost to outermost.
+
+        """
+        self._levels = levels
+
+    @property
+    def levels(self) -> list[tuple[str, Limiter]]:
+        """Return the (label, limiter) pairs in acquisition order."""
+        return list(self._levels)
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Acquire tokens from every level, blocking as needed.
+
+        Args:
+            tokens (int): Number of tokens to take from each level.
+
+        Returns:
+            float: Total seconds spent waiting.
+
+        """
+        waited = 0.0
+        for label, limiter in self._levels:
+            waited += limiter.acquire(tokens, context=label)
+        return waited
+
+    async def acquire_async(self, tokens: int = 1) -> float:
+        """Acquire tokens from every level without blocking the event loop.
+
+        Args:
+            tokens (int): Number of tokens to take from each level.
+
+        Returns:
+            float: Total seconds spent waiting.
+
+        """
+        waited = 0.0
+        for label, limiter in self._levels:
+            waited += await limiter.acquire_async(tokens, context=label)
+        return waited
+
+
+class RateLimitRegistry:
+    """Thread-safe cache of limiters keyed by host and credential."""
+
+    def __init__(
+        self,
+        host_limits: dict[str, LimitGetter] | None = None,
+        credential_limits: dict[str, LimitGetter] | None = None,
+        ip_limit: LimitGetter | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            host_limits (dict[str, LimitGetter] | None): Per-host quota getters.
+            credential_limits (dict[str, LimitGetter] | None): Per-key quota getters.
+            ip_limit (LimitGetter | None): Process-wide quota getter.
+
+        """
+        self._host_limits = HOST_LIMITS if host_limits is None else host_limits
+        self._credential_limits = (
+            CREDENTIAL_LIMITS if credential_limits is None else credential_limits
+        )
+        self._ip_limit = ip_limit or _per_minute("get_ip_fill_rate_limit")
+        self._limiters: dict[str, Limiter | None] = {}
+        self._chains: dict[tuple[str, str | None], HierarchicalRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def _build(self, name: str, getter: LimitGetter, local: bool) -> Limiter | None:
+        """Create a limiter from a config getter, or None if unlimited."""
+        max_requests, window = getter()
+        if max_requests <= 0:
+            logger.info(f"Rate limit '{name}' disabled")
+            return None
+        logger.info(f"⏳ Rate limit '{name}': {max_requests} requests per {window:g}s")
+        if local:
+            return RateLimiter(max_requests=max_requests, time_window=window)
+        return create_rate_limiter(name, max_requests=max_requests, time_window=window)
+
+    def _limiter(self, name: str, getter: LimitGetter, local: bool = False) -> Limiter | None:
+        """Return the cached limiter for ``name``, creating it on first use."""
+        if name not in self._limiters:
+            self._limiters[name] = self._build(name, getter, local)
+        return self._limiters[name]
+
+    def get(self, host: str, credential: str | None = None) -> HierarchicalRateLimiter:
+        """Return the limiter chain for a host and optional credential.
+
+        Credentials are only used as keys for hosts with per-key limits and
+        are hashed before being used as metric labels.
+
+        Args:
+            host (str): Upstream hostname (e.g. 'finviz.com').
+            credential (str | None): API key or other credential, if any.
+
+        Returns:
+            HierarchicalRateLimiter: Limiters to acquire, innermost first.
+
+        """
+        host = host.lower()
+        if host not in self._credential_limits:
+            credential = None
+
+        chain_key = (host, credential)
+        chain = self._chains.get(chain_key)
+        if chain is not None:
+            return chain
+
+        with self._lock:
+            chain = self._chains.get(chain_key)
+            if chain is not None:
+                return chain
+
+            levels: list[tuple[str, Limiter | None]] = []
+            if host in self._credential_limits:
+                key_id = _hash_context(credential or "")
+                name = f"key:{host}:{key_id}"
+                levels.append((name, self._limiter(name, self._credential_limits[host])))
+            if host in self._host_limits:
+                name = f"host:{host}"
+                levels.append((name, self._limiter(name, self._host_limits[host])))
+            # The per-IP quota belongs to this pod, so it is never shared.
+            levels.append(("ip", self._limiter("ip", self._ip_limit, local=True)))
+
+            chain = HierarchicalRateLimiter(
+                [(name, limiter) for name, limiter in levels if limiter is not None]
+            )
+            self._chains[chain_key] = chain
+            return chain
+
+    def acquire(self, host: str, credential: str | None = None, tokens: int = 1) -> float:
+        """Acquire tokens for a request to ``host``, blocking as needed.
+
+        Args:
+            host (str): Upstream hostname.
+            credential (str | None): API key used for the request, if any.
+            tokens (int): Number of tokens to take.
+
+        Returns:
+            float: Total seconds spent waiting.
+
+        """
+        return self.get(host, credential).acquire(tokens)
+
+
+_registry: RateLimitRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_rate_limit_registry() -> RateLimitRegistry:
+    """Return the process-wide rate limit registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RateLimitRegistry()
+    return _registry
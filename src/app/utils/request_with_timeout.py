@@ -8,6 +8,7 @@ from typing import Any
 
 import requests
 
+from app.utils.http_client import http_get
 from app.utils.setup_logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -33,7 +34,7 @@ def request_with_timeout(url: str, timeout: int = 10) -> dict[str, Any] | None:
 
     try:
         logger.debug(f"🔗 Sending GET request to {url} with timeout={timeout}")
-        response = requests.get(url, timeout=timeout)
+        response = http_get(url, timeout=timeout)
         response.raise_for_status()
 
         content_type = response.headers.get("Content-Type", "")
@@ -0,0 +1,290 @@
+"""Short-TTL HTTP response cache shared by every poller in the process.
+
+Successful (200) GET responses are stored once as their decompressed body
+bytes plus status and headers, and served as :class:`CachedResponse` objects
+whose ``content`` is that same bytes object and whose ``view`` is a zero-copy
+``memoryview`` of it. ``json()`` parses the view directly when orjson is
+installed (the NewsAPI, Stocktwits and Benzinga pollers); the HTML and RSS
+parsers read ``text`` or ``content`` instead.
+
+Freshness is per source (``<SOURCE>_CACHE_TTL``, else HTTP_CACHE_TTL; 0
+disables caching for the source). For HTTP_CACHE_STALE_SECONDS after expiry
+an entry is still served while a single background refresh fetches a new
+copy (stale-while-revalidate). Memory use is capped at HTTP_CACHE_MAX_BYTES,
+evicting least recently used entries. With HTTP_CACHE_DIR set, entries are
+also written to disk and read back after a restart; credential query
+parameters are removed from the URL stored with them.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from app import config_shared
+from app.utils.cassette import redact_url
+from app.utils.metrics import record_http_cache_metrics, set_http_cache_size
+from app.utils.setup_logger import setup_logger
+
+# Declared Any so the None fallback type-checks whether or not orjson is installed.
+orjson: Any
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+logger = setup_logger(__name__)
+
+# Rough per-entry overhead counted against the byte cap, besides the body.
+_ENTRY_OVERHEAD = 256
+
+
+class CachedResponse:
+    """Immutable stand-in for ``requests.Response`` backed by cached bytes."""
+
+    __slots__ = ("_body", "headers", "status_code", "stored_at", "url")
+
+    def __init__(
+        self, status_code: int, headers: dict[str, str], url: str, body: bytes, stored_at: float
+    ) -> None:
+        """Initialize a response from stored parts.
+
+        Args:
+            status_code (int): HTTP status.
+            headers (dict[str, str]): Response headers.
+            url (str): Final request URL.
+            body (bytes): Decompressed body, kept without copying.
+            stored_at (float): Epoch seconds the response was received.
+
+        """
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.url = url
+        self.stored_at = stored_at
+        self._body = body
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "CachedResponse":
+        """Capture a live response (its body is already decompressed)."""
+        return cls(
+            response.status_code,
+            dict(response.headers),
+            response.url,
+            response.content,
+            time.time(),
+        )
+
+    @property
+    def content(self) -> bytes:
+        """Return the body; the stored bytes object itself, not a copy."""
+        return self._body
+
+    @property
+    def view(self) -> memoryview:
+        """Return a zero-copy view of the body."""
+        return memoryview(self._body)
+
+    @property
+    def text(self) -> str:
+        """Return the body decoded as UTF-8."""
+        return self._body.decode("utf-8", errors="replace")
+
+    @property
+    def size(self) -> int:
+        """Return the bytes this entry counts against the cache cap."""
+        return len(self._body) + _ENTRY_OVERHEAD
+
+    def json(self) -> Any:
+        """Parse the body as JSON without copying it when orjson is available."""
+        if orjson is not None:
+            return orjson.loads(self.view)
+        return json.loads(self._body)
+
+    def raise_for_status(self) -> None:
+        """Raise ``requests.HTTPError`` for 4xx and 5xx statuses."""
+        if self.status_code >= 400:
+            # Retry handling only reads status_code and headers from the response.
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}",
+                response=cast(requests.Response, self),
+            )
+
+
+class ResponseCache:
+    """Byte-capped LRU cache of GET responses with stale-while-revalidate."""
+
+    def __init__(self, max_bytes: int, stale_seconds: float, disk_dir: str = "") -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes (int): Memory cap for stored entries.
+            stale_seconds (float): How long past expiry an entry may be served
+                while it is refreshed in the background.
+            disk_dir (str): Directory for the persistent copy; "" disables it.
+
+        """
+        self._max_bytes = max_bytes
+        self._stale_seconds = stale_seconds
+        self._disk_dir = disk_dir
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._refreshing: set[Hashable] = set()
+        self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def fetch(
+        self,
+        key: Hashable,
+        source: str,
+        ttl: float,
+        load: Callable[[], requests.Response],
+    ) -> CachedResponse:
+        """Return a cached response for ``key``, loading it on a miss.
+
+        Args:
+            key (Hashable): Request identity.
+            source (str): Source name, used as the metric label.
+            ttl (float): Seconds a stored response stays fresh for this source.
+            load (Callable[[], requests.Response]): Performs the request.
+
+        Returns:
+            CachedResponse: Fresh, stale (being refreshed) or newly loaded response.
+
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            age = time.time() - entry.stored_at
+            if age < ttl:
+                record_http_cache_metrics(source, "hit", len(entry.content))
+                return entry
+            if age < ttl + self._stale_seconds:
+                record_http_cache_metrics(source, "stale", len(entry.content))
+                self._refresh(key, source, load)
+                return entry
+
+        record_http_cache_metrics(source, "miss", 0)
+        return self._load(key, load)
+
+    def _load(self, key: Hashable, load: Callable[[], requests.Response]) -> CachedResponse:
+        """Perform the request and store a successful response."""
+        response = CachedResponse.from_response(load())
+        if response.status_code == 200:
+            self._store(key, response)
+        return response
+
+    def _refresh(self, key: Hashable, source: str, load: Callable[[], requests.Response]) -> None:
+        """Reload an entry in the background, once per key at a time."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                self._load(key, load)
+            except Exception as e:  # noqa: BLE001 - the stale entry keeps being served
+                logger.debug(f"Background refresh for {source} failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._refresher.submit(run)
+
+    def _lookup(self, key: Hashable) -> CachedResponse | None:
+        """Return the entry from memory, or from disk if enabled."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not self._disk_dir:
+            return None
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._store(key, entry, persist=False)
+        return entry
+
+    def _store(self, key: Hashable, entry: CachedResponse, persist: bool = True) -> None:
+        """Insert an entry and evict least recently used ones over the cap."""
+        if entry.size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+            set_http_cache_size(self._bytes, len(self._entries))
+        if persist and self._disk_dir:
+            self._write_disk(key, entry)
+
+    def _disk_path(self, key: Hashable) -> str:
+        """Return the file for a key; the key (and any credential in it) is hashed."""
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._disk_dir, f"{digest}.cache")
+
+    def _write_disk(self, key: Hashable, entry: CachedResponse) -> None:
+        """Persist an entry as a JSON header line followed by the raw body.
+
+        The stored URL has credential parameters (api keys, tokens) removed.
+        """
+        header = json.dumps(
+            {
+                "status": entry.status_code,
+                "headers": dict(entry.headers),
+                "url": redact_url(entry.url),
+                "stored_at": entry.stored_at,
+            }
+        ).encode("utf-8")
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self._disk_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + b"\n")
+                f.write(entry.content)
+            os.replace(tmp, self._disk_path(key))
+        except OSError as e:
+            logger.debug(f"Failed to write HTTP cache entry: {e}")
+
+    def _read_disk(self, key: Hashable) -> CachedResponse | None:
+        """Load an entry written by a previous process, if present."""
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                header = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(
+            header["status"], header["headers"], header["url"], body, header["stored_at"]
+        )
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(
+                    max_bytes=config_shared.get_http_cache_max_bytes(),
+                    stale_seconds=config_shared.get_http_cache_stale_seconds(),
+                    disk_dir=config_shared.get_http_cache_dir(),
+                )
+    return _cache
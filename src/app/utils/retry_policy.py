@@ -0,0 +1,328 @@
+"""Shared retry policy: full-jitter backoff, error classification and a budget.
+
+:class:`RetryPolicy` retries a callable while its error is transient. Which
+errors are transient is decided by :func:`is_retryable`: connection errors,
+timeouts and 408/425/429/5xx responses are retried; other 4xx responses,
+open circuits and programming errors are not. Delays use exponential backoff
+with full jitter (a random delay between 0 and the capped exponential value)
+and never undercut a response's ``Retry-After``.
+
+Every policy draws on the process-wide :class:`RetryBudget`, which allows
+retries only while they stay under a fixed share of recent requests (plus a
+small floor for quiet periods). When an upstream is failing for everyone the
+budget runs out and callers give up immediately, instead of multiplying load
+with a retry storm.
+
+:meth:`RetryPolicy.call` sleeps between attempts; :meth:`RetryPolicy.call_async`
+awaits ``asyncio.sleep`` instead, for coroutine callers.
+"""
+
+import asyncio
+import collections
+import datetime
+import email.utils
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import requests
+
+from app import config_shared
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.metrics import record_retry_metrics
+from app.utils.setup_logger import setup_logger
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Upper bound on a server-requested Retry-After, so one response cannot stall a caller.
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date.
+
+    Args:
+        value (str | None): Header value.
+
+    Returns:
+        float | None: Seconds to wait, or None if absent or invalid.
+
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = datetime.datetime.now(datetime.UTC)
+    return max(0.0, (when - now).total_seconds())
+
+
+def _status_of(exc: BaseException) -> int | None:
+    """Return the HTTP status attached to an exception, if any."""
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) or getattr(exc, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return whether an error is transient and worth retrying.
+
+    Args:
+        exc (BaseException): Error raised by the attempt.
+
+    Returns:
+        bool: True for timeouts, connection errors and retryable statuses.
+
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    status = _status_of(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return isinstance(
+        exc,
+        (requests.Timeout, requests.ConnectionError, TimeoutError, ConnectionError),
+    )
+
+
+def retry_after_of(exc: BaseException) -> float | None:
+    """Return the ``Retry-After`` delay carried by an HTTP error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+class RetryBudget:
+    """Caps retries to a share of requests over a sliding window."""
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10, window: float = 10.0) -> None:
+        """Initialize the budget.
+
+        Args:
+            ratio (float): Retries allowed per request in the window.
+            min_retries (int): Retries always allowed per window, so a quiet
+                source can still retry.
+            window (float): Window length in seconds.
+
+        """
+        self._ratio = ratio
+        self._min_retries = min_retries
+        self._window = window
+        self._lock = threading.Lock()
+        # [second, requests, retries] per one-second bucket.
+        self._buckets: collections.deque[list[int]] = collections.deque()
+
+    def _bucket(self) -> list[int]:
+        """Return the current bucket, dropping expired ones. Caller holds the lock."""
+        now = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= now - self._window:
+            self._buckets.popleft()
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+        return self._buckets[-1]
+
+    def record_request(self) -> None:
+        """Count a first attempt."""
+        with self._lock:
+            self._bucket()[1] += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget.
+
+        Returns:
+            bool: True if the retry is allowed.
+
+        """
+        with self._lock:
+            current = self._bucket()
+            requests_seen = sum(b[1] for b in self._buckets)
+            retries = sum(b[2] for b in self._buckets)
+            if retries >= self._min_retries + self._ratio * requests_seen:
+                return False
+            current[2] += 1
+            return True
+
+
+class RetryPolicy:
+    """Retry transient failures with full-jitter backoff under a retry budget."""
+
+    def __init__(
+        self,
+        source: str,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        classifier: Callable[[BaseException], bool] = is_retryable,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            source (str): Source name, used for logs and retry metrics.
+            max_attempts (int): Total attempts, including the first.
+            base_delay (float): Backoff before the first retry, doubled each time.
+            max_delay (float): Cap on the backoff.
+            classifier (Callable[[BaseException], bool]): Decides whether an
+                error is retryable.
+            budget (RetryBudget | None): Budget to draw on; the shared one if None.
+
+        """
+        self.source = source
+        self._max_attempts = max(1, max_attempts)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._classifier = classifier
+        self._budget = budget if budget is not None else get_retry_budget()
+
+    def backoff(self, retry: int, exc: BaseException | None = None) -> float:
+        """Return the delay before a retry.
+
+        Args:
+            retry (int): Zero-based retry number.
+            exc (BaseException | None): Error that triggered the retry.
+
+        Returns:
+            float: Seconds to wait.
+
+        """
+        delay = random.uniform(0, min(self._max_delay, self._base_delay * 2**retry))
+        retry_after = retry_after_of(exc) if exc is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, MAX_RETRY_AFTER_SECONDS))
+        return delay
+
+    def _next_delay(self, attempt: int, exc: Exception) -> float | None:
+        """Decide whether to retry after a failed attempt.
+
+        Returns:
+            float | None: Seconds to wait before retrying, or None to give up.
+
+        """
+        if not self._classifier(exc):
+            record_retry_metrics(self.source, "not_retryable")
+            return None
+        if attempt >= self._max_attempts:
+            record_retry_metrics(self.source, "exhausted")
+            return None
+        if not self._budget.try_spend():
+            record_retry_metrics(self.source, "budget_exhausted")
+            logger.warning(f"⚠️ Retry budget exhausted; not retrying {self.source}: {exc}")
+            return None
+        record_retry_metrics(self.source, "retried")
+        delay = self.backoff(attempt - 1, exc)
+        logger.debug(
+            f"🔁 {self.source} attempt {attempt} failed: {exc}; retrying in {delay:.2f}s"
+        )
+        return delay
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call a function, retrying transient errors.
+
+        Args:
+            func (Callable[..., T]): Function to call.
+            *args (Any): Positional arguments for ``func``.
+            **kwargs (Any): Keyword arguments for ``func``.
+
+        Returns:
+            T: The function's result.
+
+        Raises:
+            Exception: The last error, once it is not retryable, attempts run
+                out or the retry budget is spent.
+
+        """
+        self._budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+
+    async def call_async(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await a coroutine function, retrying transient errors.
+
+        Args:
+            func (Callable[..., Awaitable[T]]): Coroutine function to call.
+            *args (Any): Positional arguments for ``func``.
+            **kwargs (Any): Keyword arguments for ``func``.
+
+        Returns:
+            T: The coroutine's result.
+
+        Raises:
+            Exception: The last error, once it is not retryable, attempts run
+                out or the retry budget is spent.
+
+        """
+        self._budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+
+_budget: RetryBudget | None = None
+_policies: dict[str, RetryPolicy] = {}
+_lock = threading.Lock()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Return the process-wide retry budget."""
+    global _budget
+    if _budget is None:
+        with _lock:
+            if _budget is None:
+                _budget = RetryBudget(
+                    ratio=config_shared.get_retry_budget_ratio(),
+                    min_retries=config_shared.get_retry_budget_min_retries(),
+                )
+    return _budget
+
+
+def get_retry_policy(source: str) -> RetryPolicy:
+    """Return the shared retry policy for a source.
+
+    Args:
+        source (str): Source name (e.g. 'newsapi').
+
+    Returns:
+        RetryPolicy: Policy configured from RETRY_* settings.
+
+    """
+    policy = _policies.get(source)
+    if policy is None:
+        budget = get_retry_budget()
+        with _lock:
+            policy = _policies.get(source)
+            if policy is None:
+                policy = _policies[source] = RetryPolicy(
+                    source,
+                    max_attempts=config_shared.get_retry_max_attempts(source),
+                    base_delay=config_shared.get_retry_base_delay(),
+                    max_delay=config_shared.get_retry_max_delay(),
+                    budget=budget,
+                )
+    return policy
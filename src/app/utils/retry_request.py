@@ -1,27 +1,41 @@
 """Generic retry mechanism for transient operations.
 
-Retries a function call on failure with configurable retry count and delay.
+Retries a function call on failure using the shared retry policy: exponential
+backoff with full jitter, retrying only transient errors, within the global
+retry budget.
 """
 
-import time
 from collections.abc import Callable
 from typing import Any
 
+from app.utils.retry_policy import RetryPolicy, is_retryable
 from app.utils.setup_logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
-def retry_request(func: Callable[[], Any], *, max_retries: int = 3, delay_seconds: int = 5) -> Any:
-    """Retry a function if it raises an exception.
+def retry_request(
+    func: Callable[[], Any],
+    *,
+    max_retries: int = 3,
+    delay_seconds: float = 5,
+    source: str = "retry_request",
+    classifier: Callable[[BaseException], bool] = is_retryable,
+) -> Any:
+    """Retry a function if it raises a transient exception.
 
-    Retries a callable up to `max_retries` times, sleeping `delay_seconds`
-    between attempts. Raises the last encountered exception if all retries fail.
+    Calls `func` up to `max_retries` times. Before each retry it sleeps a
+    random delay between 0 and `delay_seconds` doubled per retry (full
+    jitter). Errors rejected by `classifier` (e.g. HTTP 4xx) are raised
+    immediately, as is the error once the retry budget is spent.
 
     Args:
         func (Callable[[], Any]): The function to retry.
         max_retries (int, optional): Maximum number of attempts (default is 3).
-        delay_seconds (int, optional): Seconds to wait between retries (default is 5).
+        delay_seconds (float, optional): Base backoff in seconds (default is 5).
+        source (str, optional): Name used for retry metrics.
+        classifier (Callable[[BaseException], bool], optional): Decides whether
+            an error is retryable (default: timeouts, connection errors, 5xx).
 
     Returns:
         Any: The return value of the callable if successful.
@@ -34,20 +48,15 @@ def retry_request(func: Callable[[], Any], *, max_retries: int = 3, delay_second
     if func is None:
         raise ValueError("The function to be retried cannot be None.")
 
-    last_exception: Exception | None = None
-
-    for attempt in range(1, max_retries + 1):
-        try:
-            logger.debug(f"🔁 Attempt {attempt} of {max_retries}")
-            return func()
-        except Exception as exc:
-            last_exception = exc
-            logger.warning(
-                f"⚠️ Attempt {attempt} failed: {exc}. "
-                f"{'Retrying...' if attempt < max_retries else 'No more retries.'}"
-            )
-            if attempt < max_retries:
-                time.sleep(delay_seconds)
-
-    logger.error(f"❌ All {max_retries} attempts failed. Last error: {last_exception}")
-    raise last_exception or RuntimeError("All retries failed but no exception was captured.")
+    policy = RetryPolicy(
+        source,
+        max_attempts=max_retries,
+        base_delay=delay_seconds,
+        max_delay=delay_seconds * 2 ** max(0, max_retries - 2),
+        classifier=classifier,
+    )
+    try:
+        return policy.call(func)
+    except Exception as exc:
+        logger.error(f"❌ {source} failed after retries. Last error: {exc}")
+        raise
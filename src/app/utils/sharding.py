@@ -0,0 +1,85 @@
+"""Symbol sharding across poller replicas using rendezvous hashing.
+
+Each symbol is owned by the shard with the highest hash score for the
+(shard, symbol) pair. When the shard count changes from N to N+1 only the
+symbols whose new top score belongs to the added shard move (about 1/(N+1)
+of them); every other symbol keeps its owner, so caches and cursors on the
+remaining replicas stay warm.
+"""
+
+import hashlib
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+# StatefulSet pods end in a plain ordinal ("poller-finviz-2"). Deployment pods
+# end in a pod-template hash and a five character suffix that may be all
+# digits ("poller-7d9f8-24567"), so longer numeric suffixes are not ordinals.
+_ORDINAL_PATTERN = re.compile(r"-(0|[1-9]\d{0,3})$")
+
+
+def _score(shard: int, symbol: str) -> int:
+    """Return the rendezvous weight of ``symbol`` on ``shard``."""
+    digest = hashlib.blake2b(f"{shard}:{symbol}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+@lru_cache(maxsize=65536)
+def shard_for(symbol: str, shard_count: int) -> int:
+    """Return the index of the shard that owns ``symbol``.
+
+    Args:
+        symbol (str): Symbol to place.
+        shard_count (int): Total number of shards.
+
+    Returns:
+        int: Owning shard index in ``range(shard_count)``.
+
+    Raises:
+        ValueError: If shard_count is non-positive.
+
+    """
+    if shard_count <= 0:
+        raise ValueError("shard_count must be greater than 0")
+    if shard_count == 1:
+        return 0
+    return max(range(shard_count), key=lambda shard: _score(shard, symbol))
+
+
+def owned_symbols(symbols: Iterable[str], shard_index: int, shard_count: int) -> list[str]:
+    """Filter ``symbols`` down to the ones owned by ``shard_index``.
+
+    Args:
+        symbols (Iterable[str]): Full symbol universe.
+        shard_index (int): This replica's shard index.
+        shard_count (int): Total number of shards.
+
+    Returns:
+        list[str]: Owned symbols, in their original order. With a single
+            shard every symbol is owned, whatever ``shard_index`` is.
+
+    Raises:
+        ValueError: If shard_count is greater than 1 and shard_index is
+            outside ``range(shard_count)``.
+
+    """
+    if shard_count <= 1:
+        return list(symbols)
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard_index {shard_index} out of range for {shard_count} shards")
+    return [s for s in symbols if shard_for(s, shard_count) == shard_index]
+
+
+def ordinal_from_hostname(hostname: str) -> int | None:
+    """Extract a StatefulSet pod ordinal from a hostname like 'poller-finviz-2'.
+
+    Args:
+        hostname (str): Pod hostname.
+
+    Returns:
+        int | None: The trailing ordinal, or None if the hostname does not
+            look like a StatefulSet pod (e.g. a Deployment pod name).
+
+    """
+    match = _ORDINAL_PATTERN.search(hostname)
+    return int(match.group(1)) if match else None
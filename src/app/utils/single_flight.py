@@ -0,0 +1,83 @@
+"""Request coalescing: concurrent calls with the same key share one execution.
+
+The first caller for a key (the leader) runs the function; callers that arrive
+while it is in flight wait for it and receive the same result, or the same
+exception. Nothing is cached: once the leader finishes, the next call for the
+key runs again. Leader and shared (collapsed) calls are counted per group.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from app.utils.metrics import record_single_flight_metrics
+
+T = TypeVar("T")
+
+
+class _Call:
+    """An in-flight call and its outcome."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into one execution."""
+
+    def __init__(self, group: str) -> None:
+        """Initialize the group.
+
+        Args:
+            group (str): Group name, used as the metric label.
+
+        """
+        self.group = group
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func`` once for all concurrent callers using ``key``.
+
+        Args:
+            key (Hashable): Identity of the call.
+            func (Callable[..., T]): Function to run if no call is in flight.
+            *args (Any): Positional arguments for ``func``.
+            **kwargs (Any): Keyword arguments for ``func``.
+
+        Returns:
+            T: The leader's result, shared by every caller.
+
+        Raises:
+            Exception: The leader's exception, raised in every caller.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        record_single_flight_metrics(self.group, shared=not leader)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            shared: T = call.result
+            return shared
+
+        try:
+            result = func(*args, **kwargs)
+            call.result = result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return result
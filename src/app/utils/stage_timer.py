@@ -0,0 +1,102 @@
+"""Per-stage timing for poll cycles and publishing.
+
+Each unit of work is attributed to a source and one of :data:`STAGES`, and its
+duration goes to the ``poller_stage_duration_seconds`` histogram, so cycle
+time can be broken down into network fetch, response parsing, payload build,
+validation, serialization and the broker publish.
+
+Use :func:`stage` as a context manager around inline code, :func:`timed_stage`
+to decorate a function, or :func:`record_stage` for durations measured by the
+caller. With STAGE_TIMING_ENABLED=false, :func:`stage` returns a shared no-op
+context manager and decorated functions are called directly, so the cost is
+one cached config lookup per call.
+"""
+
+import functools
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, TypeVar
+
+from app import config_shared
+from app.utils.metrics import record_stage_metrics
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+STAGES = ("fetch", "parse", "build", "validate", "serialize", "publish")
+
+_DISABLED: AbstractContextManager[None] = nullcontext()
+
+
+class _Stage:
+    """Context manager that records its duration on exit."""
+
+    __slots__ = ("name", "source", "start")
+
+    def __init__(self, source: str, name: str) -> None:
+        self.source = source
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        record_stage_metrics(self.source, self.name, time.perf_counter() - self.start)
+
+
+def stage(source: str, name: str) -> AbstractContextManager[None]:
+    """Time the enclosed block as one stage of a source's work.
+
+    Args:
+        source (str): Source name (e.g. "finviz") or sink name for publishing.
+        name (str): Stage name, one of STAGES.
+
+    Returns:
+        AbstractContextManager[None]: Timing context, or a no-op when disabled.
+
+    """
+    if not config_shared.get_stage_timing_enabled():
+        return _DISABLED
+    return _Stage(source, name)
+
+
+def timed_stage(name: str, source: str) -> Callable[[F], F]:
+    """Decorate a function so each call is timed as a stage.
+
+    Args:
+        name (str): Stage name, one of STAGES.
+        source (str): Source name.
+
+    Returns:
+        Callable[[F], F]: Decorator.
+
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not config_shared.get_stage_timing_enabled():
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_stage_metrics(source, name, time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_stage(source: str, name: str, duration_sec: float) -> None:
+    """Record a stage duration measured by the caller, if timing is enabled.
+
+    Args:
+        source (str): Source or sink name.
+        name (str): Stage name, one of STAGES.
+        duration_sec (float): Measured duration.
+
+    """
+    if config_shared.get_stage_timing_enabled():
+        record_stage_metrics(source, name, duration_sec)
@@ -0,0 +1,191 @@
+"""Reloadable symbol universe.
+
+Symbols are read from SYMBOLS_FILE (e.g. a mounted ConfigMap) when set, and
+otherwise from the SYMBOLS config value, which follows the Vault snapshot
+refresh. The source is checked at most every SYMBOLS_RELOAD_SECONDS; a file is
+only re-read when its mtime or size changes. Each reload is diffed against the
+previous set and subscribers are told which symbols this shard gained or lost,
+so per-symbol state can be added or retired without restarting the pod.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app import config_shared
+from app.utils.setup_logger import setup_logger
+from app.utils.sharding import owned_symbols
+
+logger = setup_logger(__name__)
+
+DEFAULT_SYMBOLS = "AAPL,MSFT,GOOG"
+
+_SEPARATORS = re.compile(r"[\s,]+")
+
+
+def parse_symbols(text: str) -> list[str]:
+    """Parse a comma, space or newline separated symbol list.
+
+    Lines starting with '#' are ignored, duplicates are dropped and symbols
+    are interned so every message for a symbol shares one string.
+
+    Args:
+        text (str): Raw symbol list.
+
+    Returns:
+        list[str]: Symbols in first-seen order.
+
+    """
+    lines = (line for line in text.splitlines() if not line.lstrip().startswith("#"))
+    tokens = _SEPARATORS.split(" ".join(lines))
+    return list(dict.fromkeys(sys.intern(token) for token in tokens if token))
+
+
+@dataclass(frozen=True)
+class SymbolDiff:
+    """Symbols gained and lost by this shard in one reload."""
+
+    added: frozenset[str]
+    removed: frozenset[str]
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.added or self.removed)
+
+
+SymbolListener = Callable[[SymbolDiff], None]
+
+
+class SymbolUniverse:
+    """Current set of symbols owned by this replica, reloaded on change."""
+
+    def __init__(
+        self,
+        symbols_file: str | None = None,
+        reload_seconds: float | None = None,
+    ) -> None:
+        """Initialize the universe; symbols are loaded on first use.
+
+        Args:
+            symbols_file (str | None): File to watch. Defaults to SYMBOLS_FILE;
+                if unset, the SYMBOLS config value is used instead.
+            reload_seconds (float | None): Minimum seconds between source
+                checks. Defaults to SYMBOLS_RELOAD_SECONDS.
+
+        """
+        if symbols_file is None:
+            symbols_file = config_shared.get_symbols_file()
+        if reload_seconds is None:
+            reload_seconds = config_shared.get_symbols_reload_seconds()
+        self._symbols_file = symbols_file
+        self._reload_seconds = reload_seconds
+        self._symbols: tuple[str, ...] = ()
+        self._symbol_set: frozenset[str] = frozenset()
+        self._raw: str | None = None
+        self._file_stamp: tuple[float, int] | None = None
+        self._checked_at: float | None = None
+        self._listeners: list[SymbolListener] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: SymbolListener) -> None:
+        """Register a callback invoked with the diff after each change.
+
+        Args:
+            listener (SymbolListener): Callback taking a SymbolDiff.
+
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def symbols(self) -> list[str]:
+        """Return the owned symbols, reloading the source if it is due.
+
+        Returns:
+            list[str]: Owned symbols in source order.
+
+        """
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self._reload_seconds:
+            self.reload()
+        return list(self._symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Return True if this replica currently owns ``symbol``."""
+        return symbol in self._symbol_set
+
+    def reload(self) -> SymbolDiff:
+        """Re-read the source and apply any change.
+
+        A source that cannot be read leaves the current symbols in place.
+
+        Returns:
+            SymbolDiff: Changes applied by this reload (empty if none).
+
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                raw = self._read_source()
+            except OSError as e:
+                logger.warning(f"⚠️ Could not read symbols from {self._symbols_file}: {e}")
+                return SymbolDiff(frozenset(), frozenset())
+            if raw is None or raw == self._raw:
+                return SymbolDiff(frozenset(), frozenset())
+
+            self._raw = raw
+            owned = owned_symbols(
+                parse_symbols(raw),
+                config_shared.get_shard_index(),
+                config_shared.get_shard_count(),
+            )
+            owned_set = frozenset(owned)
+            diff = SymbolDiff(
+                added=owned_set - self._symbol_set,
+                removed=self._symbol_set - owned_set,
+            )
+            self._symbols = tuple(owned)
+            self._symbol_set = owned_set
+            listeners = list(self._listeners)
+
+        if diff:
+            logger.info(
+                f"🔄 Symbol universe updated: {len(owned_set)} owned "
+                f"(+{len(diff.added)} / -{len(diff.removed)})"
+            )
+            for listener in listeners:
+                try:
+                    listener(diff)
+                except Exception as e:  # noqa: BLE001 - a listener must not stop the refresh
+                    logger.error(f"❌ Symbol listener failed: {e}")
+        return diff
+
+    def _read_source(self) -> str | None:
+        """Return the raw symbol list, or None if the file is unchanged."""
+        if not self._symbols_file:
+            return config_shared.get_config_value("SYMBOLS", DEFAULT_SYMBOLS)
+
+        stat = os.stat(self._symbols_file)
+        stamp = (stat.st_mtime, stat.st_size)
+        if stamp == self._file_stamp:
+            return None
+        self._file_stamp = stamp
+        with open(self._symbols_file, encoding="utf-8") as f:
+            return f.read()
+
+
+_universe: SymbolUniverse | None = None
+_universe_lock = threading.Lock()
+
+
+def get_symbol_universe() -> SymbolUniverse:
+    """Return the process-wide symbol universe."""
+    global _universe
+    if _universe is None:
+        with _universe_lock:
+            if _universe is None:
+                _universe = SymbolUniverse()
+    return _universe
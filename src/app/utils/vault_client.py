@@ -1,10 +1,19 @@
 """Vault client for secure secret retrieval using AppRole authentication.
 
 Supports KV v2 secrets engine and includes environment-aware namespace handling.
+
+Configuration is served from a :class:`VaultConfigSnapshot`: the poller logs in
+once, reads its ``POLLER_NAME/ENVIRONMENT`` secret once into memory and answers
+every key from that copy. A daemon thread renews the token and re-reads the
+secret every VAULT_REFRESH_SECONDS, so lookups never wait on Vault after the
+initial load. Listeners registered with :meth:`VaultConfigSnapshot.subscribe`
+are called when a refresh changes the secret; ``config_shared`` uses this to
+drop its cached getter values.
 """
 
 import os
-from functools import lru_cache
+import threading
+from collections.abc import Callable
 from typing import Any
 
 import hvac
@@ -19,19 +28,27 @@ VAULT_ROLE_ID: str | None = os.getenv("VAULT_ROLE_ID")
 VAULT_SECRET_ID: str | None = os.getenv("VAULT_SECRET_ID")
 POLLER_NAME: str | None = os.getenv("POLLER_NAME")
 ENVIRONMENT: str = os.getenv("ENVIRONMENT", "dev")
+VAULT_REFRESH_SECONDS: float = float(os.getenv("VAULT_REFRESH_SECONDS", "300"))
+
+# Callback invoked after a refresh changed the snapshot.
+SnapshotListener = Callable[[], None]
 
 
 class VaultClient:
     """VaultClient handles authentication and secret retrieval from HashiCorp Vault using AppRole."""
 
-    def __init__(self) -> None:
+    def __init__(self, client: hvac.Client | None = None) -> None:
         """Initialize the Vault client and authenticate using AppRole.
 
+        Args:
+            client (hvac.Client | None): Preconfigured hvac client, e.g. one
+                pointed at a fake Vault server. Defaults to a client for VAULT_ADDR.
+
         Raises:
             RuntimeError: If authentication fails or no token is returned.
 
         """
-        self.client: hvac.Client = hvac.Client(url=VAULT_ADDR)
+        self.client: hvac.Client = client if client is not None else hvac.Client(url=VAULT_ADDR)
         self._authenticate()
 
     @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
@@ -54,6 +71,39 @@ class VaultClient:
         else:
             logger.warning("⚠️ VAULT_ROLE_ID or VAULT_SECRET_ID not provided. Vault auth skipped.")
 
+    def renew_token(self) -> None:
+        """Renew the current token, logging in again if renewal fails."""
+        if not (VAULT_ROLE_ID and VAULT_SECRET_ID):
+            return
+        try:
+            self.client.auth.token.renew_self()
+            logger.debug("🔐 Vault token renewed.")
+        except Exception as e:  # noqa: BLE001 - re-authentication is the fallback
+            logger.warning("⚠️ Vault token renewal failed, re-authenticating: %s", str(e))
+            self._authenticate()
+
+    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
+    def read_all(self) -> dict[str, str]:
+        """Read every key in this poller's secret path in one request.
+
+        Returns:
+            dict[str, str]: Secret values keyed by name; empty if POLLER_NAME
+            is not set.
+
+        Raises:
+            Exception: If the read fails after retries.
+
+        """
+        if not POLLER_NAME:
+            logger.warning("⚠️ POLLER_NAME not set. Skipping Vault lookup.")
+            return {}
+
+        secret: dict[str, Any] = self.client.secrets.kv.v2.read_secret_version(
+            path=f"{POLLER_NAME}/{ENVIRONMENT}"
+        )
+        data: dict[str, Any] = secret["data"]["data"] or {}
+        return {key: str(value) for key, value in data.items() if value is not None}
+
     @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
     def get(self, key: str, fallback: str | None = None) -> str | None:
         """Retrieve a value from Vault for the given key.
@@ -87,10 +137,151 @@ class VaultClient:
         return fallback
 
 
-@lru_cache
+class VaultConfigSnapshot:
+    """In-memory copy of this poller's Vault secret, refreshed in the background."""
+
+    def __init__(
+        self,
+        client_factory: Callable[[], VaultClient] = VaultClient,
+        refresh_seconds: float = VAULT_REFRESH_SECONDS,
+    ) -> None:
+        """Initialize an empty snapshot; nothing is fetched until first use.
+
+        Args:
+            client_factory (Callable[[], VaultClient]): Creates an authenticated
+                client. Tests can pass a factory wrapping a fake hvac client.
+            refresh_seconds (float): Seconds between background refreshes; 0
+                disables the refresh thread.
+
+        """
+        self._client_factory = client_factory
+        self._refresh_seconds = refresh_seconds
+        self._client: VaultClient | None = None
+        self._data: dict[str, str] = {}
+        self._loaded = False
+        self._listeners: list[SnapshotListener] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the initial load has been attempted."""
+        return self._loaded
+
+    def subscribe(self, listener: SnapshotListener) -> None:
+        """Register a callback invoked after a refresh changes the snapshot.
+
+        Args:
+            listener (SnapshotListener): Callback taking no arguments.
+
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def get(self, key: str) -> str | None:
+        """Return the value for ``key`` from the snapshot.
+
+        The first call loads the snapshot (one login and one read); later
+        calls are plain dictionary lookups.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            str | None: The value, or None if the secret does not contain it.
+
+        """
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._refresh_locked()
+                    self._loaded = True
+                    self._start_refresher()
+        return self._data.get(key)
+
+    def refresh(self) -> bool:
+        """Renew the token and re-read the secret.
+
+        On failure the previous values are kept. If the values changed, the
+        subscribed listeners are called.
+
+        Returns:
+            bool: True if the snapshot was updated.
+
+        """
+        with self._lock:
+            previous = self._data
+            updated = self._refresh_locked()
+            listeners = list(self._listeners) if self._data != previous else []
+        for listener in listeners:
+            try:
+                listener()
+            except Exception as e:  # noqa: BLE001 - a listener must not stop the refresh
+                logger.error(f"❌ Vault snapshot listener failed: {e}")
+        return updated
+
+    def _refresh_locked(self) -> bool:
+        """Refresh the snapshot; the caller must hold ``_lock``."""
+        try:
+            if self._client is None:
+                self._client = self._client_factory()
+            else:
+                self._client.renew_token()
+            data = self._client.read_all()
+        except Exception as e:  # noqa: BLE001 - the previous snapshot is kept
+            logger.warning("⚠️ Vault snapshot refresh failed, keeping previous values: %s", str(e))
+            self._client = None
+            return False
+
+        if self._loaded and data != self._data:
+            logger.info("🔑 Vault config snapshot changed (%d keys).", len(data))
+        # Swap in a new dict so readers never see a partially updated snapshot.
+        self._data = data
+        logger.debug("🔑 Vault config snapshot loaded (%d keys).", len(data))
+        return True
+
+    def _start_refresher(self) -> None:
+        """Start the background refresh thread if enabled."""
+        if self._refresh_seconds <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run_refresher, name="vault-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def _run_refresher(self) -> None:
+        """Refresh the snapshot every ``refresh_seconds`` until stopped."""
+        while not self._stop.wait(self._refresh_seconds):
+            self.refresh()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+_snapshot: VaultConfigSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def get_vault_snapshot() -> VaultConfigSnapshot:
+    """Return the process-wide Vault config snapshot."""
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = VaultConfigSnapshot()
+    return _snapshot
+
+
 def get_config_value_cached(key: str, default: str | None = None) -> str:
-    """Retrieve a configuration value from Vault, environment variable, or fallback,
-    with caching.
+    """Retrieve a configuration value from Vault, environment variable, or fallback.
+
+    Vault values come from the in-memory snapshot, so this never makes a
+    network call after the first lookup and reflects background refreshes.
 
     Args:
         key (str): The config key to look up.
@@ -103,7 +294,9 @@ def get_config_value_cached(key: str, default: str | None = None) -> str:
         ValueError: If no value is found and no default is provided.
 
     """
-    val = VaultClient().get(key, fallback=os.getenv(key, default))
+    val = get_vault_snapshot().get(key)
+    if val is None:
+        val = os.getenv(key, default)
     if val is None:
         raise ValueError(f"❌ Missing required config value for key: {key}")
     return str(val)
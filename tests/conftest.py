@@ -0,0 +1,36 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from app import config_shared
+from app.records import Article, SentimentMessage
+from app.utils import circuit_breaker
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Drop cached config values so each test sees its own environment."""
+    config_shared.clear_config_cache()
+    yield
+    config_shared.clear_config_cache()
+
+
+@pytest.fixture(autouse=True)
+def fresh_circuit_breakers(monkeypatch):
+    """Give each test its own circuit breakers."""
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+
+
+@pytest.fixture
+def make_message():
+    """Return a factory for valid messages, distinct per ``index``."""
+
+    def factory(index: int, symbol: str = "AAPL") -> SentimentMessage:
+        article = Article(
+            timestamp="2026-10-19T12:00:00Z",
+            headline=f"Headline {index}",
+            url=f"https://example.com/{symbol}/{index}",
+        )
+        return SentimentMessage(symbol, "Finviz", "finviz", article)
+
+    return factory
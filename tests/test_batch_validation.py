@@ -0,0 +1,83 @@
+"""Tests for batch validation and the dead-lettering of invalid messages."""
+
+import pytest
+
+from app.message_queue import queue_sender
+from app.message_queue.queue_sender import publish_to_queue
+from app.utils import batch_validation
+from app.utils.batch_validation import first_invalid_field, validate_batch
+
+
+@pytest.fixture
+def exported(monkeypatch):
+    """Capture the per-batch metrics instead of exporting them."""
+    calls = []
+
+    def record(processor, items, duration_sec, field_errors):
+        calls.append((processor, items, dict(field_errors)))
+
+    monkeypatch.setattr(batch_validation, "record_batch_validation_metrics", record)
+    return calls
+
+
+def test_errors_are_counted_per_field(exported, make_message):
+    no_symbol, no_timestamp, no_text = make_message(0), make_message(1), make_message(2)
+    no_symbol.symbol = ""
+    no_timestamp.article.timestamp = None
+    no_text.article.headline = " "
+    blank_wire = make_message(3).to_wire()
+    blank_wire["symbol"] = None
+
+    result = validate_batch([no_symbol, no_timestamp, no_text, blank_wire], "test")
+
+    assert result.valid == []
+    assert result.field_errors == {"symbol": 2, "timestamp": 1, "text": 1}
+    assert exported == [("test", 4, {"symbol": 2, "timestamp": 1, "text": 1})]
+
+
+def test_mixed_batch_keeps_valid_messages_in_order(exported, make_message):
+    messages = [make_message(i) for i in range(5)]
+    messages[1].article.headline = None
+    wire = messages[3].to_wire()
+    wire["data"] = "not a dict"
+    messages[3] = wire
+
+    result = validate_batch(messages)
+
+    assert result.valid == [messages[0], messages[2], messages[4]]
+    assert result.invalid == [(messages[1], "text"), (messages[3], "data")]
+    assert exported == [("publish", 5, {"text": 1, "data": 1})]
+
+
+def test_unsupported_types_fail_as_message():
+    assert first_invalid_field(["AAPL"]) == "message"
+
+
+def test_invalid_messages_are_dead_lettered(exported, make_message, monkeypatch):
+    published, dead_letters = [], []
+    monkeypatch.setattr(queue_sender, "QUEUE_TYPE", "memory")
+    monkeypatch.setattr(queue_sender, "_send_to_memory", published.append)
+    monkeypatch.setattr(queue_sender, "_dead_letter", dead_letters.extend)
+    valid, invalid = make_message(0), make_message(1)
+    invalid.source = ""
+
+    publish_to_queue([valid, invalid])
+
+    assert len(published) == 1
+    assert dead_letters == [(invalid, "schema_invalid", "source")]
+
+
+def test_validation_can_be_disabled(exported, make_message, monkeypatch):
+    monkeypatch.setenv("VALIDATION_ENABLED", "false")
+    published, dead_letters = [], []
+    monkeypatch.setattr(queue_sender, "QUEUE_TYPE", "memory")
+    monkeypatch.setattr(queue_sender, "_send_to_memory", published.append)
+    monkeypatch.setattr(queue_sender, "_dead_letter", dead_letters.extend)
+    message = make_message(0)
+    message.source = ""
+
+    publish_to_queue([message])
+
+    assert len(published) == 1
+    assert dead_letters == []
+    assert exported == []
@@ -0,0 +1,107 @@
+"""Tests for circuit breaker probes that end without an outcome."""
+
+import pytest
+import requests
+
+from app.output.rest_sink import RestSink
+from app.utils import circuit_breaker, http_client
+from app.utils.circuit_breaker import CLOSED, HALF_OPEN, CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module whose monotonic clock only moves when told."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive every breaker from a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def _half_open(breaker, clock):
+    breaker.record_failure()
+    clock.now += 60
+    assert breaker.state == HALF_OPEN
+
+
+def test_released_probe_lets_the_next_call_probe(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    _half_open(breaker, clock)
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.release()
+
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+def test_abandoned_probe_expires_after_the_reset_timeout(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    _half_open(breaker, clock)
+    assert breaker.allow()
+
+    clock.now += 29
+    assert not breaker.allow()
+    clock.now += 1
+    assert breaker.allow()
+
+
+def test_rest_probe_that_raises_is_released(clock, monkeypatch, make_message):
+    monkeypatch.setenv("REST_OUTPUT_URL", "http://collector.test/ingest")
+    monkeypatch.setenv("REST_OUTPUT_MAX_RETRIES", "0")
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "1")
+
+    class BrokenSession:
+        headers: dict = {}
+        error: BaseException | None = RuntimeError("adapter bug")
+
+        def post(self, url, data=None, timeout=None):
+            if self.error is not None:
+                raise self.error
+            response = requests.Response()
+            response.status_code = 200
+            return response
+
+        def close(self):
+            pass
+
+    session = BrokenSession()
+    sink = RestSink(session=session, flush_interval=0.01)
+    try:
+        _half_open(sink._breaker, clock)
+
+        with pytest.raises(RuntimeError):
+            sink.write_batch([make_message(0)])
+
+        session.error = None
+        sink.write_batch([make_message(0)])
+        assert sink._breaker.state == CLOSED
+    finally:
+        sink.close()
+
+
+def test_http_probe_is_not_taken_when_rate_limiting_raises(clock, monkeypatch):
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "1")
+    breaker = circuit_breaker.get_circuit_breaker("http:api.test")
+    _half_open(breaker, clock)
+
+    class FailingRegistry:
+        def acquire(self, host, credential=None):
+            raise RuntimeError("limiter backend down")
+
+    monkeypatch.setattr(http_client, "get_rate_limit_registry", lambda: FailingRegistry())
+    with pytest.raises(RuntimeError):
+        http_client._get_once("https://api.test/items", None, None, 1.0, None)
+
+    assert breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
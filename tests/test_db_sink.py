@@ -0,0 +1,118 @@
+"""Tests for the bulk database sink against sqlite."""
+
+import json
+import sqlite3
+
+import pytest
+
+from app.output.db_sink import ConnectionPool, DatabaseSink, to_row
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Return the path of an empty sqlite database used as the output."""
+    monkeypatch.setenv("DATABASE_TABLE", "sentiment_messages")
+    return tmp_path / "output.db"
+
+
+@pytest.fixture
+def sink(database):
+    """Yield a database sink writing to the sqlite file."""
+    sink = DatabaseSink(url=f"sqlite:///{database}", flush_interval=0.01)
+    yield sink
+    sink.close()
+
+
+def _rows(database):
+    with sqlite3.connect(database) as conn:
+        rows = conn.execute("SELECT id, payload FROM sentiment_messages ORDER BY id").fetchall()
+    return {row_id: json.loads(payload) for row_id, payload in rows}
+
+
+class FakeConnection:
+    """DB-API connection that records calls and can fail them."""
+
+    def __init__(self, fail_rollback=False):
+        self.calls: list[str] = []
+        self.fail_rollback = fail_rollback
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.calls.append("rollback")
+        if self.fail_rollback:
+            raise RuntimeError("connection lost")
+
+    def close(self):
+        self.calls.append("close")
+
+
+def test_batches_are_written_through_the_buffer(sink, database, make_message):
+    messages = [make_message(i) for i in range(3)]
+
+    sink.submit(messages)
+    assert sink.flush(timeout=5)
+
+    assert set(_rows(database)) == {to_row(m)["id"] for m in messages}
+
+
+def test_existing_rows_are_updated(sink, database, make_message):
+    message = make_message(0)
+    sink.write_batch([message])
+
+    message.article.summary = "Updated"
+    sink.write_batch([message])
+
+    (payload,) = _rows(database).values()
+    assert payload["data"]["summary"] == "Updated"
+
+
+def test_duplicate_ids_in_one_batch_keep_the_last(sink, database, make_message):
+    first, last = make_message(0), make_message(0)
+    last.article.summary = "Last"
+
+    sink.write_batch([first, last])
+
+    (payload,) = _rows(database).values()
+    assert payload["data"]["summary"] == "Last"
+
+
+def test_pool_reuses_idle_connections():
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    pool = ConnectionPool(connect, size=2)
+    for _ in range(3):
+        with pool.connection():
+            pass
+
+    assert len(opened) == 1
+    assert opened[0].calls == ["commit"] * 3
+
+
+def test_connection_is_discarded_after_an_error():
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection(fail_rollback=not opened))
+        return opened[-1]
+
+    pool = ConnectionPool(connect, size=2)
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("bad row")
+    with pool.connection():
+        pass
+
+    assert len(opened) == 2
+    assert opened[0].calls == ["rollback", "close"]
+    assert opened[1].calls == ["commit"]
+
+
+def test_unsupported_url_is_rejected(database):
+    with pytest.raises(ValueError, match="mysql"):
+        DatabaseSink(url="mysql://localhost/db")
@@ -0,0 +1,173 @@
+"""Tests for routing rejected messages to the DLQ or the dead-letter file."""
+
+import json
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.message_queue import dead_letter, queue_sender
+from app.message_queue.queue_sender import QueueUnavailableError, publish_to_queue
+from app.output.queue_sink import QueueSink
+
+
+class FakeChannel:
+    """RabbitMQ channel that records publishes and fails the first ``failures``."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.is_open = True
+        self.published = []
+        self.declared = []
+
+    def queue_declare(self, queue, durable=False):
+        self.declared.append(queue)
+
+    def basic_publish(self, exchange, routing_key, body, properties):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection reset")
+        self.published.append((exchange, routing_key, properties))
+
+
+@pytest.fixture
+def dead_letter_file(tmp_path, monkeypatch):
+    """Point the dead-letter file sink at a fresh file."""
+    path = tmp_path / "dead_letter.ndjson"
+    monkeypatch.setenv("DEAD_LETTER_FILE", str(path))
+    monkeypatch.setattr(dead_letter, "_sink", None)
+    return path
+
+
+@pytest.fixture
+def rabbitmq(monkeypatch, dead_letter_file):
+    """Publish to RabbitMQ over a fake channel, reconnecting to the same one."""
+    channel = FakeChannel()
+    monkeypatch.setenv("DLQ_NAME", "sentiment_dlq")
+    monkeypatch.setattr(queue_sender, "QUEUE_TYPE", "rabbitmq")
+    monkeypatch.setattr(queue_sender, "_get_rabbitmq_channel", lambda: channel)
+    monkeypatch.setattr(queue_sender, "_dlq_declared", False)
+    return channel
+
+
+def _file_entries(path):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _dead_letters(channel):
+    return [properties.headers for _, key, properties in channel.published if key == "sentiment_dlq"]
+
+
+def test_invalid_message_goes_to_the_rabbitmq_dlq(rabbitmq, dead_letter_file, make_message):
+    message = make_message(0)
+    message.article.timestamp = ""
+
+    publish_to_queue([message, make_message(1)])
+
+    (headers,) = _dead_letters(rabbitmq)
+    assert headers["x-dead-letter-reason"] == "schema_invalid"
+    assert headers["x-dead-letter-detail"] == "timestamp"
+    assert headers["x-dead-letter-source"] == message.source
+    assert headers["x-dead-letter-attempt"] == "1"
+    assert rabbitmq.declared == ["sentiment_dlq"]
+    assert _file_entries(dead_letter_file) == []
+
+
+def test_dead_letter_is_resent_once_after_a_reconnect(rabbitmq, make_message):
+    message = {"symbol": "AAPL", "source": "Reuters", "data": {}}
+    rabbitmq.failures = 1
+
+    publish_to_queue([message])
+
+    (headers,) = _dead_letters(rabbitmq)
+    assert headers["x-dead-letter-attempt"] == "2"
+    assert headers["x-dead-letter-source"] == "Reuters"
+
+
+def test_oversize_message_goes_to_the_file(rabbitmq, dead_letter_file, make_message, monkeypatch):
+    monkeypatch.setenv("MAX_MESSAGE_BYTES", "10")
+    message = make_message(0)
+
+    publish_to_queue([message])
+
+    assert _dead_letters(rabbitmq) == []
+    (entry,) = _file_entries(dead_letter_file)
+    assert entry["reason"] == "oversize"
+    assert entry["payload"] == message.to_wire()
+
+
+def test_file_target_skips_the_queue(rabbitmq, dead_letter_file, make_message, monkeypatch):
+    monkeypatch.setenv("DLQ_TARGET", "file")
+    message = make_message(0)
+    message.symbol = ""
+
+    publish_to_queue([message])
+
+    assert _dead_letters(rabbitmq) == []
+    (entry,) = _file_entries(dead_letter_file)
+    assert (entry["reason"], entry["detail"]) == ("schema_invalid", "symbol")
+
+
+def test_unavailable_dlq_falls_back_to_the_file(rabbitmq, dead_letter_file, make_message):
+    message = make_message(0)
+    message.symbol = ""
+    rabbitmq.failures = 2
+
+    publish_to_queue([message])
+
+    assert _dead_letters(rabbitmq) == []
+    assert [entry["reason"] for entry in _file_entries(dead_letter_file)] == ["schema_invalid"]
+
+
+@mock_aws
+def test_invalid_message_goes_to_the_sqs_dlq(dead_letter_file, make_message, monkeypatch):
+    client = boto3.client("sqs", region_name="us-east-1")
+    queue_url = client.create_queue(QueueName="sentiment")["QueueUrl"]
+    dlq_url = client.create_queue(QueueName="sentiment_dlq")["QueueUrl"]
+    monkeypatch.setenv("DLQ_NAME", "sentiment_dlq")
+    monkeypatch.setattr(queue_sender, "QUEUE_TYPE", "sqs")
+    monkeypatch.setattr(queue_sender, "SQS_QUEUE_URL", queue_url)
+    monkeypatch.setattr(queue_sender, "sqs_client", client)
+    monkeypatch.setattr(queue_sender, "_sqs_initialized", True)
+    monkeypatch.setattr(queue_sender, "_dlq_url", None)
+    message = make_message(0)
+    message.article.headline = None
+
+    publish_to_queue([message])
+
+    (received,) = client.receive_message(QueueUrl=dlq_url, MessageAttributeNames=["All"])[
+        "Messages"
+    ]
+    attributes = {k: v["StringValue"] for k, v in received["MessageAttributes"].items()}
+    assert attributes["x-dead-letter-reason"] == "schema_invalid"
+    assert attributes["x-dead-letter-detail"] == "text"
+    assert attributes["x-dead-letter-source"] == message.source
+    assert attributes["x-dead-letter-attempt"] == "1"
+    assert "Messages" not in client.receive_message(QueueUrl=queue_url)
+    assert _file_entries(dead_letter_file) == []
+
+
+def test_transient_broker_error_is_retried_not_dead_lettered(
+    rabbitmq, dead_letter_file, make_message, monkeypatch
+):
+    monkeypatch.setenv("CIRCUIT_RESET_SECONDS", "0.01")
+    messages = [make_message(i) for i in range(3)]
+    rabbitmq.failures = 2
+
+    with pytest.raises(QueueUnavailableError) as excinfo:
+        publish_to_queue(messages)
+    assert excinfo.value.unsent == messages
+
+    rabbitmq.failures = 4
+    sink = QueueSink("queue", batch_size=10, flush_interval=0.01)
+    try:
+        sink.submit(messages)
+        assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    assert len(rabbitmq.published) == 3
+    assert _dead_letters(rabbitmq) == []
+    assert _file_entries(dead_letter_file) == []
@@ -0,0 +1,151 @@
+"""Tests for delivery-confirmed deduplication."""
+
+import pytest
+
+from app.output.base import BufferedSink
+from app.output.dispatcher import OutputDispatcher
+from app.pollers import runner
+from app.pollers.runner import PollerSource
+from app.utils.dedup import DedupIndex
+
+
+class RecordingSink(BufferedSink):
+    """Sink that fails the first ``failures`` batches and records the rest."""
+
+    def __init__(self, name: str = "test", failures: int = 0, buffer_size: int = 1000) -> None:
+        self.failures = failures
+        self.written: list = []
+        super().__init__(name, batch_size=100, flush_interval=0.01, buffer_size=buffer_size)
+
+    def write_batch(self, batch):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("publish failed")
+        self.written.extend(batch)
+
+
+@pytest.fixture
+def pipeline(monkeypatch, make_message):
+    """Wire a dispatcher over ``sinks`` and a fresh dedup index into the runner."""
+
+    def build(*sinks):
+        dispatcher = OutputDispatcher(sinks)
+        index = DedupIndex(100)
+        index.track(dispatcher)
+        monkeypatch.setattr(runner, "get_output_dispatcher", lambda: dispatcher)
+        monkeypatch.setattr(runner, "get_dedup_index", lambda: index)
+        monkeypatch.setattr(runner, "get_symbols", lambda: ["AAPL"])
+        source = PollerSource(
+            name="test",
+            label="test items",
+            fetch=lambda symbol: [0, 1],
+            build=lambda symbol, item: make_message(item, symbol),
+        )
+        return dispatcher, index, source
+
+    return build
+
+
+def _cycle(dispatcher, source):
+    count = runner.poll_cycle(source)
+    assert dispatcher.flush(timeout=5)
+    return count
+
+
+def test_failed_publish_is_dispatched_again_next_cycle(pipeline):
+    sink = RecordingSink(failures=1)
+    dispatcher, index, source = pipeline(sink)
+    try:
+        assert _cycle(dispatcher, source) == 2
+        assert sink.written == []
+        assert len(index) == 0
+
+        assert _cycle(dispatcher, source) == 2
+        assert [m.article.headline for m in sink.written] == ["Headline 0", "Headline 1"]
+
+        assert _cycle(dispatcher, source) == 0
+    finally:
+        dispatcher.close()
+
+
+def test_delivered_items_are_not_dispatched_again(pipeline):
+    sink = RecordingSink()
+    dispatcher, index, source = pipeline(sink)
+    try:
+        assert _cycle(dispatcher, source) == 2
+        assert _cycle(dispatcher, source) == 0
+        assert len(sink.written) == 2
+        assert len(index) == 2
+        assert index.pending == 0
+    finally:
+        dispatcher.close()
+
+
+def test_item_is_resent_only_to_the_sink_that_failed(pipeline):
+    healthy, failing = RecordingSink("healthy"), RecordingSink("failing", failures=1)
+    dispatcher, index, source = pipeline(healthy, failing)
+    try:
+        assert _cycle(dispatcher, source) == 2
+        assert _cycle(dispatcher, source) == 2
+        assert _cycle(dispatcher, source) == 0
+        assert _cycle(dispatcher, source) == 0
+        assert len(failing.written) == 2
+        assert len(healthy.written) == 2
+        assert len(index) == 2
+        assert index.pending == 0
+    finally:
+        dispatcher.close()
+
+
+def test_owed_items_go_back_to_every_failed_sink(pipeline):
+    healthy = RecordingSink("healthy")
+    failing = [RecordingSink("rest", failures=2), RecordingSink("s3", failures=1)]
+    dispatcher, index, source = pipeline(healthy, *failing)
+    try:
+        for _ in range(4):
+            _cycle(dispatcher, source)
+        assert [len(sink.written) for sink in (healthy, *failing)] == [2, 2, 2]
+        assert index.pending == 0
+    finally:
+        dispatcher.close()
+
+
+def test_pending_items_are_not_dispatched_twice(make_message):
+    index = DedupIndex(100, sinks=["queue"])
+    messages = [make_message(0), make_message(1)]
+
+    assert index.filter(messages) == messages
+    assert index.filter(messages) == []
+
+    index.settle(messages[:1], True, sink="queue")
+    index.settle(messages[1:], False, sink="queue")
+
+    assert index.filter(messages) == []
+    assert index.owed(messages) == {"queue": messages[1:]}
+    assert index.owed(messages) == {}
+    assert len(index) == 1
+
+
+def test_owed_items_are_bounded(make_message):
+    index = DedupIndex(2, sinks=["queue"])
+    messages = [make_message(i) for i in range(3)]
+
+    index.filter(messages)
+    index.settle(messages, False, sink="queue")
+
+    assert index.pending == 2
+    assert index.owed(messages) == {"queue": messages[1:]}
+
+
+def test_dropped_messages_are_released(make_message):
+    sink = RecordingSink(buffer_size=1)
+    outcomes = []
+    sink.add_listener(lambda batch, delivered: outcomes.append((len(batch), delivered)))
+    try:
+        dropped = sink.submit([make_message(i) for i in range(50)])
+        assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    assert dropped > 0
+    assert (dropped, False) in outcomes
@@ -0,0 +1,99 @@
+"""Tests for the Redis-backed distributed rate limiter, using fakeredis."""
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from app.utils.distributed_rate_limit import (  # noqa: E402
+    DistributedRateLimiter,
+    RedisTokenBucket,
+)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def backend(server):
+    return RedisTokenBucket(fakeredis.FakeRedis(server=server))
+
+
+def _limiter(backend, member_id, max_requests=10, prefetch=5):
+    return DistributedRateLimiter(
+        "newsapi",
+        max_requests=max_requests,
+        time_window=3600,
+        backend=backend,
+        prefetch=prefetch,
+        member_id=member_id,
+    )
+
+
+def test_lease_grants_until_the_bucket_is_empty(backend):
+    assert backend.lease("newsapi", 10, 10 / 3600, 6, "pod-0", 30)[0] == 6
+    assert backend.lease("newsapi", 10, 10 / 3600, 6, "pod-0", 30)[0] == 4
+
+    granted, retry_after, members = backend.lease("newsapi", 10, 10 / 3600, 6, "pod-0", 30)
+
+    assert granted == 0
+    assert retry_after > 0
+    assert members == 1
+
+
+def test_lease_is_capped_at_the_replica_share(backend):
+    backend.lease("newsapi", 10, 10 / 3600, 1, "pod-0", 30)
+
+    granted, _, members = backend.lease("newsapi", 10, 10 / 3600, 10, "pod-1", 30)
+
+    assert members == 2
+    assert granted == 5
+
+
+def test_replicas_share_one_quota(backend):
+    limiters = [_limiter(backend, f"pod-{i}") for i in range(3)]
+
+    taken = 0
+    for _ in range(10):
+        for limiter in limiters:
+            if limiter.try_acquire() == 0.0:
+                taken += 1
+
+    assert taken == 10
+
+
+def test_try_acquire_reports_wait_when_quota_is_spent(backend):
+    limiter = _limiter(backend, "pod-0", max_requests=2, prefetch=2)
+
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() > 0
+
+
+def test_falls_back_to_local_share_when_redis_is_down(server, backend):
+    other = _limiter(backend, "pod-1")
+    other.try_acquire()
+    limiter = _limiter(backend, "pod-0")
+    assert limiter.try_acquire() == 0.0
+
+    server.connected = False
+    granted = sum(limiter.try_acquire() == 0.0 for _ in range(20))
+
+    # The 4 tokens still leased are used first; then, with two replicas
+    # active, the local fallback allows half the quota.
+    assert granted == 4 + 5
+
+
+def test_recovers_when_redis_comes_back(server, backend):
+    client = fakeredis.FakeRedis(server=server)
+    limiter = _limiter(backend, "pod-0")
+    server.connected = False
+    assert limiter.try_acquire() == 0.0
+    server.connected = True
+    assert not client.exists("ratelimit:newsapi:bucket")
+
+    assert limiter.try_acquire() == 0.0
+
+    assert float(client.hget("ratelimit:newsapi:bucket", "tokens")) == pytest.approx(5, abs=0.01)
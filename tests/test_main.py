@@ -0,0 +1,45 @@
+"""Tests for selecting pollers from POLLER_TYPE."""
+
+import pytest
+
+from app import main
+from app.pollers import runner
+from app.utils import observability_server
+
+
+@pytest.fixture
+def started(monkeypatch):
+    """Record which pollers main() starts instead of running them."""
+    calls = []
+    monkeypatch.setattr(observability_server, "start_observability_server", lambda: None)
+    monkeypatch.setattr(main, "load_runner", lambda name: lambda: calls.append([name]))
+    monkeypatch.setattr(main, "load_source", lambda name: name)
+    monkeypatch.setattr(runner, "run_sources", calls.append)
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("finviz", ["finviz"]),
+        ("finviz,", ["finviz"]),
+        (" Finviz , ", ["finviz"]),
+        ("finviz,,yahoo", ["finviz", "yahoo"]),
+        ("finviz, yahoo, finviz", ["finviz", "yahoo"]),
+    ],
+)
+def test_entries_are_stripped_and_empty_ones_dropped(started, monkeypatch, value, expected):
+    monkeypatch.setenv("POLLER_TYPE", value)
+
+    main.main()
+
+    assert started == [expected]
+
+
+@pytest.mark.parametrize("value", ["", " , ", "finviz,nope"])
+def test_unknown_or_empty_types_start_nothing(started, monkeypatch, value):
+    monkeypatch.setenv("POLLER_TYPE", value)
+
+    main.main()
+
+    assert started == []
@@ -0,0 +1,160 @@
+"""Tests for publishing through the queue sink when the broker fails."""
+
+import threading
+import time
+
+import pytest
+
+from app.message_queue import queue_sender
+from app.message_queue.queue_sender import QueueUnavailableError, publish_to_queue
+from app.output.queue_sink import QueueSink
+from app.utils.circuit_breaker import OPEN, get_circuit_breaker
+
+
+class FlakyBroker:
+    """Memory broker stand-in that fails the first ``failures`` publishes."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.bodies: list[bytes] = []
+
+    def send(self, encoded):
+        if self.failures:
+            self.failures -= 1
+            return "connection reset"
+        self.bodies.append(encoded.body)
+        return None
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    broker = FlakyBroker()
+    monkeypatch.setattr(queue_sender, "QUEUE_TYPE", "memory")
+    monkeypatch.setattr(queue_sender, "_send_to_memory", broker.send)
+    return broker
+
+
+@pytest.fixture
+def dead_letters(monkeypatch):
+    entries = []
+    monkeypatch.setattr(queue_sender, "_dead_letter", entries.extend)
+    return entries
+
+
+def test_publish_failure_hands_back_unsent_messages(broker, dead_letters, make_message):
+    messages = [make_message(i) for i in range(5)]
+    broker.failures = 1
+
+    with pytest.raises(QueueUnavailableError) as excinfo:
+        publish_to_queue(messages)
+
+    assert excinfo.value.unsent == messages
+    assert dead_letters == []
+
+
+def test_publish_failure_mid_batch_keeps_published_prefix(
+    broker, dead_letters, make_message, monkeypatch
+):
+    messages = [make_message(i) for i in range(5)]
+    calls = []
+    send = broker.send
+
+    def fail_third(encoded):
+        calls.append(encoded)
+        return "channel closed" if len(calls) == 3 else send(encoded)
+
+    monkeypatch.setattr(queue_sender, "_send_to_memory", fail_third)
+
+    with pytest.raises(QueueUnavailableError) as excinfo:
+        publish_to_queue(messages)
+
+    assert len(broker.bodies) == 2
+    assert excinfo.value.unsent == messages[2:]
+    assert dead_letters == []
+
+
+def test_bad_messages_are_still_dead_lettered(broker, dead_letters, make_message, monkeypatch):
+    monkeypatch.setenv("MAX_MESSAGE_BYTES", "10")
+
+    publish_to_queue([make_message(0)])
+
+    assert [reason for _, reason, _ in dead_letters] == ["oversize"]
+
+
+def test_queue_sink_retries_until_the_broker_recovers(
+    broker, dead_letters, make_message, monkeypatch
+):
+    monkeypatch.setenv("CIRCUIT_RESET_SECONDS", "0.01")
+    broker.failures = 3
+    sink = QueueSink("queue", batch_size=10, flush_interval=0.01)
+    try:
+        sink.submit([make_message(i) for i in range(4)])
+        assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    assert len(broker.bodies) == 4
+    assert dead_letters == []
+
+
+def test_open_circuit_holds_messages_without_dead_lettering(
+    broker, dead_letters, make_message, monkeypatch
+):
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv("CIRCUIT_RESET_SECONDS", "30")
+    breaker = get_circuit_breaker("sink:memory")
+    breaker.record_failure()
+    messages = [make_message(i) for i in range(3)]
+
+    with pytest.raises(QueueUnavailableError) as excinfo:
+        publish_to_queue(messages)
+
+    assert excinfo.value.unsent == messages
+    assert 0 < excinfo.value.retry_after <= 30
+    assert broker.bodies == []
+    assert dead_letters == []
+
+
+def test_queue_sink_backs_off_while_circuit_is_open(
+    broker, dead_letters, make_message, monkeypatch
+):
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv("CIRCUIT_RESET_SECONDS", "0.2")
+    broker.failures = 1
+    sink = QueueSink("queue", batch_size=10, flush_interval=0.01)
+    try:
+        sink.submit([make_message(i) for i in range(3)])
+        time.sleep(0.05)
+        assert get_circuit_breaker("sink:memory").state == OPEN
+        assert sink.submit([make_message(i) for i in range(3, 6)]) == 0
+        assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    assert len(broker.bodies) == 6
+    assert dead_letters == []
+
+
+def test_full_queue_sink_blocks_instead_of_dropping(
+    broker, dead_letters, make_message, monkeypatch
+):
+    monkeypatch.setenv("CIRCUIT_RESET_SECONDS", "0.02")
+    broker.failures = 1_000_000
+    sink = QueueSink("queue", batch_size=2, flush_interval=0.01, buffer_size=2)
+    submitted = threading.Event()
+
+    def submit():
+        sink.submit([make_message(i) for i in range(10)])
+        submitted.set()
+
+    threading.Thread(target=submit, daemon=True).start()
+    try:
+        assert not submitted.wait(0.2)
+        broker.failures = 0
+        assert submitted.wait(5)
+        assert sink.flush(timeout=5)
+    finally:
+        sink.close()
+
+    assert len(broker.bodies) == 10
+    assert dead_letters == []
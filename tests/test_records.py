@@ -0,0 +1,60 @@
+"""Tests for the wire format built from poller records."""
+
+from app.pollers import poller_newsapi, poller_stocktwits
+from app.records import Article, SentimentMessage
+
+
+def test_missing_values_are_sent_as_null():
+    message = poller_newsapi.build_payload(
+        "AAPL",
+        {
+            "publishedAt": "2026-10-19T12:00:00Z",
+            "title": "Apple ships",
+            "description": None,
+            "url": "https://example.com/a",
+            "source": {"name": "Reuters"},
+        },
+    )
+
+    assert message.to_wire() == {
+        "symbol": "AAPL",
+        "timestamp": "2026-10-19T12:00:00Z",
+        "source": "NewsAPI",
+        "data": {
+            "headline": "Apple ships",
+            "summary": None,
+            "url": "https://example.com/a",
+            "source_name": "Reuters",
+            "platform": "newsapi",
+        },
+    }
+
+
+def test_only_the_source_fields_are_sent():
+    message = poller_stocktwits.build_payload(
+        "AAPL", {"created_at": "2026-10-19T12:00:00Z", "user": {}, "body": "Bullish"}
+    )
+
+    assert message.to_wire()["data"] == {
+        "username": "",
+        "content": "Bullish",
+        "platform": "stocktwits",
+    }
+
+
+def test_default_fields_include_every_article_field():
+    article = Article(timestamp="2026-10-19T12:00:00Z", headline="Headline")
+
+    data = SentimentMessage("AAPL", "Finviz", "finviz", article).to_wire()["data"]
+
+    assert data == {
+        "headline": "Headline",
+        "summary": None,
+        "url": None,
+        "source_name": None,
+        "username": None,
+        "content": None,
+        "transcript": None,
+        "sentiment": None,
+        "platform": "finviz",
+    }
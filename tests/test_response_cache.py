@@ -0,0 +1,46 @@
+"""Tests for the HTTP response cache's on-disk copy."""
+
+import os
+
+import requests
+
+from app.utils.response_cache import ResponseCache
+
+URL = "https://newsapi.org/v2/everything?q=AAPL&apiKey=s3cr3t&pageSize=10"
+
+
+def _response(url: str, body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def test_disk_entries_do_not_store_credentials(tmp_path):
+    cache = ResponseCache(max_bytes=1 << 20, stale_seconds=0, disk_dir=str(tmp_path))
+
+    cache.fetch(("GET", URL), "newsapi", 60, lambda: _response(URL, b'{"articles": []}'))
+
+    (path,) = tmp_path.iterdir()
+    stored = path.read_bytes()
+    assert b"s3cr3t" not in stored
+    assert b"apiKey" not in stored
+    assert b"q=AAPL" in stored
+    assert os.path.basename(path).endswith(".cache")
+
+
+def test_disk_entries_are_read_back_after_restart(tmp_path):
+    key = ("GET", URL)
+    ResponseCache(1 << 20, 0, str(tmp_path)).fetch(
+        key, "newsapi", 60, lambda: _response(URL, b'{"articles": [1]}')
+    )
+
+    def unexpected_load():
+        raise AssertionError("should be served from disk")
+
+    entry = ResponseCache(1 << 20, 0, str(tmp_path)).fetch(key, "newsapi", 60, unexpected_load)
+
+    assert entry.json() == {"articles": [1]}
+    assert entry.url == "https://newsapi.org/v2/everything?q=AAPL&pageSize=10"
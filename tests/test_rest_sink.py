@@ -0,0 +1,67 @@
+"""Tests for the REST output sink's configuration and circuit breaker accounting."""
+
+import pytest
+import requests
+
+from app.output.rest_sink import RestDispatchError, RestRejectedError, RestSink
+from app.utils.circuit_breaker import CLOSED, OPEN
+
+
+class FakeSession:
+    """Session whose ``post`` raises the given error or returns the given status."""
+
+    def __init__(self, error=None, status=200):
+        self.error = error
+        self.status = status
+        self.headers = {}
+
+    def post(self, url, data=None, timeout=None):
+        if self.error is not None:
+            raise self.error
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = url
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def rest_env(monkeypatch):
+    """Configure the sink to open its circuit on the first failure."""
+    monkeypatch.setenv("REST_OUTPUT_URL", "http://collector.test/ingest")
+    monkeypatch.setenv("REST_OUTPUT_MAX_RETRIES", "0")
+    monkeypatch.setenv("CIRCUIT_FAILURE_THRESHOLD", "1")
+
+
+def _sink(session):
+    return RestSink(session=session, flush_interval=0.01)
+
+
+def test_empty_url_is_rejected(monkeypatch):
+    monkeypatch.setenv("REST_OUTPUT_URL", "")
+
+    with pytest.raises(ValueError, match="REST_OUTPUT_URL"):
+        RestSink(session=FakeSession())
+
+
+def test_rejected_status_keeps_the_circuit_closed(rest_env, make_message):
+    sink = _sink(FakeSession(status=400))
+    try:
+        with pytest.raises(RestRejectedError):
+            sink.write_batch([make_message(0)])
+        assert sink._breaker.state == CLOSED
+    finally:
+        sink.close()
+
+
+def test_request_without_response_counts_as_failure(rest_env, make_message):
+    sink = _sink(FakeSession(error=requests.exceptions.MissingSchema("no scheme")))
+    try:
+        with pytest.raises(RestDispatchError) as raised:
+            sink.write_batch([make_message(0)])
+        assert not isinstance(raised.value, RestRejectedError)
+        assert sink._breaker.state == OPEN
+    finally:
+        sink.close()
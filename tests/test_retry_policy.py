@@ -0,0 +1,169 @@
+"""Tests for full-jitter backoff and the retry budget, on a seeded RNG and a fake clock."""
+
+import asyncio
+import random
+
+import pytest
+import requests
+
+from app.utils import retry_policy
+from app.utils.retry_policy import RetryBudget, RetryPolicy
+
+SEED = 1234
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module: ``sleep`` advances ``monotonic`` instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive retry sleeps and budget windows from a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(retry_policy, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def rng(monkeypatch):
+    """Make the jitter reproducible."""
+    seeded = random.Random(SEED)
+    monkeypatch.setattr(retry_policy, "random", seeded)
+    return seeded
+
+
+def _http_error(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return requests.HTTPError(response=response)
+
+
+def _failing(errors):
+    """Return a callable raising ``errors`` in turn, then returning 'ok', and its call log."""
+    calls = []
+
+    def func():
+        calls.append(None)
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    return func, calls
+
+
+def test_backoff_stays_within_the_full_jitter_bounds(rng):
+    policy = RetryPolicy("test", base_delay=0.5, max_delay=4.0, budget=RetryBudget())
+
+    for retry, cap in enumerate([0.5, 1.0, 2.0, 4.0, 4.0, 4.0]):
+        delays = [policy.backoff(retry) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert min(delays) < 0.1 * cap
+        assert max(delays) > 0.9 * cap
+
+
+def test_backoff_is_reproducible_with_a_seed(rng):
+    policy = RetryPolicy("test", base_delay=0.5, max_delay=4.0, budget=RetryBudget())
+    expected = random.Random(SEED)
+
+    assert [policy.backoff(r) for r in range(4)] == [
+        expected.uniform(0, cap) for cap in (0.5, 1.0, 2.0, 4.0)
+    ]
+
+
+def test_retry_after_sets_a_floor_up_to_the_cap(rng):
+    policy = RetryPolicy("test", base_delay=0.5, max_delay=4.0, budget=RetryBudget())
+
+    assert policy.backoff(0, _http_error(429, "7")) == 7
+    assert policy.backoff(0, _http_error(503, "3600")) == retry_policy.MAX_RETRY_AFTER_SECONDS
+
+
+def test_call_sleeps_the_jittered_delays(clock, rng):
+    policy = RetryPolicy("test", max_attempts=4, base_delay=1.0, budget=RetryBudget())
+    func, calls = _failing([ConnectionError(), requests.Timeout(), _http_error(502)])
+    expected = random.Random(SEED)
+
+    assert policy.call(func) == "ok"
+
+    assert len(calls) == 4
+    assert clock.sleeps == [expected.uniform(0, cap) for cap in (1.0, 2.0, 4.0)]
+
+
+def test_client_errors_are_not_retried(clock, rng):
+    policy = RetryPolicy("test", budget=RetryBudget())
+    func, calls = _failing([_http_error(404)])
+
+    with pytest.raises(requests.HTTPError):
+        policy.call(func)
+
+    assert len(calls) == 1
+    assert clock.sleeps == []
+
+
+def test_attempts_run_out(clock, rng):
+    policy = RetryPolicy("test", max_attempts=3, budget=RetryBudget())
+    func, calls = _failing([ConnectionError() for _ in range(5)])
+
+    with pytest.raises(ConnectionError):
+        policy.call(func)
+
+    assert len(calls) == 3
+    assert len(clock.sleeps) == 2
+
+
+def test_budget_allows_a_share_of_requests(clock):
+    budget = RetryBudget(ratio=0.1, min_retries=2, window=10.0)
+    for _ in range(20):
+        budget.record_request()
+
+    assert [budget.try_spend() for _ in range(5)] == [True] * 4 + [False]
+
+    clock.now += 10
+    assert budget.try_spend()
+
+
+def test_policy_gives_up_once_the_budget_is_spent(clock, rng):
+    budget = RetryBudget(ratio=0.0, min_retries=2, window=10.0)
+    policy = RetryPolicy("test", max_attempts=10, budget=budget)
+    func, calls = _failing([ConnectionError() for _ in range(10)])
+
+    with pytest.raises(ConnectionError):
+        policy.call(func)
+
+    assert len(calls) == 3
+    assert len(clock.sleeps) == 2
+
+    func, calls = _failing([ConnectionError()])
+    with pytest.raises(ConnectionError):
+        policy.call(func)
+    assert len(calls) == 1
+
+
+def test_async_call_awaits_the_jittered_delays(clock, rng, monkeypatch):
+    async def fake_sleep(seconds):
+        clock.sleep(seconds)
+
+    monkeypatch.setattr(retry_policy.asyncio, "sleep", fake_sleep)
+    policy = RetryPolicy("test", max_attempts=3, base_delay=1.0, budget=RetryBudget())
+    errors = [ConnectionError(), ConnectionError()]
+
+    async def func():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    expected = random.Random(SEED)
+    assert asyncio.run(policy.call_async(func)) == "ok"
+    assert clock.sleeps == [expected.uniform(0, cap) for cap in (1.0, 2.0)]
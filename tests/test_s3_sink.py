@@ -0,0 +1,157 @@
+"""Tests for the S3 archive sink against a moto-backed bucket."""
+
+import base64
+import gzip
+import json
+import os
+
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+from app.output.s3_sink import MIN_PART_BYTES, S3Sink  # noqa: E402
+
+BUCKET = "archive"
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """Yield a moto S3 client with an empty bucket."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("S3_OUTPUT_BUCKET", BUCKET)
+    monkeypatch.setenv("S3_OUTPUT_COMPRESSION", "gzip")
+    monkeypatch.setenv("HOSTNAME", "poller-test-0")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+class FlakyClient:
+    """S3 client wrapper that records calls and fails the named ones a few times."""
+
+    def __init__(self, client, **failures):
+        self._client = client
+        self.failures = failures
+        self.calls: list[str] = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def call(*args, **kwargs):
+            self.calls.append(name)
+            if self.failures.get(name):
+                self.failures[name] -= 1
+                raise ConnectionError(f"{name} failed")
+            return method(*args, **kwargs)
+
+        return call
+
+
+def _rows(client):
+    """Return every archived message, by object key."""
+    objects = client.list_objects_v2(Bucket=BUCKET).get("Contents", [])
+    rows = {}
+    for obj in objects:
+        body = client.get_object(Bucket=BUCKET, Key=obj["Key"])["Body"].read()
+        rows[obj["Key"]] = [json.loads(line) for line in gzip.decompress(body).splitlines()]
+    return rows
+
+
+def _archive(sink, messages):
+    sink.submit(messages)
+    assert sink.flush(timeout=30)
+
+
+def test_size_roll_uploads_the_file(s3, make_message, monkeypatch):
+    monkeypatch.setenv("S3_ROLL_BYTES", "1000")
+    sink = S3Sink(client=s3, flush_interval=0.01)
+    try:
+        _archive(sink, [make_message(i) for i in range(20)])
+        rows = _rows(s3)
+    finally:
+        sink.close()
+
+    (key,) = rows
+    assert "/source=finviz/date=" in key
+    assert key.endswith(".ndjson.gz")
+    assert [row["data"]["headline"] for row in rows[key]] == [f"Headline {i}" for i in range(20)]
+
+
+def test_time_roll_uploads_on_tick(s3, make_message, monkeypatch):
+    monkeypatch.setenv("S3_ROLL_SECONDS", "0")
+    sink = S3Sink(client=s3, flush_interval=0.01)
+    try:
+        _archive(sink, [make_message(i) for i in range(5)])
+        assert _rows(s3) == {}
+        sink.on_tick()
+        rows = _rows(s3)
+    finally:
+        sink.close()
+
+    assert [len(r) for r in rows.values()] == [5]
+
+
+def test_large_file_uses_multipart_upload(s3, make_message, monkeypatch):
+    monkeypatch.setenv("S3_PART_BYTES", str(MIN_PART_BYTES))
+    monkeypatch.setenv("S3_ROLL_SECONDS", "0")
+    messages = [make_message(i) for i in range(5000)]
+    for message in messages:
+        # Incompressible, so the compressed stream crosses a part boundary.
+        message.article.summary = base64.b64encode(os.urandom(1500)).decode()
+    client = FlakyClient(s3)
+    sink = S3Sink(client=client, flush_interval=0.01, batch_size=1000)
+    try:
+        _archive(sink, messages)
+        sink.on_tick()
+        rows = _rows(s3)
+    finally:
+        sink.close()
+
+    assert client.calls.count("create_multipart_upload") == 1
+    assert client.calls.count("upload_part") >= 2
+    assert "put_object" not in client.calls
+    assert [len(r) for r in rows.values()] == [5000]
+
+
+def test_failed_roll_is_kept_and_retried(s3, make_message, monkeypatch):
+    monkeypatch.setenv("S3_ROLL_SECONDS", "0")
+    flaky = FlakyClient(s3, put_object=2)
+    sink = S3Sink(client=flaky, flush_interval=0.01)
+    try:
+        _archive(sink, [make_message(i) for i in range(3)])
+        sink.on_tick()
+        assert _rows(s3) == {}
+        _archive(sink, [make_message(i) for i in range(3, 5)])
+        sink.on_tick()
+        assert len(_rows(s3)) == 1
+        sink.on_tick()
+        rows = _rows(s3)
+    finally:
+        sink.close()
+
+    archived = sorted(row["data"]["headline"] for r in rows.values() for row in r)
+    assert archived == [f"Headline {i}" for i in range(5)]
+
+
+def test_failed_multipart_completion_is_retried(s3, make_message, monkeypatch):
+    monkeypatch.setenv("S3_PART_BYTES", str(MIN_PART_BYTES))
+    monkeypatch.setenv("S3_ROLL_SECONDS", "0")
+    messages = [make_message(i) for i in range(5000)]
+    for message in messages:
+        message.article.summary = base64.b64encode(os.urandom(1500)).decode()
+    flaky = FlakyClient(s3, upload_part=1, complete_multipart_upload=1)
+    sink = S3Sink(client=flaky, flush_interval=0.01, batch_size=1000)
+    try:
+        _archive(sink, messages)
+        sink.on_tick()
+        assert _rows(s3) == {}
+        sink.on_tick()
+        rows = _rows(s3)
+    finally:
+        sink.close()
+
+    assert [len(r) for r in rows.values()] == [5000]
@@ -0,0 +1,138 @@
+"""Round-trip tests for every message format and compression."""
+
+import pytest
+
+from app.message_queue import serializers
+from app.message_queue.serializers import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    ZSTD_ENCODING,
+    MessageSerializer,
+    decode_message,
+)
+from app.records import to_wire
+
+
+def _round_trip(serializer, message):
+    encoded = serializer.encode(message)
+    return encoded, decode_message(encoded.body, encoded.content_type, encoded.content_encoding)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(monkeypatch, make_message, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serializers, "orjson", None)
+    message = make_message(1)
+
+    encoded, decoded = _round_trip(MessageSerializer("json"), message)
+
+    assert encoded.content_type == JSON_CONTENT_TYPE
+    assert encoded.content_encoding is None
+    assert decoded == to_wire(message)
+
+
+def test_msgpack_round_trip(make_message):
+    pytest.importorskip("msgpack")
+    message = make_message(1)
+
+    encoded, decoded = _round_trip(MessageSerializer("msgpack"), message)
+
+    assert encoded.content_type == MSGPACK_CONTENT_TYPE
+    assert decoded == to_wire(message)
+
+
+@pytest.mark.parametrize("message_format", ["json", "msgpack"])
+def test_zstd_round_trip_above_threshold(make_message, message_format):
+    pytest.importorskip("zstandard")
+    if message_format == "msgpack":
+        pytest.importorskip("msgpack")
+    message = make_message(1)
+    message.article.summary = "word " * 2000
+    serializer = MessageSerializer(message_format, compression="zstd", compression_threshold=1024)
+
+    encoded, decoded = _round_trip(serializer, message)
+
+    assert encoded.content_encoding == ZSTD_ENCODING
+    assert len(encoded.body) < len(message.article.summary)
+    assert decoded == to_wire(message)
+
+
+def test_zstd_skips_small_messages(make_message):
+    pytest.importorskip("zstandard")
+    message = make_message(1)
+
+    encoded, decoded = _round_trip(MessageSerializer("json", "zstd", 4096), message)
+
+    assert encoded.content_encoding is None
+    assert decoded == to_wire(message)
+
+
+def test_dict_payloads_round_trip():
+    payload = {"symbol": "AAPL", "source": "newsapi", "data": {"headline": "Up", "summary": None}}
+
+    _, decoded = _round_trip(MessageSerializer("json"), payload)
+
+    assert decoded == payload
+
+
+def test_missing_content_type_decodes_as_json():
+    assert decode_message(b'{"a":1}', None, None) == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"message_format": "xml"}, {"message_format": "json", "compression": "lz4"}]
+)
+def test_unsupported_options_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        MessageSerializer(**kwargs)
+
+
+def test_unsupported_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        decode_message(b"{}", JSON_CONTENT_TYPE, "br")
+
+
+@pytest.mark.parametrize(
+    ("message_format", "compression", "expected_encoding"),
+    [
+        ("json", "none", None),
+        ("msgpack", "none", "base64"),
+        ("json", "zstd", "zstd,base64"),
+        ("msgpack", "zstd", "zstd,base64"),
+    ],
+)
+def test_sqs_round_trip(monkeypatch, make_message, message_format, compression, expected_encoding):
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+    if message_format == "msgpack":
+        pytest.importorskip("msgpack")
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    from app.message_queue import queue_sender
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    message = make_message(1)
+    message.article.summary = "word " * 500
+    serializer = MessageSerializer(message_format, compression, compression_threshold=1024)
+
+    with moto.mock_aws():
+        client = boto3.client("sqs", region_name="us-east-1")
+        url = client.create_queue(QueueName="sentiment")["QueueUrl"]
+        monkeypatch.setattr(queue_sender, "sqs_client", client)
+        monkeypatch.setattr(queue_sender, "_sqs_initialized", True)
+        monkeypatch.setattr(queue_sender, "SQS_QUEUE_URL", url)
+
+        assert queue_sender._send_to_sqs(serializer.encode(message)) is None
+        (received,) = client.receive_message(QueueUrl=url, MessageAttributeNames=["All"])[
+            "Messages"
+        ]
+
+    attributes = {k: v["StringValue"] for k, v in received["MessageAttributes"].items()}
+    assert attributes.get("ContentEncoding") == expected_encoding
+    decoded = decode_message(
+        received["Body"], attributes["ContentType"], attributes.get("ContentEncoding")
+    )
+    assert decoded == to_wire(message)
@@ -0,0 +1,69 @@
+"""Tests for symbol sharding and shard index discovery."""
+
+import pytest
+
+from app import config_shared
+from app.utils.sharding import ordinal_from_hostname, owned_symbols
+
+SYMBOLS = [f"SYM{i:03d}" for i in range(200)]
+
+
+@pytest.mark.parametrize(
+    "hostname, expected",
+    [
+        ("sentiment-poller-2", 2),
+        ("poller-finviz-0", 0),
+        ("poller-finviz-17", 17),
+        ("sentiment-poller-7d9f8-24567", None),
+        ("sentiment-poller-5d8b9c7f4-x2k9p", None),
+        ("poller-07", None),
+        ("localhost", None),
+        ("", None),
+    ],
+)
+def test_ordinal_from_hostname(hostname, expected):
+    assert ordinal_from_hostname(hostname) == expected
+
+
+@pytest.mark.parametrize(
+    "hostname", ["sentiment-poller-7d9f8-24567", "sentiment-poller-2", "sentiment-poller-31"]
+)
+def test_single_shard_owns_everything_for_any_hostname(monkeypatch, hostname):
+    monkeypatch.setenv("HOSTNAME", hostname)
+    monkeypatch.delenv("SHARD_INDEX", raising=False)
+    monkeypatch.delenv("SHARD_COUNT", raising=False)
+
+    assert config_shared.get_shard_index() == 0
+    assert owned_symbols(SYMBOLS, config_shared.get_shard_index(), 1) == SYMBOLS
+
+
+def test_single_shard_ignores_explicit_index():
+    assert owned_symbols(SYMBOLS, 5, 1) == SYMBOLS
+
+
+def test_statefulset_hostname_selects_shard(monkeypatch):
+    monkeypatch.setenv("HOSTNAME", "sentiment-poller-2")
+    monkeypatch.setenv("SHARD_COUNT", "3")
+    monkeypatch.delenv("SHARD_INDEX", raising=False)
+
+    assert config_shared.get_shard_index() == 2
+
+
+def test_deployment_hostname_falls_back_to_shard_zero(monkeypatch):
+    monkeypatch.setenv("HOSTNAME", "sentiment-poller-7d9f8-24567")
+    monkeypatch.setenv("SHARD_COUNT", "3")
+    monkeypatch.delenv("SHARD_INDEX", raising=False)
+
+    assert config_shared.get_shard_index() == 0
+
+
+def test_shards_partition_the_universe():
+    shards = [owned_symbols(SYMBOLS, index, 4) for index in range(4)]
+
+    assert sorted(s for shard in shards for s in shard) == sorted(SYMBOLS)
+    assert all(shards)
+
+
+def test_out_of_range_index_is_rejected_when_sharded():
+    with pytest.raises(ValueError):
+        owned_symbols(SYMBOLS, 4, 4)
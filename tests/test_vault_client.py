@@ -0,0 +1,102 @@
+"""Tests for the in-memory Vault config snapshot against a fake hvac client."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+import tenacity
+
+from app import config_shared
+from app.utils import vault_client
+from app.utils.vault_client import VaultClient, VaultConfigSnapshot
+
+
+class FakeHvac:
+    """hvac.Client stand-in serving one KV v2 secret."""
+
+    def __init__(self, data):
+        self.data = dict(data)
+        self.reads: list[str] = []
+        self.fail = False
+        self.secrets = SimpleNamespace(kv=SimpleNamespace(v2=self))
+        self.auth = SimpleNamespace(token=SimpleNamespace(renew_self=lambda: None))
+
+    def read_secret_version(self, path):
+        self.reads.append(path)
+        if self.fail:
+            raise ConnectionError("vault unreachable")
+        return {"data": {"data": dict(self.data)}}
+
+
+@pytest.fixture
+def hvac_server(monkeypatch):
+    """Return a fake Vault holding this poller's secret; retries do not wait."""
+    monkeypatch.setattr(vault_client, "POLLER_NAME", "finviz-poller")
+    monkeypatch.setattr(vault_client, "ENVIRONMENT", "test")
+    monkeypatch.setattr(VaultClient.read_all.retry, "wait", tenacity.wait_none())
+    return FakeHvac({"POLLING_INTERVAL": "15", "NEWSAPI_KEY": "secret"})
+
+
+def _snapshot(server, refresh_seconds=0.0):
+    return VaultConfigSnapshot(lambda: VaultClient(client=server), refresh_seconds)
+
+
+def test_initial_load_reads_the_secret_once(hvac_server):
+    snapshot = _snapshot(hvac_server)
+
+    assert snapshot.get("NEWSAPI_KEY") == "secret"
+    assert snapshot.get("POLLING_INTERVAL") == "15"
+    assert snapshot.get("MISSING") is None
+    assert hvac_server.reads == ["finviz-poller/test"]
+
+
+def test_background_refresh_picks_up_changes(hvac_server):
+    snapshot = _snapshot(hvac_server, refresh_seconds=0.01)
+    changes = []
+    snapshot.subscribe(lambda: changes.append(True))
+    try:
+        assert snapshot.get("NEWSAPI_KEY") == "secret"
+        hvac_server.data["NEWSAPI_KEY"] = "rotated"
+
+        deadline = time.monotonic() + 5
+        while snapshot.get("NEWSAPI_KEY") != "rotated" and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        snapshot.stop()
+
+    assert snapshot.get("NEWSAPI_KEY") == "rotated"
+    assert changes
+
+
+def test_failed_refresh_keeps_the_last_snapshot(hvac_server):
+    snapshot = _snapshot(hvac_server)
+    changes = []
+    snapshot.subscribe(lambda: changes.append(True))
+    assert snapshot.get("NEWSAPI_KEY") == "secret"
+
+    hvac_server.fail = True
+    hvac_server.data["NEWSAPI_KEY"] = "rotated"
+
+    assert snapshot.refresh() is False
+    assert snapshot.get("NEWSAPI_KEY") == "secret"
+    assert changes == []
+
+    hvac_server.fail = False
+    assert snapshot.refresh() is True
+    assert snapshot.get("NEWSAPI_KEY") == "rotated"
+
+
+def test_refresh_clears_cached_config_getters(hvac_server, monkeypatch):
+    snapshot = vault_client.get_vault_snapshot()
+    monkeypatch.setattr(snapshot, "_client_factory", lambda: VaultClient(client=hvac_server))
+    monkeypatch.setattr(snapshot, "_client", None)
+    monkeypatch.setattr(snapshot, "_data", {})
+    monkeypatch.setattr(snapshot, "_loaded", True)
+
+    assert snapshot.refresh()
+    assert config_shared.get_polling_interval() == 15
+
+    hvac_server.data["POLLING_INTERVAL"] = "30"
+    assert snapshot.refresh()
+
+    assert config_shared.get_polling_interval() == 30